@@ -0,0 +1,76 @@
+"""
+Large-file benchmark for docstring injection.
+
+Builds a module with many undocumented functions, injects docstrings
+with the single-pass splice and with the previous insert-per-line
+approach, checks that both outputs are identical and prints timings.
+
+Usage:
+    python benchmarks/bench_inject.py [function_count ...]
+"""
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from docgen.analyzer.parser import analyze
+from docgen.injector.docstring_injector import inject_docstrings, splice_lines
+
+
+def make_module(function_count):
+    """Return source with function_count undocumented functions."""
+    parts = []
+    for i in range(function_count):
+        parts.append(f"def func_{i}(a, b):\n    return a + b\n")
+    return "\n\n".join(parts)
+
+
+def legacy_splice(lines, inserts):
+    """Apply inserts the old way, shifting the list for every line."""
+    lines = list(lines)
+    for lineno, doc_lines in sorted(inserts, reverse=True):
+        for line in reversed(doc_lines):
+            lines.insert(lineno, line)
+    return lines
+
+
+def run(function_count):
+    """Time both strategies on one synthetic module."""
+    source = make_module(function_count)
+    analysis = analyze(source)
+
+    start = time.perf_counter()
+    updated = inject_docstrings(analysis)
+    inject_time = time.perf_counter() - start
+
+    inserts = [(node.lineno, ["    '''doc'''"]) for node in analysis.undocumented]
+
+    start = time.perf_counter()
+    fast = splice_lines(analysis.lines, inserts)
+    fast_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    slow = legacy_splice(analysis.lines, inserts)
+    slow_time = time.perf_counter() - start
+
+    assert fast == slow, "splice output differs from the legacy injector"
+
+    print(
+        f"{function_count:>7} functions  {len(source.splitlines()):>8} lines  "
+        f"inject {inject_time * 1000:8.1f} ms  "
+        f"splice {fast_time * 1000:8.1f} ms  "
+        f"legacy {slow_time * 1000:8.1f} ms  "
+        f"({len(updated)} bytes out)"
+    )
+
+
+def main():
+    """Run the benchmark for each requested size."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 40_000]
+    for size in sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
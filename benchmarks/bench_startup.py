@@ -0,0 +1,93 @@
+"""
+Cold-start benchmark for the docgen command line.
+
+Measures how long a fresh interpreter takes to import the CLI and core
+modules, minus the cost of starting a bare interpreter, and fails when
+the median exceeds the import-time budget. Also fails if any heavy
+optional dependency is imported along the way.
+
+Usage:
+    python benchmarks/bench_startup.py [--budget-ms 50] [--runs 15]
+"""
+import argparse
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+
+SRC = pathlib.Path(__file__).resolve().parents[1] / "src"
+
+CORE_IMPORTS = (
+    "import docgen.cli, docgen.check_docs, "
+    "docgen.analyzer.parser, docgen.reports.coverage"
+)
+HEAVY_MODULES = (
+    "pydocstyle", "streamlit", "plotly", "reportlab",
+    "concurrent.futures", "json", "subprocess",
+)
+DEFAULT_BUDGET_MS = 50.0
+
+
+def _env():
+    """Return an environment that imports docgen from this checkout."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    return env
+
+
+def _time_run(code, env):
+    """Return the wall time of one interpreter running code."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+    return time.perf_counter() - start
+
+
+def heavy_imports(env=None):
+    """Return the heavy modules loaded by importing the core."""
+    code = (
+        f"import sys; {CORE_IMPORTS}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env or _env(),
+        check=True, capture_output=True, text=True,
+    ).stdout.strip()
+    return [name for name in output.split(",") if name]
+
+
+def measure(runs):
+    """Return the median import overhead in milliseconds."""
+    env = _env()
+    _time_run(CORE_IMPORTS, env)  # warm the bytecode cache
+
+    bare = [_time_run("pass", env) for _ in range(runs)]
+    core = [_time_run(CORE_IMPORTS, env) for _ in range(runs)]
+    return (statistics.median(core) - statistics.median(bare)) * 1000
+
+
+def main(argv=None):
+    """Run the benchmark and enforce the budget."""
+    parser = argparse.ArgumentParser(description="docgen cold-start benchmark")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    heavy = heavy_imports()
+    overhead = measure(args.runs)
+    print(f"core import overhead: {overhead:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    failed = False
+    if heavy:
+        print(f"heavy modules imported at startup: {', '.join(heavy)}")
+        failed = True
+    if overhead > args.budget_ms:
+        print("import-time budget exceeded")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Deterministic synthetic corpus for the benchmark suite.
+
+The same seed and scale always produce the same files, so timings from
+different runs and machines are measured on identical input.
+"""
+import random
+
+DOCUMENTED_RATIOS = (0.0, 0.5, 0.9, 1.0)
+
+
+def _function(rng, name, indent, documented):
+    """Return the lines of one function definition."""
+    params = [f"arg{i}" for i in range(rng.randint(0, 4))]
+    pad = " " * indent
+    lines = [f"{pad}def {name}({', '.join(params)}):"]
+    if documented:
+        lines.append(f'{pad}    """Compute {name}."""')
+    lines.append(f"{pad}    value = {rng.randint(0, 1000)}")
+    for param in params:
+        lines.append(f"{pad}    value += len(str({param}))")
+    lines.append(f"{pad}    return value")
+    lines.append("")
+    return lines
+
+
+def _class(rng, name, indent, depth, ratio):
+    """Return the lines of a class nested depth levels deep."""
+    pad = " " * indent
+    lines = [f"{pad}class {name}:"]
+    if rng.random() < ratio:
+        lines.append(f'{pad}    """Model {name}."""')
+    lines.append("")
+    for i in range(rng.randint(1, 3)):
+        lines.extend(_function(rng, f"method_{i}", indent + 4, rng.random() < ratio))
+    if depth > 0:
+        lines.extend(_class(rng, f"{name}Inner", indent + 4, depth - 1, ratio))
+    return lines
+
+
+def make_module(rng, definitions, ratio, nesting=0):
+    """Return the source of one module with roughly `definitions` items."""
+    lines = ['"""Generated module."""', "", "CONSTANT = 1", ""]
+    for i in range(definitions):
+        if nesting and i % 10 == 0:
+            lines.extend(_class(rng, f"Node{i}", 0, nesting, ratio))
+        else:
+            lines.extend(_function(rng, f"func_{i}", 0, rng.random() < ratio))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def generate_corpus(seed=0, scale=1.0):
+    """
+    Return a list of (name, source) pairs.
+
+    The corpus mixes many small modules, a few huge ones, modules with
+    deeply nested classes and constant-only modules, each at several
+    documented ratios.
+    """
+    rng = random.Random(seed)
+    corpus = []
+
+    for i in range(int(200 * scale)):
+        ratio = DOCUMENTED_RATIOS[i % len(DOCUMENTED_RATIOS)]
+        corpus.append((f"small/mod_{i}.py", make_module(rng, rng.randint(3, 20), ratio)))
+
+    for i in range(max(1, int(2 * scale))):
+        ratio = DOCUMENTED_RATIOS[i % len(DOCUMENTED_RATIOS)]
+        corpus.append((f"huge/mod_{i}.py", make_module(rng, 5000, ratio)))
+
+    for i in range(int(20 * scale)):
+        ratio = DOCUMENTED_RATIOS[i % len(DOCUMENTED_RATIOS)]
+        corpus.append((f"nested/mod_{i}.py", make_module(rng, 40, ratio, nesting=8)))
+
+    for i in range(int(40 * scale)):
+        corpus.append((f"data/consts_{i}.py", "\n".join(
+            f"VALUE_{j} = {rng.randint(0, 10**6)}" for j in range(50)
+        )))
+
+    return corpus
+
+
+def write_corpus(root, corpus):
+    """Write (name, source) pairs below root and return the paths."""
+    paths = []
+    for name, source in corpus:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+        paths.append(path)
+    return paths
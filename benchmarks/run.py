@@ -0,0 +1,195 @@
+"""
+Benchmark suite for the docgen pipeline stages.
+
+Times parse_code, count_items, inject_docstrings, generate_docstring and
+validate_docstrings separately over a deterministic synthetic corpus and
+reports throughput in files/s and lines/s.
+
+Usage:
+    python benchmarks/run.py                     # run and compare
+    python benchmarks/run.py --save-baseline     # record a new baseline
+    python benchmarks/run.py --stage parse_code --scale 0.5
+
+When a baseline file exists, the run fails (exit code 1) if any stage's
+lines/s drops by more than --threshold compared to it.
+"""
+import argparse
+import json
+import pathlib
+import sys
+import time
+
+HERE = pathlib.Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent / "src"))
+sys.path.insert(0, str(HERE))
+
+from corpus import generate_corpus
+
+from docgen.analyzer.parser import parse_code
+from docgen.check_docs import count_items
+from docgen.generator.styled_generator import generate_docstring
+from docgen.injector.docstring_injector import inject_docstrings
+
+DEFAULT_BASELINE = HERE / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+
+
+def _stage_parse(corpus):
+    """Run parse_code over every source."""
+    for _, source in corpus:
+        parse_code(source)
+
+
+def _stage_count(corpus):
+    """Run count_items over every source."""
+    for name, source in corpus:
+        count_items(source, name)
+
+
+def _stage_inject(corpus):
+    """Run inject_docstrings over every source."""
+    for _, source in corpus:
+        inject_docstrings(source)
+
+
+def _stage_generate(corpus):
+    """Generate a docstring for every parsed function and method."""
+    parsed = [parse_code(source) for _, source in corpus]
+
+    def run():
+        """Generate docstrings for the pre-parsed symbols."""
+        for functions, classes in parsed:
+            for func in functions:
+                generate_docstring(func)
+            for cls in classes:
+                for method in cls["methods"]:
+                    generate_docstring(method)
+
+    return run
+
+
+def _stage_validate(corpus):
+    """Run validate_docstrings over every source."""
+    from docgen.reports.validation import validate_docstrings
+
+    for name, source in corpus:
+        validate_docstrings(source, filename=name)
+
+
+STAGES = {
+    "parse_code": _stage_parse,
+    "count_items": _stage_count,
+    "inject_docstrings": _stage_inject,
+    "generate_docstring": _stage_generate,
+    "validate_docstrings": _stage_validate,
+}
+
+# Stages that need setup return the timed callable instead of running.
+PREPARED_STAGES = {"generate_docstring"}
+
+
+def time_stage(name, corpus, repeat):
+    """Return the best wall time of repeat runs of one stage."""
+    stage = STAGES[name]
+    run = stage(corpus) if name in PREPARED_STAGES else (lambda: stage(corpus))
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(stages, seed, scale, repeat):
+    """Time each stage and return its throughput figures."""
+    corpus = generate_corpus(seed=seed, scale=scale)
+    file_count = len(corpus)
+    line_count = sum(source.count("\n") + 1 for _, source in corpus)
+
+    results = {}
+    for name in stages:
+        seconds = time_stage(name, corpus, repeat)
+        results[name] = {
+            "seconds": round(seconds, 6),
+            "files_per_s": round(file_count / seconds, 1),
+            "lines_per_s": round(line_count / seconds, 1),
+        }
+        print(
+            f"{name:<20} {seconds:9.3f} s  "
+            f"{results[name]['files_per_s']:>12,.1f} files/s  "
+            f"{results[name]['lines_per_s']:>14,.1f} lines/s"
+        )
+
+    print(f"\ncorpus: {file_count} files, {line_count} lines (seed={seed}, scale={scale})")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return the stages whose lines/s regressed past threshold."""
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get("stages", {}).get(name)
+        if reference is None:
+            continue
+
+        floor = reference["lines_per_s"] * (1 - threshold)
+        if current["lines_per_s"] < floor:
+            regressions.append(
+                f"{name}: {current['lines_per_s']:,.1f} lines/s "
+                f"< {floor:,.1f} (baseline {reference['lines_per_s']:,.1f})"
+            )
+    return regressions
+
+
+def build_parser():
+    """Build the argument parser for the benchmark runner."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stage", action="append", choices=sorted(STAGES),
+                        help="Stage to run (repeatable, default: all).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Corpus size multiplier (default: 1.0).")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per stage; the best time is kept.")
+    parser.add_argument("--baseline", type=pathlib.Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed fractional slowdown (default: 0.25).")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write the results as the new baseline.")
+    return parser
+
+
+def main(argv=None):
+    """Run the suite, then save or compare against the baseline."""
+    args = build_parser().parse_args(argv)
+    stages = args.stage or list(STAGES)
+    results = run_benchmarks(stages, args.seed, args.scale, args.repeat)
+
+    if args.save_baseline:
+        data = {"seed": args.seed, "scale": args.scale, "stages": results}
+        args.baseline.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print("No baseline found; run with --save-baseline to record one.")
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if (baseline.get("seed"), baseline.get("scale")) != (args.seed, args.scale):
+        print("Baseline was recorded with a different corpus; skipping comparison.")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("\nPerformance regressions:")
+        for line in regressions:
+            print(f" - {line}")
+        sys.exit(1)
+
+    print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
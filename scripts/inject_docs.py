@@ -1,9 +1,19 @@
+import argparse
 import ast
 import os
 import pathlib
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from docgen.discovery import WalkStats, scan_patterns, walk_files
 
 
 SRC_DIR = "src"
+SLOWEST_SHOWN = 5
 
 
 def has_docstring(node):
@@ -24,6 +34,19 @@ def generate_google_docstring(name, params):
     return '\n'.join(lines)
 
 
+def splice_lines(lines, inserts):
+    output = []
+    previous = 0
+
+    for position, new_line in sorted(inserts):
+        output.extend(lines[previous:position])
+        output.append(new_line)
+        previous = max(previous, position)
+
+    output.extend(lines[previous:])
+    return output
+
+
 def inject_docstrings(source):
     tree = ast.parse(source)
     lines = source.splitlines()
@@ -42,20 +65,114 @@ def inject_docstrings(source):
 
             inserts.append((node.body[0].lineno - 1, doc_block))
 
-    for lineno, doc in sorted(inserts, reverse=True):
-        lines.insert(lineno, doc)
-
-    return "\n".join(lines)
-
-
-def main():
-    for file in pathlib.Path(SRC_DIR).rglob("*.py"):
-        source = file.read_text(encoding="utf-8")
+    return "\n".join(splice_lines(lines, inserts))
+
+
+def atomic_write_text(path, text):
+    # Write to a temp file in the same directory, then rename over the
+    # original so an interrupted run never leaves a half-written file.
+    path = pathlib.Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp_path, path.stat().st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def process_file(path):
+    # Returns (path, changed, seconds, error) and is safe to run in a
+    # worker process.
+    start = time.perf_counter()
+    try:
+        source = pathlib.Path(path).read_text(encoding="utf-8")
         updated = inject_docstrings(source)
-
-        if source != updated:
-            file.write_text(updated, encoding="utf-8")
-            print(f"Injected docstrings in {file}")
+        # inject_docstrings joins lines and drops the final newline; keep
+        # it so files with nothing to inject compare equal.
+        if source.endswith("\n") and not updated.endswith("\n"):
+            updated += "\n"
+        changed = source != updated
+        if changed:
+            atomic_write_text(path, updated)
+    except (OSError, UnicodeDecodeError, SyntaxError) as exc:
+        return path, False, time.perf_counter() - start, f"{type(exc).__name__}: {exc}"
+
+    return path, changed, time.perf_counter() - start, None
+
+
+def run(files, workers=1, chunksize=None):
+    if workers <= 1 or len(files) <= 1:
+        yield from map(process_file, files)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(files) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(process_file, files, chunksize=chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inject missing docstrings in bulk.")
+    parser.add_argument("root", nargs="?", default=SRC_DIR,
+                        help="Directory to process (default: src).")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="Worker processes (0 uses every CPU, default: 1).")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="Files per work unit sent to a worker.")
+    parser.add_argument("--timings", action="store_true",
+                        help="Print the time spent on every file.")
+    parser.add_argument("--include", metavar="PATTERN", action="append", default=None,
+                        help="Only process files matching this gitignore-style pattern.")
+    parser.add_argument("--exclude", metavar="PATTERN", action="append", default=[],
+                        help="Skip files and directories matching this pattern.")
+    parser.add_argument("--no-default-excludes", action="store_true",
+                        help="Also walk VCS, tool cache and virtualenv directories.")
+    args = parser.parse_args(argv)
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    include, exclude = scan_patterns(
+        args.root, args.include, args.exclude, not args.no_default_excludes
+    )
+    walk_stats = WalkStats()
+    files = [str(file) for file in walk_files(args.root, include, exclude, walk_stats)]
+
+    start = time.perf_counter()
+    updated = 0
+    failed = 0
+    timings = []
+
+    for path, changed, seconds, error in run(files, workers, args.chunksize):
+        timings.append((seconds, path))
+
+        if error is not None:
+            failed += 1
+            print(f"Skipped {path}: {error}")
+        elif changed:
+            updated += 1
+            print(f"Injected docstrings in {path} ({seconds * 1000:.1f} ms)")
+        elif args.timings:
+            print(f"Unchanged {path} ({seconds * 1000:.1f} ms)")
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"\n{len(files)} files, {updated} updated, "
+        f"{len(files) - updated - failed} unchanged, {failed} failed "
+        f"in {elapsed:.2f}s"
+    )
+    if walk_stats.summary():
+        print(walk_stats.summary())
+
+    if timings:
+        print("Slowest files:")
+        for seconds, path in sorted(timings, reverse=True)[:SLOWEST_SHOWN]:
+            print(f" - {path}: {seconds * 1000:.1f} ms")
+
+    if failed:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
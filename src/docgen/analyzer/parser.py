@@ -1,41 +1,206 @@
 import ast
+from collections.abc import Mapping
 
+from docgen import profiling
 
-def parse_code(source_code: str):
+DEFINITION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+class _SymbolRecord(Mapping):
+    """
+    Compact, slotted record for one symbol returned by parse_code.
+
+    Records are read-only mappings over their fields, so code written
+    for the dicts parse_code used to return (``func["name"]``,
+    ``dict(func)``, ``func.get("lineno")``) keeps working, while new
+    code can use plain attribute access.
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    def __getitem__(self, key):
+        """Return a field by name, like a dict lookup."""
+        if key in self._fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        """Iterate over field names in their dict order."""
+        return iter(self._fields)
+
+    def __len__(self):
+        """Return the number of fields."""
+        return len(self._fields)
+
+    def __repr__(self):
+        """Show the record like the dict it stands in for."""
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> dict:
+        """Return a plain, JSON-serializable dict copy of the record."""
+        return {key: getattr(self, key) for key in self._fields}
+
+
+class FunctionRecord(_SymbolRecord):
+    """A module-level function (type "function") or a method ("method")."""
+
+    __slots__ = ("name", "params", "has_docstring", "type", "lineno")
+    _fields = __slots__
+
+    def __init__(self, name, params, has_docstring, type="function", lineno=None):
+        """Store the symbol fields; params is kept as a tuple."""
+        self.name = name
+        self.params = tuple(params)
+        self.has_docstring = has_docstring
+        self.type = type
+        self.lineno = lineno
+
+    def __getitem__(self, key):
+        """
+        Return a field by name, like a dict lookup.
+
+        params comes back as a list, as in the dicts parse_code used to
+        return, so records still compare equal to those dicts.
+        """
+        if key == "params":
+            return list(self.params)
+        return super().__getitem__(key)
+
+    def to_dict(self) -> dict:
+        """Return a plain dict copy, with params as a list."""
+        data = super().to_dict()
+        data["params"] = list(self.params)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a dict produced by to_dict."""
+        return cls(**data)
+
+
+class ClassRecord(_SymbolRecord):
+    """A module-level class and its methods."""
+
+    __slots__ = ("name", "has_docstring", "methods", "type", "lineno")
+    _fields = __slots__
+
+    def __init__(self, name, has_docstring, methods=None, type="class", lineno=None):
+        """Store the class fields; methods is a list of FunctionRecord."""
+        self.name = name
+        self.has_docstring = has_docstring
+        self.methods = methods if methods is not None else []
+        self.type = type
+        self.lineno = lineno
+
+    def to_dict(self) -> dict:
+        """Return a plain dict copy, including method dicts."""
+        data = super().to_dict()
+        data["methods"] = [method.to_dict() for method in self.methods]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a dict produced by to_dict."""
+        data = dict(data)
+        data["methods"] = [FunctionRecord.from_dict(m) for m in data.get("methods", [])]
+        return cls(**data)
+
+
+class SourceAnalysis:
+    """
+    A source file parsed once and shared between pipeline stages.
+
+    The parser, injector, coverage and validation reports all accept an
+    instance in place of a source string, so a file is only run through
+    ast.parse a single time however many stages look at it.
+    """
+
+    def __init__(self, source_code: str, tree=None):
+        """Parse source_code unless an already built tree is given."""
+        self.source = source_code
+        if tree is None:
+            with profiling.stage("parse", len(source_code)):
+                tree = ast.parse(source_code)
+        self.tree = tree
+        self.injected_lines = []
+        self._lines = None
+        self._definitions = None
+
+    @property
+    def lines(self):
+        """Source split into lines, computed on first use."""
+        if self._lines is None:
+            self._lines = self.source.splitlines()
+        return self._lines
+
+    @property
+    def definitions(self):
+        """Every function, method and class node in ast.walk order."""
+        if self._definitions is None:
+            self._definitions = [
+                node for node in ast.walk(self.tree)
+                if isinstance(node, DEFINITION_TYPES)
+            ]
+        return self._definitions
+
+    @property
+    def undocumented(self):
+        """Definitions without a non-empty docstring."""
+        return [node for node in self.definitions if not ast.get_docstring(node)]
+
+
+def analyze(source_code) -> SourceAnalysis:
+    """
+    Return a SourceAnalysis for source_code, reusing it if it already is one.
+    """
+    if isinstance(source_code, SourceAnalysis):
+        return source_code
+    return SourceAnalysis(source_code)
+
+
+def parse_code(source_code):
     """
     Parses Python source code and extracts functions and classes
     along with docstring presence metadata.
+
+    Accepts either a source string or a SourceAnalysis. Symbols are
+    returned as FunctionRecord and ClassRecord objects, which also
+    behave as read-only dicts.
     """
-    tree = ast.parse(source_code)
+    tree = analyze(source_code).tree
     functions = []
     classes = []
 
     for node in tree.body:
         if isinstance(node, ast.FunctionDef):
-            functions.append({
-                "name": node.name,
-                "params": [arg.arg for arg in node.args.args],
-                "has_docstring": ast.get_docstring(node) is not None,
-                "type": "function"
-            })
+            functions.append(FunctionRecord(
+                node.name,
+                tuple(arg.arg for arg in node.args.args),
+                ast.get_docstring(node) is not None,
+                "function",
+                node.lineno
+            ))
 
         elif isinstance(node, ast.ClassDef):
-            class_info = {
-                "name": node.name,
-                "has_docstring": ast.get_docstring(node) is not None,
-                "methods": [],
-                "type": "class"
-            }
+            class_info = ClassRecord(
+                node.name,
+                ast.get_docstring(node) is not None,
+                [],
+                "class",
+                node.lineno
+            )
 
             for item in node.body:
                 if isinstance(item, ast.FunctionDef):
-                    class_info["methods"].append({
-                        "name": item.name,
-                        "params": [arg.arg for arg in item.args.args],
-                        "has_docstring": ast.get_docstring(item) is not None,
-                        "type": "method"
-                    })
+                    class_info.methods.append(FunctionRecord(
+                        item.name,
+                        tuple(arg.arg for arg in item.args.args),
+                        ast.get_docstring(item) is not None,
+                        "method",
+                        item.lineno
+                    ))
 
             classes.append(class_info)
 
-    return functions, classes
\ No newline at end of file
+    return functions, classes
@@ -0,0 +1,161 @@
+import re
+
+DEFINITION_WORD = re.compile(r"\b(?:def|class)\b")
+HEADER = re.compile(
+    r"^([ \t]*)(async[ \t]+)?(?:def|class)[ \t]+[A-Za-z_]\w*\b.*:[ \t]*(?:#.*)?$"
+)
+DOCSTRING_START = re.compile(r"""^([ \t]*)[rRuU]?(\"\"\"|''')""")
+TRIPLE_QUOTES = re.compile(r"""\"\"\"|'''""")
+LINE_CONTINUATION = re.compile(r"\\(?:\r\n|\r|\n)")
+
+
+def _indent_width(indent):
+    """Return the width of an indentation prefix."""
+    return len(indent.expandtabs(8))
+
+
+def _closes_header(line):
+    """
+    Return True if the colon that ends a def/class header ends the line.
+
+    The header's colon is the first one outside brackets and strings;
+    only a comment may follow it. Anything unusual (unbalanced brackets,
+    triple quotes, a string left open) returns False.
+    """
+    depth = 0
+    index = 0
+    while index < len(line):
+        char = line[index]
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+            if depth < 0:
+                return False
+        elif char in "'\"":
+            if line.startswith(char * 3, index):
+                return False
+            end = index + 1
+            while end < len(line) and line[end] != char:
+                end += 2 if line[end] == "\\" else 1
+            if end >= len(line):
+                return False
+            index = end
+        elif char == "#":
+            return False
+        elif char == ":" and depth == 0:
+            rest = line[index + 1:].strip()
+            return not rest or rest.startswith("#")
+        index += 1
+    return False
+
+
+def _skip_blank(lines, index):
+    """Return the index of the next line that is not blank or a comment."""
+    while index < len(lines):
+        stripped = lines[index].strip()
+        if stripped and not stripped.startswith("#"):
+            return index
+        index += 1
+    return index
+
+
+def _read_docstring(lines, index):
+    """
+    Read a docstring that starts on lines[index].
+
+    Returns:
+        The index of its closing line, or None unless it is a plain,
+        non-empty triple-quoted string that makes up the whole statement.
+    """
+    match = DOCSTRING_START.match(lines[index])
+    if match is None:
+        return None
+
+    quote = match.group(2)
+    text = lines[index][match.end():]
+    closing = index
+
+    while quote not in text:
+        closing += 1
+        if closing == len(lines):
+            return None
+        text += "\n" + lines[closing]
+
+    content, _, rest = text.partition(quote)
+    if "\\" in content or not content.strip():
+        return None
+    if rest.strip() and not rest.strip().startswith("#"):
+        return None
+    return closing
+
+
+def quick_count(source):
+    """
+    Count definitions without building an AST, when that is certain.
+
+    Recognizes two kinds of files by scanning their text:
+
+    * files in which ``def`` and ``class`` never appear as words, which
+      cannot contain any definitions;
+    * files in which every ``def``/``class`` is a one-line header whose
+      body opens with a non-empty docstring, and whose only triple-quoted
+      strings are those docstrings and the module docstring.
+
+    Returns:
+        tuple: (total, documented) as count_items would report them
+        (async functions are not counted), or None when the file must
+        be parsed. Syntax errors are not detected.
+    """
+    if not DEFINITION_WORD.search(source):
+        return 0, 0
+
+    if LINE_CONTINUATION.search(source):
+        return None
+
+    lines = source.splitlines()
+    consumed_quotes = 0
+    total = 0
+
+    index = 0
+    first = _skip_blank(lines, 0)
+    if first < len(lines) and DOCSTRING_START.match(lines[first]):
+        closing = _read_docstring(lines, first)
+        if closing is None:
+            return None
+        consumed_quotes += len(TRIPLE_QUOTES.findall("\n".join(lines[first:closing + 1])))
+        index = closing + 1
+
+    while index < len(lines):
+        line = lines[index]
+        if not DEFINITION_WORD.search(line):
+            index += 1
+            continue
+
+        header = HEADER.match(line)
+        if header is None or not _closes_header(line):
+            return None
+
+        body = _skip_blank(lines, index + 1)
+        if body == len(lines):
+            return None
+
+        start = DOCSTRING_START.match(lines[body])
+        if start is None:
+            return None
+        if _indent_width(start.group(1)) <= _indent_width(header.group(1)):
+            return None
+
+        closing = _read_docstring(lines, body)
+        if closing is None:
+            return None
+
+        consumed_quotes += len(TRIPLE_QUOTES.findall("\n".join(lines[body:closing + 1])))
+        if header.group(2) is None:
+            total += 1
+        index = closing + 1
+
+    if consumed_quotes != len(TRIPLE_QUOTES.findall(source)):
+        return None
+
+    return total, total
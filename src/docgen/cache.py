@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from docgen import __version__
+
+DEFAULT_CACHE_DIR = ".docgen_cache"
+DEFAULT_MAX_ENTRIES = 200_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CACHE_FILE = "analysis.json"
+CACHE_FORMAT = 1
+
+
+def content_digest(data: bytes) -> str:
+    """
+    Return the content hash used to key cache entries.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class AnalysisCache:
+    """
+    On-disk cache of per-file analysis results.
+
+    Entries are keyed by the content hash of the source file, so a
+    renamed or touched file with unchanged content is still a hit. Each
+    known path also remembers its last mtime and size: when those match,
+    the stored digest is trusted and the file is not read at all.
+
+    The whole cache is dropped when it was written by another version of
+    the tool. Least recently used entries are evicted once the entry
+    count or the serialized size exceeds its limit.
+    """
+
+    def __init__(
+        self,
+        cache_dir=DEFAULT_CACHE_DIR,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        max_bytes=DEFAULT_MAX_BYTES,
+    ):
+        """Open the cache stored in cache_dir, creating it lazily."""
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._files = {}
+        self._entries = {}
+        self._pending = {}
+        self._clock = 0
+        self._dirty = False
+        self._load()
+
+    @property
+    def path(self) -> Path:
+        """Location of the cache file."""
+        return self.cache_dir / CACHE_FILE
+
+    def _load(self):
+        """Read the cache file, ignoring it if it is missing or stale."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("format") != CACHE_FORMAT or data.get("version") != __version__:
+            self._dirty = True
+            return
+
+        self._files = data.get("files", {})
+        self._entries = data.get("entries", {})
+        self._clock = data.get("clock", 0)
+
+    def _digest_for(self, path):
+        """
+        Return the content digest of path, reading it only when its
+        mtime or size changed since it was last seen.
+        """
+        key = str(path)
+        stat = os.stat(path)
+        signature = [stat.st_mtime_ns, stat.st_size]
+
+        known = self._files.get(key)
+        if known is not None and known[:2] == signature:
+            return known[2]
+
+        with open(path, "rb") as f:
+            digest = content_digest(f.read())
+
+        self._pending[key] = signature + [digest]
+        return digest
+
+    def lookup(self, path, kind):
+        """
+        Return the cached result of kind for path, or None on a miss.
+        """
+        digest = self._digest_for(path)
+        entry = self._entries.get(f"{kind}:{digest}")
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        pending = self._pending.pop(str(path), None)
+        if pending is not None:
+            self._files[str(path)] = pending
+            self._dirty = True
+
+        self._clock += 1
+        entry["used"] = self._clock
+        self.hits += 1
+        return entry["value"]
+
+    def store(self, path, kind, value):
+        """
+        Record a JSON-serializable result of kind for path.
+        """
+        key = str(path)
+        record = self._pending.pop(key, None)
+        if record is None:
+            self._digest_for(path)
+            record = self._pending.pop(key, None) or self._files[key]
+
+        self._files[key] = record
+        self._clock += 1
+        self._entries[f"{kind}:{record[2]}"] = {
+            "value": value,
+            "size": len(json.dumps(value)),
+            "used": self._clock,
+        }
+        self._dirty = True
+
+    def _evict(self):
+        """Drop least recently used entries until both limits hold."""
+        total = sum(entry["size"] for entry in self._entries.values())
+        if len(self._entries) <= self.max_entries and total <= self.max_bytes:
+            return
+
+        ordered = sorted(self._entries.items(), key=lambda item: item[1]["used"])
+        for key, entry in ordered:
+            if len(self._entries) <= self.max_entries and total <= self.max_bytes:
+                break
+            del self._entries[key]
+            total -= entry["size"]
+
+        live = {key.split(":", 1)[1] for key in self._entries}
+        self._files = {
+            path: record for path, record in self._files.items()
+            if record[2] in live
+        }
+
+    def save(self):
+        """
+        Write the cache back to disk atomically if anything changed.
+        """
+        if not self._dirty:
+            return
+
+        self._evict()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "format": CACHE_FORMAT,
+            "version": __version__,
+            "clock": self._clock,
+            "files": self._files,
+            "entries": self._entries,
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        self._dirty = False
+
+    def clear(self):
+        """Forget every entry."""
+        self._files = {}
+        self._entries = {}
+        self._pending = {}
+        self._dirty = True
+
+
+def cached_parse_code(cache, path):
+    """
+    Return parse_code(path) results, served from the cache when possible.
+    """
+    from docgen.analyzer.parser import ClassRecord, FunctionRecord, parse_code
+
+    value = cache.lookup(path, "parse_code")
+    if value is None:
+        source = Path(path).read_text(encoding="utf-8")
+        functions, classes = parse_code(source)
+        cache.store(path, "parse_code", [
+            [func.to_dict() for func in functions],
+            [cls.to_dict() for cls in classes],
+        ])
+        return functions, classes
+
+    functions = [FunctionRecord.from_dict(func) for func in value[0]]
+    classes = [ClassRecord.from_dict(cls) for cls in value[1]]
+    return functions, classes
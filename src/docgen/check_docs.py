@@ -1,59 +1,443 @@
+import argparse
 import ast
+import bisect
+import functools
+import os
 import pathlib
 import sys
 
+from docgen import profiling
+
 SRC_DIR = "src"
 MIN_COVERAGE = 100  # Set to 100 if you want strict enforcement
+CHUNKS_PER_WORKER = 4
 
 
-def count_items(source, filename="<unknown>"):
+def count_items(source, filename="<unknown>", prefilter=False):
     """
     Count total functions/classes and documented ones in a source file.
-    
+
+    With prefilter, files that a text scan proves to contain no
+    definitions, or only documented ones, skip ast.parse. Syntax errors
+    in such files are then not reported.
+
     Returns:
         total (int): Total number of functions/classes
         documented (int): Number of documented functions/classes
         missing (list): List of undocumented item names
     """
+    if prefilter:
+        from docgen.analyzer.prefilter import quick_count
+
+        with profiling.stage("prefilter", len(source)):
+            counts = quick_count(source)
+        if counts is not None:
+            return counts[0], counts[1], []
+
+    with profiling.stage("parse", len(source)):
+        tree = ast.parse(source)
+    total = 0
+    documented = 0
+    missing = []
+
+    with profiling.stage("count"):
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                total += 1
+                name = node.name
+
+                if ast.get_docstring(node):
+                    documented += 1
+                else:
+                    missing.append(f"{filename} -> {name}")
+
+    return total, documented, missing
+
+
+def count_changed_items(source, filename, ranges):
+    """
+    Count functions/classes whose line span overlaps any changed range.
+
+    Args:
+        source: Source text of the file.
+        filename: Name used in the missing item labels.
+        ranges: Sorted, inclusive (start, end) line ranges.
+
+    Returns:
+        The same (total, documented, missing) triple as count_items,
+        restricted to the overlapping definitions.
+    """
     tree = ast.parse(source)
+    starts = [start for start, _ in ranges]
     total = 0
     documented = 0
     missing = []
 
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-            total += 1
-            name = node.name
+            first = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            last = node.end_lineno
 
+            # Only ranges starting at or before `last` can overlap.
+            index = bisect.bisect_right(starts, last)
+            if not any(end >= first for _, end in ranges[:index]):
+                continue
+
+            total += 1
             if ast.get_docstring(node):
                 documented += 1
             else:
-                missing.append(f"{filename} -> {name}")
+                missing.append(f"{filename} -> {node.name}")
 
     return total, documented, missing
 
 
-def main():
+def scan_file(path, prefilter=False):
+    """
+    Read a single file and count its documented items.
+
+    This is the unit of work handed to worker processes, so it only
+    takes and returns picklable values.
+    """
+    path = pathlib.Path(path)
+    with profiling.file(path):
+        with profiling.stage("read") as timer:
+            source = path.read_text(encoding="utf-8")
+            timer.bytes = len(source)
+        return count_items(source, path.name, prefilter)
+
+
+def scan_files(files, workers=1, chunksize=None, prefilter=False):
+    """
+    Yield the count_items result for every file, in input order.
+
+    With more than one worker the files are split into chunks and
+    distributed over a process pool. Results are still yielded in the
+    order of ``files`` so the merged output matches the serial scan.
+    """
+    if workers <= 1 or len(files) <= 1:
+        for file in files:
+            yield scan_file(file, prefilter)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if chunksize is None:
+        chunksize = max(1, len(files) // (workers * CHUNKS_PER_WORKER))
+
+    profiler = profiling.current()
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        worker = functools.partial(scan_file, prefilter=prefilter)
+        if profiler is None:
+            yield from executor.map(worker, files, chunksize=chunksize)
+            return
+
+        # Workers profile themselves and send their stats back per file.
+        worker = functools.partial(profiling.call_profiled, worker)
+        for result, stats in executor.map(worker, files, chunksize=chunksize):
+            profiler.merge(stats)
+            yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def scan_files_cached(files, cache, workers=1, chunksize=None, prefilter=False):
+    """
+    Like scan_files, but serve unchanged files from an AnalysisCache.
+
+    Only cache misses are read and parsed; they are still scanned in
+    parallel when workers is greater than one. Prefiltered results are
+    stored under their own kind: they may skip a syntax error, so a
+    later run without --prefilter must not be served them.
+    """
+    kind = "count_items:prefilter" if prefilter else "count_items"
+    cached = [cache.lookup(file, kind) for file in files]
+    misses = [file for file, value in zip(files, cached) if value is None]
+    fresh = scan_files(misses, workers, chunksize, prefilter)
+
+    for file, value in zip(files, cached):
+        prefix = f"{pathlib.Path(file).name} -> "
+
+        if value is None:
+            total, documented, missing = next(fresh)
+            names = [item[len(prefix):] for item in missing]
+            cache.store(file, kind, [total, documented, names])
+        else:
+            total, documented, names = value
+            missing = [prefix + name for name in names]
+
+        yield total, documented, missing
+
+
+def build_parser():
+    """
+    Build the argument parser for the coverage check.
+    """
+    parser = argparse.ArgumentParser(
+        prog="docgen",
+        description="Check documentation coverage of Python files.",
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 uses every CPU, default: 1).",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Files per work unit sent to a worker (default: automatic).",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse results for unchanged files from the analysis cache.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory of the analysis cache (implies --cache).",
+    )
+    parser.add_argument(
+        "--prefilter",
+        action="store_true",
+        help="Skip parsing files a text scan shows need no AST "
+             "(syntax errors in those files are not reported).",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        default=None,
+        help="Only check functions and classes changed since the git ref.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "ndjson"),
+        default="text",
+        help="Output format; ndjson streams one record per file and a summary.",
+    )
+    parser.add_argument(
+        "--include",
+        metavar="PATTERN",
+        action="append",
+        default=None,
+        help="Only check files matching this gitignore-style pattern "
+             "(repeatable, default: *.py).",
+    )
+    parser.add_argument(
+        "--exclude",
+        metavar="PATTERN",
+        action="append",
+        default=[],
+        help="Skip files and directories matching this gitignore-style "
+             "pattern (repeatable); excluded directories are not walked.",
+    )
+    parser.add_argument(
+        "--no-default-excludes",
+        action="store_true",
+        help="Also walk VCS, tool cache and virtualenv directories.",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        default=None,
+        help="Only scan shard I of N (balanced by file size) and write a "
+             "partial report for 'docgen merge' instead of a verdict.",
+    )
+    parser.add_argument(
+        "--shard-report",
+        metavar="FILE",
+        default=None,
+        help="Write the partial report of --shard to FILE (default: stdout).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings and the slowest files to stderr.",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="FILE",
+        default=None,
+        help="Write the profile as JSON to FILE (implies profiling).",
+    )
+    parser.add_argument(
+        "--profile-prom",
+        metavar="FILE",
+        default=None,
+        help="Write the profile in Prometheus text format to FILE "
+             "(implies profiling).",
+    )
+    return parser
+
+
+def write_profile(profiler, args):
+    """
+    Print and export a profile as requested on the command line.
+    """
+    if args.profile:
+        print(profiler.format(), file=sys.stderr)
+    if args.profile_json:
+        profiling.write_atomic(args.profile_json, profiler.to_json())
+    if args.profile_prom:
+        profiling.write_atomic(args.profile_prom, profiler.to_prometheus())
+
+
+def main(argv=None):
     """
     Run documentation coverage check across all Python files in src directory.
     """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.shard:
+        from docgen.sharding import parse_shard
+
+        try:
+            args.shard = parse_shard(args.shard)
+        except argparse.ArgumentTypeError as exc:
+            parser.error(f"argument --shard: {exc}")
+        if args.since or args.format != "text":
+            parser.error("--shard cannot be combined with --since or --format")
+    if args.shard_report and not args.shard:
+        parser.error("--shard-report requires --shard")
+
+    if not (args.profile or args.profile_json or args.profile_prom):
+        return _check(args)
+
+    with profiling.profile() as profiler:
+        try:
+            return _check(args)
+        finally:
+            write_profile(profiler, args)
+
+
+def _check(args):
+    """
+    Run the coverage check for parsed command-line arguments.
+    """
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
     total_items = 0
     documented_items = 0
     missing_items = []
 
-    for file in pathlib.Path(SRC_DIR).rglob("*.py"):
-        try:
-            source = file.read_text(encoding="utf-8")
-            t, d, m = count_items(source, file.name)
+    cache = None
+    if args.cache or args.cache_dir:
+        from docgen.cache import DEFAULT_CACHE_DIR, AnalysisCache
+        cache = AnalysisCache(args.cache_dir or DEFAULT_CACHE_DIR)
+
+    from docgen.discovery import WalkStats, compile_patterns, scan_patterns, walk_files
 
-            total_items += t
-            documented_items += d
-            missing_items.extend(m)
+    include, exclude = scan_patterns(
+        SRC_DIR, args.include, args.exclude, not args.no_default_excludes
+    )
+    walk_stats = None
 
-        except SyntaxError:
-            print(f"Syntax error in file: {file}")
+    if args.since:
+        from docgen.git_diff import GitError, changed_lines
+
+        try:
+            changes = changed_lines(args.since, [SRC_DIR])
+        except GitError as exc:
+            print(f"Could not read changes since {args.since}: {exc}")
             sys.exit(1)
 
+        include_matcher = compile_patterns(include)
+        exclude_matcher = compile_patterns(exclude)
+        files = []
+        for path in changes:
+            relpath = pathlib.Path(os.path.relpath(path, SRC_DIR)).as_posix()
+            if (
+                include_matcher.matches(relpath)
+                and not exclude_matcher.excludes(relpath)
+                and pathlib.Path(path).is_file()
+            ):
+                files.append(pathlib.Path(path))
+        results = (
+            count_changed_items(
+                file.read_text(encoding="utf-8"), file.name, changes[file.as_posix()]
+            )
+            for file in files
+        )
+    else:
+        walk_stats = WalkStats()
+        files = walk_files(SRC_DIR, include, exclude, walk_stats)
+
+        if args.shard:
+            from docgen.sharding import shard_files
+
+            file_count = len(files)
+            indexes, files = shard_files(files, args.shard)
+
+        if cache is None:
+            results = scan_files(files, workers, args.chunksize, args.prefilter)
+        else:
+            results = scan_files_cached(
+                files, cache, workers, args.chunksize, args.prefilter
+            )
+
+    if args.format == "ndjson":
+        from docgen.reports.ndjson import stream_coverage
+
+        try:
+            status = stream_coverage(
+                files, results, sys.stdout, MIN_COVERAGE, allow_empty=bool(args.since),
+                extra=walk_stats.to_dict() if walk_stats is not None else None,
+            )
+        finally:
+            if cache is not None:
+                cache.save()
+
+        if status:
+            sys.exit(status)
+        return
+
+    if args.shard:
+        from docgen.sharding import partial_report, write_report
+
+        try:
+            report = partial_report(
+                args.shard, file_count, indexes, files, results, MIN_COVERAGE,
+                walk_stats.to_dict(),
+            )
+        finally:
+            if cache is not None:
+                cache.save()
+        write_report(report, args.shard_report)
+        return
+
+    try:
+        for file in files:
+            try:
+                t, d, m = next(results)
+
+                total_items += t
+                documented_items += d
+                missing_items.extend(m)
+
+            except SyntaxError:
+                print(f"Syntax error in file: {file}")
+                sys.exit(1)
+    finally:
+        if cache is not None:
+            cache.save()
+
+    if total_items == 0:
+        if args.since:
+            print(f"No functions or classes changed since {args.since}.")
+            return
+    print_report(total_items, documented_items, missing_items, MIN_COVERAGE, walk_stats)
+
+
+def print_report(total_items, documented_items, missing_items, min_coverage, walk_stats=None):
+    """
+    Print the coverage report and exit with status 1 if the check fails.
+
+    Shared by the full check and ``docgen merge``, so a merged sharded
+    run prints exactly what a single run over the whole tree would.
+    """
     if total_items == 0:
         print("No functions or classes found.")
         sys.exit(1)
@@ -64,13 +448,16 @@ def main():
     print(f"Documented items: {documented_items}")
     print(f"Documentation coverage: {coverage:.2f}%\n")
 
+    if walk_stats is not None and walk_stats.summary():
+        print(walk_stats.summary() + "\n")
+
     if missing_items:
         print("Undocumented items:")
         for item in missing_items:
             print(f" - {item}")
         print()
 
-    if coverage < MIN_COVERAGE:
+    if coverage < min_coverage:
         print("Coverage below required threshold.")
         sys.exit(1)
 
@@ -78,4 +465,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
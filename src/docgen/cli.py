@@ -1,3 +1,26 @@
-from docgen.check_docs import main
+import importlib
+import sys
 
-__all__ = ["main"]
\ No newline at end of file
+COMMANDS = {
+    "lsp": "docgen.lsp",
+    "merge": "docgen.sharding",
+    "serve": "docgen.serve",
+    "watch": "docgen.watch",
+}
+
+
+def main(argv=None):
+    """
+    Dispatch to a docgen subcommand, defaulting to the coverage check.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+
+    if argv and argv[0] in COMMANDS:
+        module = importlib.import_module(COMMANDS[argv[0]])
+        return module.main(argv[1:])
+
+    from docgen.check_docs import main as check_main
+    return check_main(argv)
+
+
+__all__ = ["main"]
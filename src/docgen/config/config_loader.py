@@ -1,5 +1,8 @@
+import os
+import time
 import tomllib
 from pathlib import Path
+from types import MappingProxyType
 
 
 DEFAULT_CONFIG = {
@@ -9,15 +12,130 @@ DEFAULT_CONFIG = {
     "docstring_style": "google"
 }
 
+CONFIG_FILE = "pyproject.toml"
+CHECK_INTERVAL = 1.0
 
-def load_config():
-    """Function load_config."""
-    config_path = Path("pyproject.toml")
 
-    if not config_path.exists():
-        return DEFAULT_CONFIG
+class _Node:
+    """Memoized config of one directory and what it was built from."""
+
+    __slots__ = ("config", "mtime", "parent_config", "checked")
+
+    def __init__(self, config, mtime, parent_config, checked):
+        """Store a resolved directory config."""
+        self.config = config
+        self.mtime = mtime
+        self.parent_config = parent_config
+        self.checked = checked
+
+
+class ConfigResolver:
+    """
+    Resolves the configuration that applies to any file or directory.
+
+    Every ``pyproject.toml`` from the filesystem root down to the file's
+    directory is a layer; the ``[tool.docstring_analyzer]`` table of an
+    inner project overrides the keys of the outer ones, on top of
+    DEFAULT_CONFIG. Each config file is parsed once per modification
+    time and each directory's merged config is memoized, so resolving
+    many files in the same tree is a dictionary lookup. Cached results
+    are re-validated (one stat per directory) at most every
+    check_interval seconds.
+    """
+
+    def __init__(self, check_interval=CHECK_INTERVAL):
+        """Create an empty resolver."""
+        self.check_interval = check_interval
+        self._root = MappingProxyType(dict(DEFAULT_CONFIG))
+        self._dirs = {}
+        self._tables = {}
+
+    def resolve(self, path):
+        """
+        Return the merged configuration for a file.
+
+        The result is a read-only mapping shared between callers; copy
+        it with dict() before changing it.
+        """
+        path = os.fspath(path)
+        if not os.path.isabs(path):
+            path = os.path.abspath(path)
+        return self._resolve_dir(os.path.dirname(path))
+
+    def resolve_directory(self, directory):
+        """Return the merged configuration for files in directory."""
+        return self._resolve_dir(os.path.abspath(directory))
+
+    def _resolve_dir(self, directory):
+        """Return the memoized config of directory, rebuilding it if stale."""
+        node = self._dirs.get(directory)
+        now = time.monotonic()
+        if node is not None and now - node.checked < self.check_interval:
+            return node.config
+
+        parent = os.path.dirname(directory)
+        parent_config = self._root if parent == directory else self._resolve_dir(parent)
+
+        config_path = os.path.join(directory, CONFIG_FILE)
+        try:
+            mtime = os.stat(config_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if node is not None and node.mtime == mtime and node.parent_config is parent_config:
+            node.checked = now
+            return node.config
 
-    with open(config_path, "rb") as f:
-        data = tomllib.load(f)
+        table = self._table(config_path, mtime) if mtime is not None else None
+        if table:
+            config = MappingProxyType({**parent_config, **table})
+        else:
+            config = parent_config
+
+        self._dirs[directory] = _Node(config, mtime, parent_config, now)
+        return config
+
+    def _table(self, config_path, mtime):
+        """Return the docstring_analyzer table of a config file, parsed once per mtime."""
+        cached = self._tables.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(config_path, "rb") as f:
+            data = tomllib.load(f)
+
+        table = data.get("tool", {}).get("docstring_analyzer", {})
+        self._tables[config_path] = (mtime, table)
+        return table
+
+    def clear(self):
+        """Forget every memoized directory and parsed config file."""
+        self._dirs.clear()
+        self._tables.clear()
+
+
+_resolver = ConfigResolver()
+
+
+def resolve_config(path):
+    """
+    Return the configuration for a file from the shared resolver.
+    """
+    return _resolver.resolve(path)
+
+
+def resolve_directory(directory):
+    """
+    Return the configuration for files in directory from the shared resolver.
+    """
+    return _resolver.resolve_directory(directory)
+
+
+def load_config():
+    """
+    Return the configuration for the current working directory.
 
-    return data.get("tool", {}).get("docstring_analyzer", DEFAULT_CONFIG)
\ No newline at end of file
+    Keys missing from ``[tool.docstring_analyzer]`` (in this or an
+    enclosing project) fall back to DEFAULT_CONFIG.
+    """
+    return dict(resolve_directory(Path.cwd()))
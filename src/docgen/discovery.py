@@ -0,0 +1,245 @@
+import functools
+import os
+import pathlib
+import re
+
+DEFAULT_INCLUDE = ("*.py",)
+DEFAULT_EXCLUDE = (
+    ".git/", ".hg/", ".svn/", ".tox/", ".nox/", ".venv/", ".mypy_cache/",
+    ".pytest_cache/", ".docgen_cache/", "*.egg-info/", "node_modules/",
+)
+VENV_MARKER = "pyvenv.cfg"
+
+
+def _translate(pattern):
+    """
+    Translate one gitignore-style pattern into a regular expression.
+
+    Returns:
+        tuple: (regex, dir_only). A pattern containing a slash (other
+        than a trailing one) is anchored to the walk root; otherwise it
+        matches at any depth. A trailing slash matches directories only.
+    """
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    parts = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[" and "]" in pattern[index + 2:]:
+            end = pattern.index("]", index + 2)
+            body = pattern[index + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append("[" + body.replace("\\", "\\\\") + "]")
+            index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+
+    regex = "".join(parts)
+    return (regex if anchored else "(?:.*/)?" + regex), dir_only
+
+
+class PathMatcher:
+    """
+    A set of gitignore-style patterns compiled into two regular
+    expressions: one for files and one for directories.
+
+    Paths are matched relative to the walk root, with "/" separators.
+    """
+
+    __slots__ = ("patterns", "_files", "_dirs")
+
+    def __init__(self, patterns):
+        """Compile patterns; blank lines and # comments are ignored."""
+        self.patterns = tuple(
+            pattern.strip() for pattern in patterns
+            if pattern.strip() and not pattern.strip().startswith("#")
+        )
+        any_kind = []
+        dirs_only = []
+        for pattern in self.patterns:
+            regex, dir_only = _translate(pattern)
+            (dirs_only if dir_only else any_kind).append(regex)
+
+        self._files = self._compile(any_kind)
+        self._dirs = self._compile(any_kind + dirs_only)
+
+    @staticmethod
+    def _compile(regexes):
+        """Join regexes into one anchored pattern, or None if empty."""
+        if not regexes:
+            return None
+        return re.compile("(?:" + "|".join(regexes) + r")\Z", re.DOTALL)
+
+    def matches(self, relpath, is_dir=False):
+        """Return True if a root-relative path matches any pattern."""
+        regex = self._dirs if is_dir else self._files
+        return regex is not None and regex.match(relpath) is not None
+
+    def excludes(self, relpath):
+        """
+        Return True if a file, or any directory above it, matches.
+
+        Used for paths that did not come from walk_files, such as files
+        listed by git.
+        """
+        parts = relpath.split("/")
+        for depth in range(1, len(parts)):
+            if self.matches("/".join(parts[:depth]), is_dir=True):
+                return True
+        return self.matches(relpath)
+
+
+def scan_patterns(root, include=None, exclude=(), default_excludes=True):
+    """
+    Combine command-line patterns with the configuration of root.
+
+    The ``include`` and ``exclude`` lists of ``[tool.docstring_analyzer]``
+    apply first; include given here replaces the configured one, and
+    exclude given here is added to it.
+
+    Returns:
+        tuple: (include, exclude) pattern tuples for walk_files.
+    """
+    from docgen.config.config_loader import resolve_directory
+
+    config = resolve_directory(root)
+    include = tuple(include or config.get("include") or DEFAULT_INCLUDE)
+    exclude = (
+        (DEFAULT_EXCLUDE if default_excludes else ())
+        + tuple(config.get("exclude", ()))
+        + tuple(exclude)
+    )
+    return include, exclude
+
+
+@functools.lru_cache(maxsize=64)
+def compile_patterns(patterns):
+    """Return the PathMatcher for a tuple of patterns, compiling it once."""
+    return PathMatcher(patterns)
+
+
+class WalkStats:
+    """What a walk found and what it left out."""
+
+    __slots__ = ("files", "skipped_files", "skipped_bytes", "pruned_dirs")
+
+    def __init__(self):
+        """Start every counter at zero."""
+        self.files = 0
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+        self.pruned_dirs = 0
+
+    def to_dict(self) -> dict:
+        """Return the counters as a dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build stats from a dict produced by to_dict."""
+        stats = cls()
+        for name in cls.__slots__:
+            setattr(stats, name, data.get(name, 0))
+        return stats
+
+    def summary(self):
+        """Return a one-line description of what was excluded, or ""."""
+        if not (self.skipped_files or self.pruned_dirs):
+            return ""
+        return (
+            f"Excluded {self.skipped_files} file(s) ({self.skipped_bytes} bytes) "
+            f"and {self.pruned_dirs} director(ies)."
+        )
+
+
+def walk_files(root, include=DEFAULT_INCLUDE, exclude=DEFAULT_EXCLUDE,
+               stats=None, skip_venvs=True):
+    """
+    List the files below root that match include and not exclude.
+
+    Excluded directories (and, with skip_venvs, virtualenvs, detected by
+    their pyvenv.cfg) are pruned without being read. Files come out in
+    the same order as ``Path(root).rglob("*.py")``: the files of each
+    directory first, then each subdirectory in turn. Symlinked
+    directories are not followed.
+
+    Args:
+        root: Directory to walk.
+        include: Patterns a file must match.
+        exclude: Patterns of files and directories to leave out.
+        stats: Optional WalkStats to fill in. Skipped files and bytes
+            count included files that an exclude pattern removed;
+            pruned directories are counted, not their contents.
+
+    Returns:
+        list: pathlib.Path objects, prefixed with root as given.
+    """
+    include = compile_patterns(tuple(include))
+    exclude = compile_patterns(tuple(exclude))
+    stats = stats if stats is not None else WalkStats()
+    found = []
+
+    def visit(directory, prefix, top):
+        """Collect matching files in directory, then walk its subdirectories."""
+        try:
+            with os.scandir(directory) as scan:
+                entries = list(scan)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return
+
+        if skip_venvs and not top and any(entry.name == VENV_MARKER for entry in entries):
+            stats.pruned_dirs += 1
+            return
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                if not entry.is_symlink():
+                    subdirs.append(entry)
+                continue
+
+            relpath = prefix + entry.name
+            if not include.matches(relpath):
+                continue
+            if exclude.matches(relpath):
+                stats.skipped_files += 1
+                try:
+                    stats.skipped_bytes += entry.stat().st_size
+                except OSError:
+                    pass
+                continue
+            found.append(entry.path)
+
+        for entry in subdirs:
+            relpath = prefix + entry.name
+            if exclude.matches(relpath, is_dir=True):
+                stats.pruned_dirs += 1
+                continue
+            visit(entry.path, relpath + "/", False)
+
+    visit(os.fspath(root), "", True)
+    stats.files += len(found)
+    return [pathlib.Path(path) for path in found]
@@ -1,76 +1,186 @@
-def generate_google_style(func):
+from docgen import profiling
+
+MEMO_SIZE = 4096
+
+
+class DocstringFormatter:
     """
-    Generate a Google-style docstring.
+    Precompiled docstring template for one style.
+
+    The template is split around its ``{params}`` placeholder once, when
+    the formatter is built, so rendering only formats the name and joins
+    the parameter lines. Rendered docstrings are memoized by signature,
+    which makes repeated signatures (``self``-only methods, common
+    helper names) free.
     """
-    params = "\n".join(
-        [f"    {param}: description" for param in func["params"]]
-    )
 
-    docstring = f'''"""
-{func["name"]} function.
+    def __init__(
+        self,
+        template,
+        param_template,
+        no_params_template=None,
+        inline_template=None,
+        inline_param_template=None,
+        class_template='"""\n{name} class.\n"""',
+    ):
+        """
+        Compile the templates of a style.
 
-Args:
-{params}
+        Args:
+            template: Docstring text with ``{name}`` and ``{params}``;
+                ``{params}`` must sit on a line of its own.
+            param_template: Line for one parameter, with ``{param}``.
+            no_params_template: Template used when there are no
+                parameters. Defaults to ``template``.
+            inline_template: Template for docstrings injected into
+                source. Defaults to ``template``.
+            inline_param_template: Parameter line for inline_template.
+            class_template: Inline docstring for classes.
+        """
+        self._full = self._compile(template)
+        self._empty = self._compile(no_params_template or template)
+        self._param = param_template
+        self._inline = self._compile(inline_template or template)
+        self._inline_param = inline_param_template or param_template
+        self._class_template = class_template
+        self._memo = {}
+        self._inline_memo = {}
 
-Returns:
-    value
-"""
-'''
-    return docstring
+    @staticmethod
+    def _compile(template):
+        """Split a template into the parts before and after {params}."""
+        head, _, tail = template.partition("{params}")
+        return head, tail
 
+    @staticmethod
+    def _remember(memo, key, value):
+        """Store value in a bounded memo table."""
+        if len(memo) >= MEMO_SIZE:
+            memo.clear()
+        memo[key] = value
+        return value
 
-def generate_numpy_style(func):
+    def render(self, name, params):
+        """Return the docstring for a function signature."""
+        key = (name, tuple(params))
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        head, tail = self._full if key[1] else self._empty
+        body = "\n".join([self._param.format(param=param) for param in key[1]])
+        return self._remember(self._memo, key, head.format(name=name) + body + tail)
+
+    def render_lines(self, name, params=(), is_class=False):
+        """
+        Return the unindented lines of a docstring injected into source.
+        """
+        key = (name, tuple(params), is_class)
+        cached = self._inline_memo.get(key)
+        if cached is not None:
+            return cached
+
+        if is_class:
+            lines = self._class_template.format(name=name).split("\n")
+        else:
+            head, tail = self._inline
+            lines = head.format(name=name).split("\n")
+            lines.pop()
+            for param in key[1]:
+                lines.extend(self._inline_param.format(param=param).split("\n"))
+            lines.extend(tail.rstrip("\n").split("\n")[1:])
+
+        lines = tuple(lines)
+        return self._remember(self._inline_memo, key, lines)
+
+
+STYLES = {}
+
+
+def register_style(name, formatter):
     """
-    Generate a NumPy-style docstring.
+    Register a DocstringFormatter under a case-insensitive style name.
     """
-    params = "\n".join(
-        [f"{param} : type\n    description" for param in func["params"]]
-    )
+    STYLES[name.lower()] = formatter
 
-    docstring = f'''"""
-{func["name"]} function.
 
-Parameters
-----------
-{params}
+def get_style(style):
+    """
+    Return the formatter registered for style.
+    """
+    try:
+        return STYLES[style.lower()]
+    except KeyError:
+        raise ValueError("Unsupported docstring style") from None
 
-Returns
--------
-value
-"""
-'''
-    return docstring
 
+register_style("google", DocstringFormatter(
+    '"""\n{name} function.\n\nArgs:\n{params}\n\nReturns:\n    value\n"""\n',
+    "    {param}: description",
+    inline_template=(
+        '"""\n{name} function.\n\nArgs:\n{params}\n\n'
+        'Returns:\n    Description.\n"""'
+    ),
+    inline_param_template="    {param}: Description.",
+))
 
-def generate_rest_style(func):
+register_style("numpy", DocstringFormatter(
+    '"""\n{name} function.\n\nParameters\n----------\n{params}\n\n'
+    'Returns\n-------\nvalue\n"""\n',
+    "{param} : type\n    description",
+))
+
+register_style("rest", DocstringFormatter(
+    '"""\n{name} function.\n\n{params}\n:return: value\n"""\n',
+    ":param {param}: description",
+))
+
+register_style("baseline", DocstringFormatter(
+    '"""\nFunction {name}.\n\nArgs:\n{params}\n\nReturns:\n    value\n"""',
+    "    {param}: parameter",
+    no_params_template='"""\nFunction {name}.\n\nReturns:\n    value\n"""',
+))
+
+
+def generate_google_style(func):
     """
-    Generate a reStructuredText (reST) style docstring.
+    Generate a Google-style docstring.
+    """
+    return STYLES["google"].render(func["name"], func["params"])
+
+
+def generate_numpy_style(func):
+    """
+    Generate a NumPy-style docstring.
     """
-    params = "\n".join(
-        [f":param {param}: description" for param in func["params"]]
-    )
+    return STYLES["numpy"].render(func["name"], func["params"])
 
-    docstring = f'''"""
-{func["name"]} function.
 
-{params}
-:return: value
-"""
-'''
-    return docstring
+def generate_rest_style(func):
+    """
+    Generate a reStructuredText (reST) style docstring.
+    """
+    return STYLES["rest"].render(func["name"], func["params"])
 
 
 def generate_docstring(func, style="google"):
     """
     Dispatcher function to select docstring style.
     """
-    style = style.lower()
+    with profiling.stage("generate"):
+        return get_style(style).render(func["name"], func["params"])
 
-    if style == "google":
-        return generate_google_style(func)
-    elif style == "numpy":
-        return generate_numpy_style(func)
-    elif style == "rest":
-        return generate_rest_style(func)
-    else:
-        raise ValueError("Unsupported docstring style")
\ No newline at end of file
+
+def generate_docstrings(funcs, style="google"):
+    """
+    Generate docstrings for many function signatures in one call.
+
+    The style is resolved once and repeated signatures are rendered
+    once, so this is the preferred entry point for bulk generation.
+
+    Returns:
+        list: One docstring per entry of funcs, in order.
+    """
+    formatter = get_style(style)
+    with profiling.stage("generate"):
+        return [formatter.render(func["name"], func["params"]) for func in funcs]
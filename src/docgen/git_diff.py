@@ -0,0 +1,103 @@
+import re
+import subprocess
+
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+QUOTED_PART = re.compile(r'([^\\]+)|\\([0-7]{3}|.)')
+ESCAPES = {"a": 7, "b": 8, "t": 9, "n": 10, "v": 11, "f": 12, "r": 13}
+
+
+class GitError(Exception):
+    """Raised when a git command fails."""
+
+
+def _git(*args, cwd=None):
+    """Run git and return its standard output."""
+    try:
+        completed = subprocess.run(
+            ["git", "-c", "core.quotePath=false", *args],
+            cwd=cwd,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError as exc:
+        raise GitError("git executable not found") from exc
+    except subprocess.CalledProcessError as exc:
+        raise GitError(exc.stderr.strip() or f"git {args[0]} failed") from exc
+    return completed.stdout
+
+
+def _unquote(path):
+    """
+    Decode a path as git prints it in a ``+++`` line.
+
+    Paths with special characters are C-quoted, with non-ASCII bytes
+    as octal escapes; paths containing a space get a trailing tab.
+    """
+    if not path.startswith('"'):
+        return path.rstrip("\t")
+
+    raw = bytearray()
+    for text, escape in QUOTED_PART.findall(path[1:path.rindex('"')]):
+        if len(escape) == 3:
+            raw.append(int(escape, 8))
+        elif escape:
+            raw.append(ESCAPES.get(escape, ord(escape)))
+        else:
+            raw.extend(text.encode("utf-8", "surrogateescape"))
+    return raw.decode("utf-8", "surrogateescape")
+
+
+def parse_diff(diff_text):
+    """
+    Parse ``git diff --unified=0`` output taken with the default
+    ``a/`` and ``b/`` prefixes.
+
+    Returns:
+        dict: Maps each changed file (new-side path) to a sorted list of
+        (start, end) line ranges, inclusive, in the new version. Pure
+        deletions are recorded as the line just before the removed block.
+    """
+    changes = {}
+    current = None
+
+    for line in diff_text.splitlines():
+        if line.startswith("+++ "):
+            target = _unquote(line[4:])
+            current = None if target == "/dev/null" else target[2:]
+            if current is not None:
+                changes.setdefault(current, [])
+            continue
+
+        match = HUNK_HEADER.match(line)
+        if match and current is not None:
+            start = int(match.group(1))
+            count = 1 if match.group(2) is None else int(match.group(2))
+            if count == 0:
+                start = max(start, 1)
+                changes[current].append((start, start))
+            else:
+                changes[current].append((start, start + count - 1))
+
+    for ranges in changes.values():
+        ranges.sort()
+    return changes
+
+
+def changed_lines(ref, paths=(), cwd=None):
+    """
+    Return the lines changed in the working tree since ref.
+
+    The diff is taken against the merge base of ref and HEAD, so changes
+    that landed on ref after the branch point are not included. Paths
+    are relative to the current directory. The path prefixes are given
+    explicitly, so diff.noprefix or custom prefixes in the user's git
+    config do not change the output.
+    """
+    base = _git("merge-base", ref, "HEAD", cwd=cwd).strip()
+    diff = _git(
+        "diff", "--unified=0", "--no-color", "--no-ext-diff", "--relative",
+        "--src-prefix=a/", "--dst-prefix=b/", "--diff-filter=AMR", base, "--", *paths,
+        cwd=cwd,
+    )
+    return parse_diff(diff)
@@ -1,57 +1,103 @@
 import ast
+from typing import NamedTuple
 
+from docgen import profiling
+from docgen.analyzer.parser import analyze
+from docgen.generator.styled_generator import get_style
 
-def inject_docstrings(source_code: str, style: str = "Google") -> str:
+
+class Insertion(NamedTuple):
     """
-    Inject missing docstrings into functions and classes
-    using Google style format.
+    One planned edit: lines inserted before the original line at index
+    position (0-based), which is the line after the definition header.
+    """
+
+    position: int
+    lines: tuple
+
+
+def splice_lines(lines, inserts):
     """
-    tree = ast.parse(source_code)
-    lines = source_code.splitlines()
+    Build the output lines with every insertion applied in one pass.
 
-    inserts = []
+    Args:
+        lines: Original source lines.
+        inserts: (position, new_lines) pairs; new_lines go before the
+            original line at index position.
 
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+    Returns:
+        A new list of lines. Each original line is copied once, so the
+        cost is linear in the file size plus the inserted lines.
+    """
+    output = []
+    previous = 0
+
+    for position, new_lines in sorted(inserts):
+        output.extend(lines[previous:position])
+        output.extend(new_lines)
+        previous = max(previous, position)
+
+    output.extend(lines[previous:])
+    return output
+
+
+def plan_docstrings(source_code, style: str = "Google"):
+    """
+    Plan the docstring insertions for a source file without applying them.
 
-            # Skip if docstring already exists
-            if ast.get_docstring(node):
-                continue
+    Accepts either a source string or a SourceAnalysis. The definition
+    lines that will receive a docstring are recorded on the analysis as
+    ``injected_lines``.
 
+    Returns:
+        list: Insertion edits sorted by position. Applying them with
+        splice_lines gives the text inject_docstrings returns.
+    """
+    analysis = analyze(source_code)
+    formatter = get_style(style)
+
+    plan = []
+
+    with profiling.stage("generate"):
+        for node in analysis.undocumented:
             indent = " " * node.col_offset
             doc_indent = indent + " " * 4
 
             if isinstance(node, ast.ClassDef):
-                docstring = [
-                    f'{doc_indent}"""',
-                    f"{doc_indent}{node.name} class.",
-                    f'{doc_indent}"""'
-                ]
+                doc_lines = formatter.render_lines(node.name, is_class=True)
             else:
-                docstring = [
-                    f'{doc_indent}"""',
-                    f"{doc_indent}{node.name} function.",
-                    "",
-                    f"{doc_indent}Args:",
-                ]
-
-                for arg in node.args.args:
-                    docstring.append(f"{doc_indent}    {arg.arg}: Description.")
-
-                docstring.extend([
-                    "",
-                    f"{doc_indent}Returns:",
-                    f"{doc_indent}    Description.",
-                    f'{doc_indent}"""'
-                ])
+                doc_lines = formatter.render_lines(
+                    node.name, [arg.arg for arg in node.args.args]
+                )
+
+            docstring = tuple(f"{doc_indent}{line}" if line else "" for line in doc_lines)
 
             # Insert after function/class definition line
-            insert_position = node.lineno
-            inserts.append((insert_position, docstring))
+            plan.append(Insertion(node.lineno, docstring))
+
+    plan.sort()
+    analysis.injected_lines = [edit.position for edit in plan]
+    return plan
+
 
-    # Insert from bottom to top to avoid shifting issues
-    for lineno, doc_lines in sorted(inserts, reverse=True):
-        for line in reversed(doc_lines):
-            lines.insert(lineno, line)
+def inject_docstrings(source_code, style: str = "Google", return_plan: bool = False):
+    """
+    Inject missing docstrings into functions and classes
+    using the given registered style (Google by default).
+
+    Accepts either a source string or a SourceAnalysis. The definition
+    lines that received a docstring are recorded on the analysis as
+    ``injected_lines``.
+
+    With return_plan=True, returns (updated_code, plan) where plan is the
+    list of Insertion edits that were applied, so callers can show what
+    changed without diffing the two texts.
+    """
+    analysis = analyze(source_code)
+    plan = plan_docstrings(analysis, style)
+    with profiling.stage("inject", len(analysis.source)):
+        updated_code = "\n".join(splice_lines(analysis.lines, plan))
 
-    return "\n".join(lines)
\ No newline at end of file
+    if return_plan:
+        return updated_code, plan
+    return updated_code
@@ -0,0 +1,513 @@
+import argparse
+import ast
+import json
+import queue
+import sys
+import threading
+import time
+from urllib.parse import unquote, urlparse
+
+from docgen.analyzer.parser import analyze
+from docgen.generator.styled_generator import STYLES
+from docgen.injector.docstring_injector import plan_docstrings
+
+DEBOUNCE_SECONDS = 0.2
+SOURCE = "docgen"
+DEFAULT_STYLE = "google"
+
+# LSP constants
+SYNC_FULL = 1
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INVALID_REQUEST = -32600
+INTERNAL_ERROR = -32603
+
+
+class MessageError(ValueError):
+    """A framed message whose body is not valid JSON."""
+
+
+def _log(message):
+    """Write a server log line to stderr; stdout carries the protocol."""
+    print(f"docgen lsp: {message}", file=sys.stderr, flush=True)
+
+
+def _checked_style(style, origin):
+    """
+    Return style if it names a registered docstring style, else the default.
+
+    Unknown or non-string styles are logged with their origin rather than
+    failing every analysis that uses them.
+    """
+    if style is None or (isinstance(style, str) and style.lower() in STYLES):
+        return style
+    _log(f"unsupported docstring style {style!r} from {origin}; using {DEFAULT_STYLE!r}")
+    return DEFAULT_STYLE
+
+
+def _utf16_column(line, index):
+    """Convert a str index into the UTF-16 column LSP positions use."""
+    prefix = line[:index]
+    if prefix.isascii():
+        return index
+    return len(prefix.encode("utf-16-le")) // 2
+
+
+def _body_line(node):
+    """
+    Return the 0-based line a docstring should be inserted before: the
+    first line of the body, including decorators of a nested definition.
+    Returns None when the body shares the header line.
+    """
+    first = node.body[0]
+    line = min([first.lineno] + [d.lineno for d in getattr(first, "decorator_list", [])])
+    return line - 1 if line > node.lineno else None
+
+
+def _position(line, character):
+    """Return an LSP Position."""
+    return {"line": line, "character": character}
+
+
+class Document:
+    """
+    An open text document and its last successful analysis.
+
+    Each analysis keeps one entry per undocumented definition, holding
+    the diagnostic range and the docstring insertion planned for it, so
+    diagnostics and code actions are answered without parsing again.
+    """
+
+    def __init__(self, uri, text, version=None):
+        """Track a newly opened document; it is analyzed on refresh()."""
+        self.uri = uri
+        self.version = version
+        self.symbols = []
+        self.syntax_error = None
+        self._text = text
+        self._lines = None
+
+    @property
+    def text(self):
+        """Current document text."""
+        return self._text
+
+    def update(self, text, version=None):
+        """Replace the document text; the analysis is kept until refresh()."""
+        self._text = text
+        self._lines = None
+        self.version = version
+
+    @property
+    def lines(self):
+        """Current text split into lines, computed on first use."""
+        if self._lines is None:
+            self._lines = self._text.splitlines()
+        return self._lines
+
+    def refresh(self, style):
+        """
+        Re-analyze the current text.
+
+        On a syntax error the previous symbols are kept and the error is
+        reported instead, so the editor keeps its last good state while
+        the user is typing.
+        """
+        try:
+            analysis = analyze(self._text)
+        except (SyntaxError, ValueError) as error:
+            self.syntax_error = error
+            return
+
+        self.syntax_error = None
+        edits = {edit.position: edit.lines for edit in plan_docstrings(analysis, style)}
+        lines = analysis.lines
+        symbols = []
+
+        for node in analysis.undocumented:
+            header = lines[node.lineno - 1]
+            body = _body_line(node)
+            kind = "Class" if isinstance(node, ast.ClassDef) else "Function"
+            start = header.find(node.name, node.col_offset)
+            if start < 0:
+                start = 0
+            symbols.append({
+                "name": node.name,
+                "kind": kind,
+                "line": node.lineno - 1,
+                "start": _utf16_column(header, start),
+                "end": _utf16_column(header, start + len(node.name)),
+                "header": header,
+                "body": body,
+                "anchor": None if body is None else lines[body],
+                "insert": "".join(line + "\n" for line in edits[node.lineno]),
+            })
+
+        symbols.sort(key=lambda symbol: (symbol["line"], symbol["start"]))
+        self.symbols = symbols
+
+    def diagnostics(self):
+        """Return LSP diagnostics for the last analysis."""
+        if self.syntax_error is not None:
+            line = max((self.syntax_error.lineno or 1) - 1, 0)
+            return [{
+                "range": {"start": _position(line, 0), "end": _position(line + 1, 0)},
+                "severity": SEVERITY_ERROR,
+                "source": SOURCE,
+                "message": f"Syntax error: {self.syntax_error.msg}",
+            }]
+
+        return [self._diagnostic(symbol) for symbol in self.symbols]
+
+    def _diagnostic(self, symbol):
+        """Return the missing-docstring diagnostic for one symbol."""
+        return {
+            "range": {
+                "start": _position(symbol["line"], symbol["start"]),
+                "end": _position(symbol["line"], symbol["end"]),
+            },
+            "severity": SEVERITY_WARNING,
+            "source": SOURCE,
+            "code": "missing-docstring",
+            "message": f"{symbol['kind']} '{symbol['name']}' has no docstring",
+        }
+
+    def _current(self, symbol):
+        """Return True if the header and first body lines are unchanged."""
+        lines = self.lines
+        return (
+            symbol["body"] < len(lines)
+            and lines[symbol["line"]] == symbol["header"]
+            and lines[symbol["body"]] == symbol["anchor"]
+        )
+
+    def _edit(self, symbol):
+        """Return the TextEdit that inserts the symbol's docstring."""
+        position = _position(symbol["body"], 0)
+        return {"range": {"start": position, "end": position}, "newText": symbol["insert"]}
+
+    def code_actions(self, first_line, last_line):
+        """
+        Return insert-docstring code actions for definitions whose header
+        lies within the given lines (0-based, inclusive).
+
+        Cached edits are only offered while the header and first body
+        lines still read the same in the current text, so a stale
+        analysis never inserts a docstring in the wrong place. Unlike
+        inject_docstrings, the docstring goes before the first body
+        line, which keeps headers that span several lines intact;
+        one-line definitions get no action.
+        """
+        current = [
+            symbol for symbol in self.symbols
+            if symbol["body"] is not None and self._current(symbol)
+        ]
+        actions = []
+
+        for symbol in current:
+            if first_line <= symbol["line"] <= last_line:
+                actions.append({
+                    "title": f"Insert docstring for '{symbol['name']}'",
+                    "kind": "quickfix",
+                    "diagnostics": [self._diagnostic(symbol)],
+                    "edit": {"changes": {self.uri: [self._edit(symbol)]}},
+                })
+
+        if len(current) > 1:
+            actions.append({
+                "title": "Insert all missing docstrings",
+                "kind": "source.fixAll.docgen",
+                "edit": {"changes": {self.uri: [self._edit(symbol) for symbol in current]}},
+            })
+
+        return actions
+
+
+def read_message(stream):
+    """
+    Read one JSON-RPC message framed with a Content-Length header.
+
+    Returns:
+        The decoded message, or None at end of input.
+
+    Raises:
+        MessageError: The body is not valid JSON. The whole body has
+            been consumed, so the next message can still be read.
+    """
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+
+    if length is None:
+        return None
+    try:
+        return json.loads(stream.read(length).decode("utf-8"))
+    except ValueError as error:
+        raise MessageError(str(error)) from None
+
+
+def write_message(stream, message):
+    """Write one JSON-RPC message with its Content-Length header."""
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    stream.flush()
+
+
+class LanguageServer:
+    """
+    Minimal LSP server for missing-docstring diagnostics and fixes.
+
+    Messages are read on a background thread and handled in order on
+    the calling thread. Documents are analyzed when opened; after a
+    change they are re-analyzed once no further change has arrived for
+    the debounce delay. Code actions are answered from the cached
+    analysis.
+    """
+
+    def __init__(self, reader, writer, style=None, debounce=DEBOUNCE_SECONDS):
+        """
+        Serve LSP over the binary streams reader and writer.
+
+        Without a style, each document uses the docstring_style of the
+        pyproject.toml nearest to it.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.style = _checked_style(style, "--style")
+        self.debounce = debounce
+        self.documents = {}
+        self.shutdown_requested = False
+        self._due = {}
+        self._messages = queue.Queue()
+
+    def _read_loop(self):
+        """
+        Queue incoming messages; queue None at end of input.
+
+        A body that is not valid JSON is queued as its MessageError and
+        reading goes on; broken framing ends the input.
+        """
+        try:
+            while True:
+                try:
+                    message = read_message(self.reader)
+                except MessageError as error:
+                    message = error
+                self._messages.put(message)
+                if message is None:
+                    return
+        except (OSError, ValueError):
+            self._messages.put(None)
+
+    def run(self):
+        """
+        Serve until the client sends exit or closes the input.
+
+        Returns:
+            int: Process exit code (0 after a clean shutdown).
+        """
+        threading.Thread(target=self._read_loop, daemon=True).start()
+
+        while True:
+            self._refresh_due()
+            timeout = None
+            if self._due:
+                timeout = max(0.0, min(self._due.values()) - time.monotonic())
+            try:
+                message = self._messages.get(timeout=timeout)
+            except queue.Empty:
+                continue
+
+            if message is None:
+                return 0 if self.shutdown_requested else 1
+            if isinstance(message, MessageError):
+                self._respond(None, error={
+                    "code": PARSE_ERROR, "message": f"Parse error: {message}",
+                })
+                continue
+            if not isinstance(message, dict):
+                self._respond(None, error={
+                    "code": INVALID_REQUEST, "message": "Message must be a JSON object",
+                })
+                continue
+            if message.get("method") == "exit":
+                return 0 if self.shutdown_requested else 1
+            self.handle(message)
+
+    def _refresh_due(self):
+        """Analyze the documents whose debounce delay has passed."""
+        now = time.monotonic()
+        for uri, due in list(self._due.items()):
+            if due <= now:
+                del self._due[uri]
+                if uri in self.documents:
+                    try:
+                        self._refresh(self.documents[uri])
+                    except Exception as error:
+                        _log(f"analysis of {uri} failed: {error!r}")
+
+    def _refresh(self, document):
+        """Analyze a document and publish its diagnostics."""
+        document.refresh(self.style or self._style_for(document.uri))
+        self.notify("textDocument/publishDiagnostics", {
+            "uri": document.uri,
+            "version": document.version,
+            "diagnostics": document.diagnostics(),
+        })
+
+    def _style_for(self, uri):
+        """Return the configured docstring style for a document URI."""
+        from docgen.config.config_loader import DEFAULT_CONFIG, resolve_config
+
+        parsed = urlparse(uri)
+        if parsed.scheme != "file":
+            return DEFAULT_CONFIG["docstring_style"]
+        try:
+            config = resolve_config(unquote(parsed.path))
+        except (OSError, ValueError) as error:
+            _log(f"cannot read configuration for {uri}: {error}")
+            return DEFAULT_CONFIG["docstring_style"]
+        style = config.get("docstring_style", DEFAULT_CONFIG["docstring_style"])
+        return _checked_style(style, f"the configuration of {uri}")
+
+    def notify(self, method, params):
+        """Send a notification to the client."""
+        write_message(self.writer, {"jsonrpc": "2.0", "method": method, "params": params})
+
+    def _respond(self, message_id, result=None, error=None):
+        """Send the response to a request."""
+        response = {"jsonrpc": "2.0", "id": message_id}
+        if error is not None:
+            response["error"] = error
+        else:
+            response["result"] = result
+        write_message(self.writer, response)
+
+    def handle(self, message):
+        """
+        Handle one request or notification.
+
+        A handler that raises answers a request with an internal error;
+        for a notification the error is logged. Either way the server
+        keeps running.
+        """
+        method = message.get("method")
+        params = message.get("params") or {}
+        handler = getattr(self, "_on_" + (method or "").replace("/", "_").replace("$", "_"), None)
+
+        if "id" not in message:
+            if handler is not None:
+                try:
+                    handler(params)
+                except Exception as error:
+                    _log(f"{method} failed: {error!r}")
+            return
+
+        if self.shutdown_requested and method != "shutdown":
+            self._respond(message["id"], error={
+                "code": INVALID_REQUEST, "message": "Server is shutting down",
+            })
+        elif handler is None:
+            self._respond(message["id"], error={
+                "code": METHOD_NOT_FOUND, "message": f"Unhandled method {method}",
+            })
+        else:
+            try:
+                result = handler(params)
+            except Exception as error:
+                self._respond(message["id"], error={
+                    "code": INTERNAL_ERROR, "message": f"{method} failed: {error}",
+                })
+            else:
+                self._respond(message["id"], result)
+
+    def _on_initialize(self, params):
+        """Announce full text sync and quick-fix code actions."""
+        options = params.get("initializationOptions") or {}
+        if "style" in options:
+            self.style = _checked_style(options["style"], "initializationOptions")
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": SYNC_FULL},
+                "codeActionProvider": {
+                    "codeActionKinds": ["quickfix", "source.fixAll.docgen"],
+                },
+            },
+            "serverInfo": {"name": "docgen"},
+        }
+
+    def _on_shutdown(self, params):
+        """Stop accepting requests; exit follows."""
+        self.shutdown_requested = True
+        return None
+
+    def _on_textDocument_didOpen(self, params):
+        """Analyze a newly opened document right away."""
+        item = params["textDocument"]
+        document = Document(item["uri"], item["text"], item.get("version"))
+        self.documents[document.uri] = document
+        self._refresh(document)
+
+    def _on_textDocument_didChange(self, params):
+        """Store the new text and schedule a debounced re-analysis."""
+        document = self.documents.get(params["textDocument"]["uri"])
+        changes = params.get("contentChanges") or []
+        if document is None or not changes:
+            return
+
+        document.update(changes[-1]["text"], params["textDocument"].get("version"))
+        self._due[document.uri] = time.monotonic() + self.debounce
+
+    def _on_textDocument_didClose(self, params):
+        """Forget a closed document and clear its diagnostics."""
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self._due.pop(uri, None)
+        self.notify("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    def _on_textDocument_codeAction(self, params):
+        """Return docstring insertions for the requested range."""
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return []
+
+        selection = params["range"]
+        return document.code_actions(selection["start"]["line"], selection["end"]["line"])
+
+
+def main(argv=None):
+    """
+    Entry point for ``docgen lsp``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="docgen lsp",
+        description="Language server for missing-docstring diagnostics and fixes.",
+    )
+    parser.add_argument("--stdio", action="store_true",
+                        help="Communicate over stdin/stdout (the only transport).")
+    parser.add_argument("--style", default=None,
+                        help="Docstring style for inserted docstrings (default: "
+                             "docstring_style from each file's nearest pyproject.toml).")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE_SECONDS * 1000,
+                        help="Milliseconds to wait after a change before re-analyzing "
+                             "(default: 200).")
+    args = parser.parse_args(argv)
+
+    server = LanguageServer(
+        sys.stdin.buffer, sys.stdout.buffer, args.style, max(0.0, args.debounce / 1000)
+    )
+    sys.exit(server.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+import contextlib
+import heapq
+import os
+import time
+
+SLOWEST_FILES = 10
+
+
+class _Stage:
+    """Running totals for one pipeline stage."""
+
+    __slots__ = ("calls", "seconds", "bytes", "max_seconds")
+
+    def __init__(self):
+        """Start every counter at zero."""
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes = 0
+        self.max_seconds = 0.0
+
+
+class _Timer:
+    """Times one stage call; set ``bytes`` inside the block if unknown up front."""
+
+    __slots__ = ("profiler", "name", "bytes", "start")
+
+    def __init__(self, profiler, name, nbytes):
+        """Prepare to time a call of stage name."""
+        self.profiler = profiler
+        self.name = name
+        self.bytes = nbytes
+
+    def __enter__(self):
+        """Start the clock."""
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Record the elapsed time, even when the stage raised."""
+        self.profiler.add(self.name, time.perf_counter() - self.start, self.bytes)
+        return False
+
+
+class _FileTimer:
+    """Times all the work done for one file."""
+
+    __slots__ = ("profiler", "path", "start")
+
+    def __init__(self, profiler, path):
+        """Prepare to time the work for path."""
+        self.profiler = profiler
+        self.path = path
+
+    def __enter__(self):
+        """Start the clock."""
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Offer the elapsed time to the slowest-files list."""
+        self.profiler.add_file(self.path, time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    """Stand-in used while profiling is off; accepts and ignores ``bytes``."""
+
+    bytes = 0
+
+    def __enter__(self):
+        """Do nothing."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Do nothing."""
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Profiler:
+    """
+    Per-stage wall time, call counts and bytes, plus the slowest files.
+
+    Stages do not nest: ``read``, ``prefilter``, ``parse``, ``count``,
+    ``generate``, ``inject`` and ``validate`` each time their own work, so
+    their times add up. Bytes are counted in characters of decoded source.
+    """
+
+    def __init__(self, slowest=SLOWEST_FILES):
+        """Start an empty profile."""
+        self.started = time.perf_counter()
+        self.slowest = slowest
+        self.stages = {}
+        self._files = []
+
+    def add(self, name, seconds, nbytes=0):
+        """Record one call of a stage."""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = _Stage()
+        stage.calls += 1
+        stage.seconds += seconds
+        stage.bytes += nbytes
+        if seconds > stage.max_seconds:
+            stage.max_seconds = seconds
+
+    def add_file(self, path, seconds):
+        """Offer a file's total time to the slowest-files list."""
+        entry = (seconds, os.fspath(path))
+        if len(self._files) < self.slowest:
+            heapq.heappush(self._files, entry)
+        elif entry > self._files[0]:
+            heapq.heapreplace(self._files, entry)
+
+    def merge(self, data):
+        """Add a profile exported with to_dict, e.g. from a worker process."""
+        for name, values in data["stages"].items():
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = _Stage()
+            stage.calls += values["calls"]
+            stage.seconds += values["seconds"]
+            stage.bytes += values["bytes"]
+            stage.max_seconds = max(stage.max_seconds, values["max_seconds"])
+
+        for item in data["slowest_files"]:
+            self.add_file(item["path"], item["seconds"])
+
+    def to_dict(self) -> dict:
+        """Return the profile as a JSON-serializable dict."""
+        return {
+            "wall_seconds": time.perf_counter() - self.started,
+            "stages": {
+                name: {
+                    "calls": stage.calls,
+                    "seconds": stage.seconds,
+                    "bytes": stage.bytes,
+                    "max_seconds": stage.max_seconds,
+                }
+                for name, stage in self.stages.items()
+            },
+            "slowest_files": [
+                {"path": path, "seconds": seconds}
+                for seconds, path in sorted(self._files, reverse=True)
+            ],
+        }
+
+    def to_json(self) -> str:
+        """Return the profile as JSON text."""
+        import json
+
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Return the profile in the Prometheus text exposition format."""
+        data = self.to_dict()
+        metrics = (
+            ("docgen_stage_seconds_total", "counter",
+             "Wall time spent in each pipeline stage.", "seconds"),
+            ("docgen_stage_calls_total", "counter",
+             "Calls of each pipeline stage.", "calls"),
+            ("docgen_stage_bytes_total", "counter",
+             "Source characters processed by each pipeline stage.", "bytes"),
+            ("docgen_stage_max_seconds", "gauge",
+             "Slowest single call of each pipeline stage.", "max_seconds"),
+        )
+        lines = [
+            "# HELP docgen_run_seconds Wall time of the profiled run.",
+            "# TYPE docgen_run_seconds gauge",
+            f"docgen_run_seconds {data['wall_seconds']:.6f}",
+        ]
+
+        for metric, kind, help_text, field in metrics:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, values in sorted(data["stages"].items()):
+                lines.append(f'{metric}{{stage="{_label(name)}"}} {values[field]}')
+
+        lines.append("# HELP docgen_slowest_file_seconds Time spent on the slowest files.")
+        lines.append("# TYPE docgen_slowest_file_seconds gauge")
+        for item in data["slowest_files"]:
+            lines.append(
+                f'docgen_slowest_file_seconds{{path="{_label(item["path"])}"}} '
+                f'{item["seconds"]:.6f}'
+            )
+        return "\n".join(lines) + "\n"
+
+    def format(self):
+        """Return a human-readable table of the profile."""
+        data = self.to_dict()
+        lines = [
+            f"Profile (wall {data['wall_seconds']:.3f} s):",
+            f"  {'stage':<10} {'calls':>8} {'seconds':>10} {'max ms':>9} {'bytes':>12}",
+        ]
+        for name, values in sorted(
+            data["stages"].items(), key=lambda item: item[1]["seconds"], reverse=True
+        ):
+            lines.append(
+                f"  {name:<10} {values['calls']:>8} {values['seconds']:>10.4f} "
+                f"{values['max_seconds'] * 1000:>9.2f} {values['bytes']:>12}"
+            )
+        if data["slowest_files"]:
+            lines.append("Slowest files:")
+            for item in data["slowest_files"]:
+                lines.append(f"  {item['seconds'] * 1000:>9.2f} ms  {item['path']}")
+        return "\n".join(lines)
+
+
+def _label(value):
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_active = None
+
+
+def current():
+    """Return the active Profiler, or None while profiling is off."""
+    return _active
+
+
+def enable(profiler=None):
+    """
+    Turn profiling on for this process and return the active Profiler.
+    """
+    global _active
+    _active = profiler if profiler is not None else Profiler()
+    return _active
+
+
+def disable():
+    """Turn profiling off and return the Profiler that was active."""
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+@contextlib.contextmanager
+def profile(profiler=None):
+    """
+    Profile the enclosed block and yield its Profiler.
+
+    The previously active profiler, if any, is restored afterwards.
+    """
+    global _active
+    previous = _active
+    active = enable(profiler)
+    try:
+        yield active
+    finally:
+        _active = previous
+
+
+def stage(name, nbytes=0):
+    """
+    Return a context manager timing one call of a pipeline stage.
+
+    While profiling is off this returns a shared no-op object, so an
+    instrumented call costs one function call and a ``with``.
+    """
+    if _active is None:
+        return _NULL_TIMER
+    return _Timer(_active, name, nbytes)
+
+
+def file(path):
+    """Return a context manager timing all work done for one file."""
+    if _active is None:
+        return _NULL_TIMER
+    return _FileTimer(_active, path)
+
+
+def call_profiled(func, *args):
+    """
+    Run func(*args) under a fresh Profiler.
+
+    Used in worker processes. Returns (result, profile dict) so the
+    parent can merge the profile into its own.
+    """
+    with profile() as profiler:
+        result = func(*args)
+    return result, profiler.to_dict()
+
+
+def write_atomic(path, text):
+    """Write text to path through a temporary file and a rename."""
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
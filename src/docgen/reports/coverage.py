@@ -26,4 +26,44 @@ def generate_coverage_report(functions: list, classes: list) -> dict:
         "documented": documented,
         "missing": missing,
         "coverage": round(coverage, 2)
-    }
\ No newline at end of file
+    }
+
+
+def generate_injected_coverage_report(functions: list, classes: list, injected_lines) -> dict:
+    """
+    Generates the coverage report a file will have after injection.
+
+    Items whose definition line is in injected_lines (as recorded by
+    inject_docstrings on a SourceAnalysis) count as documented, so the
+    injected source does not need to be parsed again.
+    """
+    injected = set(injected_lines)
+
+    def _with_edits(item):
+        """Copy item, marking it documented if a docstring was injected."""
+        if item["has_docstring"] or item.get("lineno") not in injected:
+            return item
+        return dict(item, has_docstring=True)
+
+    updated_classes = [
+        dict(cls, methods=[_with_edits(method) for method in cls["methods"]])
+        for cls in classes
+    ]
+
+    return generate_coverage_report(
+        [_with_edits(func) for func in functions],
+        updated_classes
+    )
+
+
+def quality_grade(coverage) -> str:
+    """
+    Return the letter grade shown for a coverage percentage.
+    """
+    if coverage >= 95:
+        return "A+"
+    elif coverage >= 85:
+        return "A"
+    elif coverage >= 70:
+        return "B"
+    return "C"
@@ -0,0 +1,71 @@
+import json
+
+
+def write_record(out, record):
+    """
+    Write one JSON record on its own line and flush it immediately.
+    """
+    out.write(json.dumps(record, separators=(",", ":")) + "\n")
+    out.flush()
+
+
+def stream_coverage(files, results, out, min_coverage, allow_empty=False, extra=None):
+    """
+    Stream per-file coverage records as NDJSON, then a summary record.
+
+    Only running totals are kept, so memory does not grow with the number
+    of files or undocumented items.
+
+    Args:
+        files: Paths in scan order.
+        results: Iterator of count_items triples matching files.
+        out: Text stream to write to.
+        min_coverage: Threshold used for the summary verdict.
+        allow_empty: Pass when no functions or classes were found.
+        extra: Additional fields for the summary record.
+
+    Returns:
+        int: Process exit code, matching the text report.
+    """
+    total_items = 0
+    documented_items = 0
+    file_count = 0
+
+    for file in files:
+        try:
+            total, documented, missing = next(results)
+        except SyntaxError:
+            write_record(out, {"type": "error", "path": str(file), "error": "syntax error"})
+            return 1
+
+        prefix = len(f"{file.name} -> ")
+        write_record(out, {
+            "type": "file",
+            "path": str(file),
+            "total": total,
+            "documented": documented,
+            "missing": [item[prefix:] for item in missing],
+        })
+
+        file_count += 1
+        total_items += total
+        documented_items += documented
+
+    coverage = (documented_items / total_items * 100) if total_items else 0.0
+    if total_items == 0:
+        passed = allow_empty
+    else:
+        passed = coverage >= min_coverage
+
+    write_record(out, {
+        "type": "summary",
+        "files": file_count,
+        "total": total_items,
+        "documented": documented_items,
+        "missing": total_items - documented_items,
+        "coverage": round(coverage, 2),
+        "threshold": min_coverage,
+        "passed": passed,
+        **(extra or {}),
+    })
+    return 0 if passed else 1
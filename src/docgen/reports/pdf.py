@@ -0,0 +1,274 @@
+import hashlib
+import posixpath
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from docgen.reports.coverage import quality_grade
+
+GRADES = ("A+", "A", "B", "C")
+ROOT_PACKAGE = "(root)"
+CACHE_SIZE = 8
+
+MARGIN = 50
+ROW_HEIGHT = 13
+FONT_SIZE = 9
+MAX_NAME_CHARS = 70
+
+
+def package_of(name):
+    """Return the package (directory) a result row belongs to."""
+    return posixpath.dirname(name.replace("\\", "/")) or ROOT_PACKAGE
+
+
+def _row_key(row):
+    """Sort rows by package, then by file name."""
+    return package_of(row[0]), row[0]
+
+
+def _fit(text, limit=MAX_NAME_CHARS):
+    """Shorten text from the left so it fits in a table cell."""
+    return text if len(text) <= limit else "..." + text[-(limit - 3):]
+
+
+def results_digest(results):
+    """
+    Return a hash of (name, coverage, grade) rows, independent of order.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name, coverage, grade in sorted(results):
+        digest.update(f"{name}\0{coverage}\0{grade}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def aggregate_results(results):
+    """
+    Fold per-file results into report totals and per-package summaries.
+
+    Args:
+        results: Iterable of (name, coverage, grade) rows.
+
+    Returns:
+        dict: files, average, grade, grades (count per grade) and
+        packages, a list of per-package summaries sorted by name.
+    """
+    packages = {}
+    grades = dict.fromkeys(GRADES, 0)
+    files = 0
+    coverage_sum = 0.0
+
+    for name, coverage, grade in results:
+        files += 1
+        coverage_sum += coverage
+        grades[grade] = grades.get(grade, 0) + 1
+
+        package = packages.setdefault(
+            package_of(name),
+            {"files": 0, "coverage_sum": 0.0, "min": coverage},
+        )
+        package["files"] += 1
+        package["coverage_sum"] += coverage
+        package["min"] = min(package["min"], coverage)
+
+    average = coverage_sum / files if files else 0
+    return {
+        "files": files,
+        "average": round(average, 2),
+        "grade": quality_grade(average),
+        "grades": grades,
+        "packages": [
+            {
+                "name": name,
+                "files": package["files"],
+                "average": round(package["coverage_sum"] / package["files"], 2),
+                "min": package["min"],
+            }
+            for name, package in sorted(packages.items())
+        ],
+    }
+
+
+class _PageWriter:
+    """
+    Draws table rows straight onto a reportlab canvas, starting new pages
+    as needed and repeating the current table header on each of them.
+    """
+
+    def __init__(self, pdf, page_size):
+        """Start writing at the top of the first page."""
+        self.pdf = pdf
+        self.width, self.height = page_size
+        self.page = 1
+        self.columns = []
+        self.header = None
+        self.y = self.height - MARGIN
+
+    def _finish_page(self):
+        """Number the current page and move on to the next one."""
+        self.pdf.setFont("Helvetica", 8)
+        self.pdf.drawRightString(self.width - MARGIN, MARGIN / 2, f"Page {self.page}")
+        self.pdf.showPage()
+        self.page += 1
+        self.y = self.height - MARGIN
+
+    def ensure(self, rows):
+        """Start a new page unless rows more rows fit on this one."""
+        if self.y - rows * ROW_HEIGHT < MARGIN:
+            self._finish_page()
+            if self.header is not None:
+                self._cells(self.header, "Helvetica-Bold")
+
+    def title(self, text, size=16):
+        """Write a heading and forget the previous table header."""
+        self.header = None
+        self.ensure(3)
+        self.pdf.setFont("Helvetica-Bold", size)
+        self.y -= size
+        self.pdf.drawString(MARGIN, self.y, text)
+        self.y -= ROW_HEIGHT
+
+    def table(self, columns):
+        """
+        Start a table.
+
+        Args:
+            columns: (title, x, align) triples, where align is "left"
+                or "right" and x is the offset from the left margin.
+        """
+        self.columns = columns
+        self.header = [title for title, _, _ in columns]
+        self.ensure(2)
+        self._cells(self.header, "Helvetica-Bold")
+
+    def row(self, cells):
+        """Write one table row."""
+        self.ensure(1)
+        self._cells(cells, "Helvetica")
+
+    def _cells(self, cells, font):
+        """Draw one line of cells at the current position."""
+        self.pdf.setFont(font, FONT_SIZE)
+        self.y -= ROW_HEIGHT
+        for text, (_, x, align) in zip(cells, self.columns):
+            if align == "right":
+                self.pdf.drawRightString(MARGIN + x, self.y, str(text))
+            else:
+                self.pdf.drawString(MARGIN + x, self.y, str(text))
+
+    def close(self):
+        """Number the last page and write the document."""
+        self._finish_page()
+        self.pdf.save()
+
+
+def write_pdf_report(results, out):
+    """
+    Write a PDF coverage report for (name, coverage, grade) rows.
+
+    The report opens with summary tables (totals, grade distribution and
+    one line per package) followed by one section per package listing
+    its files. Rows are drawn directly on compressed pages rather than
+    built as flowables, so time and memory grow only with the page count.
+
+    Args:
+        results: Iterable of (name, coverage, grade) rows.
+        out: File path or binary stream.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    rows = sorted(results, key=_row_key)
+    summary = aggregate_results(rows)
+
+    writer = _PageWriter(canvas.Canvas(out, pagesize=A4, pageCompression=1), A4)
+    writer.title("Documentation Coverage Report", size=18)
+
+    writer.table([("Metric", 0, "left"), ("Value", 200, "right")])
+    writer.row(["Total files", summary["files"]])
+    writer.row(["Packages", len(summary["packages"])])
+    writer.row(["Average coverage", f"{summary['average']}%"])
+    writer.row(["Overall grade", summary["grade"]])
+    for grade, count in summary["grades"].items():
+        writer.row([f"Files graded {grade}", count])
+
+    writer.title("Packages", size=13)
+    writer.table([
+        ("Package", 0, "left"), ("Files", 370, "right"),
+        ("Average", 430, "right"), ("Minimum", 490, "right"),
+    ])
+    for package in summary["packages"]:
+        writer.row([
+            _fit(package["name"], 65), package["files"],
+            f"{package['average']}%", f"{package['min']}%",
+        ])
+
+    columns = [("File", 0, "left"), ("Coverage", 430, "right"), ("Grade", 460, "left")]
+    current = None
+    for name, coverage, grade in rows:
+        package = package_of(name)
+        if package != current:
+            current = package
+            writer.title(_fit(package), size=12)
+            writer.table(columns)
+        writer.row([_fit(posixpath.basename(name.replace("\\", "/"))), f"{coverage}%", grade])
+
+    writer.close()
+
+
+def render_pdf_report(results) -> bytes:
+    """
+    Return the PDF coverage report for results as bytes.
+    """
+    buffer = BytesIO()
+    write_pdf_report(results, buffer)
+    return buffer.getvalue()
+
+
+class ReportBuilder:
+    """
+    Renders PDF reports on a background thread.
+
+    Reports are cached by results_digest, so asking again for the same
+    results (a UI rerun, for example) returns the finished or in-flight
+    future instead of rendering again. Failed renders are not cached.
+    """
+
+    def __init__(self, cache_size=CACHE_SIZE):
+        """Create the worker thread and an empty report cache."""
+        self.cache_size = cache_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="docgen-pdf")
+        self._reports = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, results):
+        """
+        Return a Future for the PDF bytes of results.
+        """
+        rows = [tuple(row) for row in results]
+        digest = results_digest(rows)
+
+        with self._lock:
+            future = self._reports.get(digest)
+            if future is not None:
+                self._reports.move_to_end(digest)
+                return future
+
+            future = self._executor.submit(render_pdf_report, rows)
+            self._reports[digest] = future
+            while len(self._reports) > self.cache_size:
+                self._reports.popitem(last=False)
+
+        future.add_done_callback(lambda done: self._forget_failed(digest, done))
+        return future
+
+    def _forget_failed(self, digest, future):
+        """Drop a failed render so the next request retries it."""
+        if future.cancelled() or future.exception() is not None:
+            with self._lock:
+                if self._reports.get(digest) is future:
+                    del self._reports[digest]
+
+    def shutdown(self):
+        """Stop the worker thread once queued reports are done."""
+        self._executor.shutdown(wait=True)
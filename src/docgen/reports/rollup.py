@@ -0,0 +1,304 @@
+import ast
+import pathlib
+from collections import deque
+from typing import NamedTuple
+
+ROOT = "root"
+PACKAGE = "package"
+MODULE = "module"
+
+
+class Symbol(NamedTuple):
+    """One counted definition: its dotted qualified name, kind and docstring state."""
+
+    qualname: str
+    kind: str
+    documented: bool
+
+
+def file_symbols(tree):
+    """
+    List the functions and classes of a parsed module, in ast.walk order.
+
+    The same definitions count_items counts (FunctionDef and ClassDef),
+    so the totals of the two always agree. Nested definitions get dotted
+    names such as ``Shape.area`` or ``outer.inner``.
+    """
+    symbols = []
+    queue = deque((child, "") for child in ast.iter_child_nodes(tree))
+    while queue:
+        node, prefix = queue.popleft()
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            qualname = prefix + node.name
+            kind = "class" if isinstance(node, ast.ClassDef) else "function"
+            symbols.append(Symbol(qualname, kind, bool(ast.get_docstring(node))))
+            prefix = qualname + "."
+        queue.extend((child, prefix) for child in ast.iter_child_nodes(node))
+    return symbols
+
+
+def symbol_counts(symbols, filename):
+    """Return the count_items triple (total, documented, missing) for symbols."""
+    missing = [
+        f"{filename} -> {symbol.qualname.rpartition('.')[2]}"
+        for symbol in symbols if not symbol.documented
+    ]
+    return len(symbols), len(symbols) - len(missing), missing
+
+
+class CoverageNode:
+    """
+    Counters for one package, module, class or symbol of a CoverageTree.
+
+    total and documented include everything below the node. A name
+    defined more than once in the same scope shares one node.
+    """
+
+    __slots__ = ("name", "kind", "parent", "children", "total", "documented", "symbols")
+
+    def __init__(self, name, kind, parent=None):
+        """Create an empty node, attached to parent if one is given."""
+        self.name = name
+        self.kind = kind
+        self.parent = parent
+        self.children = {}
+        self.total = 0
+        self.documented = 0
+        self.symbols = None
+        if parent is not None:
+            parent.children[name] = self
+
+    @property
+    def coverage(self) -> float:
+        """Documentation coverage percentage of everything below the node."""
+        return (self.documented / self.total * 100) if self.total else 0.0
+
+    @property
+    def missing(self) -> int:
+        """Number of undocumented definitions below the node."""
+        return self.total - self.documented
+
+    def walk(self):
+        """Yield this node and every node below it, depth first."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(node.children.values())))
+
+    def __repr__(self):
+        """Show the node's kind, name and counters."""
+        return f"CoverageNode({self.kind} {self.name!r}: {self.documented}/{self.total})"
+
+
+def _parts(path):
+    """Split a file path into its directory names and file name."""
+    parts = pathlib.PurePath(path).as_posix().strip("/").split("/")
+    return [part for part in parts if part not in ("", ".")]
+
+
+class CoverageTree:
+    """
+    Coverage counters rolled up from symbols to classes, modules and packages.
+
+    Every directory of a file path is a package node, the file is a
+    module node, and its classes, functions and nested definitions hang
+    below it. Replacing or removing one file rebuilds only that file's
+    nodes and adjusts the counters of its ancestors by the difference,
+    so the cost is the size of the file plus the depth of the tree, and
+    the coverage of any package is always one attribute read away.
+    """
+
+    def __init__(self):
+        """Create an empty tree."""
+        self.root = CoverageNode("", ROOT)
+        self.files = {}
+
+    @property
+    def total(self) -> int:
+        """Number of definitions in the whole tree."""
+        return self.root.total
+
+    @property
+    def documented(self) -> int:
+        """Number of documented definitions in the whole tree."""
+        return self.root.documented
+
+    @property
+    def coverage(self) -> float:
+        """Documentation coverage percentage of the whole tree."""
+        return self.root.coverage
+
+    def __len__(self):
+        """Return the number of files in the tree."""
+        return len(self.files)
+
+    def __contains__(self, path):
+        """Return True if path has been added to the tree."""
+        return str(path) in self.files
+
+    def set_file(self, path, symbols):
+        """
+        Replace the results of one file with a list of Symbol.
+
+        Returns:
+            CoverageNode: The file's module node.
+        """
+        module = self._replace(path)
+        module.symbols = tuple(Symbol(*symbol) for symbol in symbols)
+
+        for qualname, kind, documented in module.symbols:
+            node = module
+            *scopes, name = qualname.split(".")
+            for scope in scopes:
+                node = node.children.get(scope) or CoverageNode(scope, "function", node)
+            symbol = node.children.get(name) or CoverageNode(name, kind, node)
+            while symbol is not module:
+                symbol.total += 1
+                symbol.documented += documented
+                symbol = symbol.parent
+            module.total += 1
+            module.documented += documented
+
+        self._propagate(module.parent, module.total, module.documented)
+        return module
+
+    def set_counts(self, path, total, documented):
+        """
+        Replace the results of one file with bare counts.
+
+        For files whose definitions were counted without being named,
+        such as prefiltered or cached results; the module node then has
+        no children.
+        """
+        module = self._replace(path)
+        module.total = total
+        module.documented = documented
+        self._propagate(module.parent, total, documented)
+        return module
+
+    def remove_file(self, path):
+        """Drop a file and any package left empty; return whether it was present."""
+        module = self.files.pop(str(path), None)
+        if module is None:
+            return False
+        self._detach(module)
+        return True
+
+    def _replace(self, path):
+        """Detach the current node of path, if any, and attach an empty one."""
+        key = str(path)
+        previous = self.files.get(key)
+        if previous is not None:
+            self._detach(previous, prune=False)
+
+        node = self.root
+        *packages, name = _parts(key)
+        for package in packages:
+            node = node.children.get(package) or CoverageNode(package, PACKAGE, node)
+        module = self.files[key] = CoverageNode(name, MODULE, node)
+        return module
+
+    def _detach(self, module, prune=True):
+        """
+        Unlink a module node and subtract its counts from its packages.
+
+        With prune, packages left empty are removed too; a file being
+        replaced keeps them, so nodes held by callers stay live.
+        """
+        parent = module.parent
+        del parent.children[module.name]
+        self._propagate(parent, -module.total, -module.documented)
+
+        while prune and parent is not self.root and not parent.children:
+            del parent.parent.children[parent.name]
+            parent = parent.parent
+
+    @staticmethod
+    def _propagate(node, total, documented):
+        """Add a difference to node and every ancestor of it."""
+        if not (total or documented):
+            return
+        while node is not None:
+            node.total += total
+            node.documented += documented
+            node = node.parent
+
+    def node(self, path="", qualname=None):
+        """
+        Return the node of a package or module path, or of a symbol in it.
+
+        path "" is the root. Raises KeyError if nothing is there.
+        """
+        node = self.root
+        names = _parts(path) + (qualname.split(".") if qualname else [])
+        for name in names:
+            try:
+                node = node.children[name]
+            except KeyError:
+                raise KeyError(f"{path}::{qualname}" if qualname else path) from None
+        return node
+
+    def rows(self, kinds=(PACKAGE, MODULE)):
+        """
+        Yield (path, node) for every node of the given kinds, depth first.
+
+        Paths of symbols are written ``module.py::Class.method``.
+        """
+        stack = [("", self.root)]
+        while stack:
+            path, node = stack.pop()
+            if node.kind in kinds:
+                yield path, node
+
+            if node.kind == MODULE:
+                separator = "::"
+            elif node.kind in (ROOT, PACKAGE):
+                separator = "/"
+            else:
+                separator = "."
+            children = [
+                (f"{path}{separator}{name}" if path else name, child)
+                for name, child in node.children.items()
+            ]
+            stack.extend(reversed(children))
+
+    def merge(self, other):
+        """
+        Add the files of another tree, e.g. one built by a worker or a shard.
+
+        A file present in both is replaced by other's results.
+        """
+        for path, module in other.files.items():
+            if module.symbols is None:
+                self.set_counts(path, module.total, module.documented)
+            else:
+                self.set_file(path, module.symbols)
+        return self
+
+    def to_dict(self) -> dict:
+        """Return the tree as compact JSON-ready data, one entry per file."""
+        files = {}
+        for path, module in self.files.items():
+            if module.symbols is None:
+                files[path] = [module.total, module.documented]
+            else:
+                files[path] = [
+                    [symbol.qualname, symbol.kind, int(symbol.documented)]
+                    for symbol in module.symbols
+                ]
+        return {"files": files}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a tree from data produced by to_dict."""
+        tree = cls()
+        for path, entry in data["files"].items():
+            if entry and isinstance(entry[0], int):
+                tree.set_counts(path, *entry)
+            else:
+                tree.set_file(path, [
+                    Symbol(qualname, kind, bool(documented))
+                    for qualname, kind, documented in entry
+                ])
+        return tree
@@ -0,0 +1,1087 @@
+import ast
+import re
+import string
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import NamedTuple
+
+from docgen.analyzer.parser import analyze
+
+# Message id -> (short description, context template). Ids are the
+# pydocstyle codes, except D401b, the second D401 message.
+MESSAGES = {
+    "D100": ("Missing docstring in public module", None),
+    "D101": ("Missing docstring in public class", None),
+    "D102": ("Missing docstring in public method", None),
+    "D103": ("Missing docstring in public function", None),
+    "D104": ("Missing docstring in public package", None),
+    "D105": ("Missing docstring in magic method", None),
+    "D106": ("Missing docstring in public nested class", None),
+    "D107": ("Missing docstring in __init__", None),
+    "D200": ("One-line docstring should fit on one line with quotes", "found {0}"),
+    "D201": ("No blank lines allowed before function docstring", "found {0}"),
+    "D202": ("No blank lines allowed after function docstring", "found {0}"),
+    "D203": ("1 blank line required before class docstring", "found {0}"),
+    "D204": ("1 blank line required after class docstring", "found {0}"),
+    "D205": ("1 blank line required between summary line and description", "found {0}"),
+    "D206": ("Docstring should be indented with spaces, not tabs", None),
+    "D207": ("Docstring is under-indented", None),
+    "D208": ("Docstring is over-indented", None),
+    "D209": ("Multi-line docstring closing quotes should be on a separate line", None),
+    "D210": ("No whitespaces allowed surrounding docstring text", None),
+    "D211": ("No blank lines allowed before class docstring", "found {0}"),
+    "D212": ("Multi-line docstring summary should start at the first line", None),
+    "D213": ("Multi-line docstring summary should start at the second line", None),
+    "D214": ("Section is over-indented", "{0!r}"),
+    "D215": ("Section underline is over-indented", "in section {0!r}"),
+    "D300": ('Use """triple double quotes"""', "found {0}-quotes"),
+    "D301": ('Use r""" if any backslashes in a docstring', None),
+    "D302": ('Deprecated: Use u""" for Unicode docstrings', None),
+    "D400": ("First line should end with a period", "not {0!r}"),
+    "D401": ("First line should be in imperative mood", "perhaps '{0}', not '{1}'"),
+    "D401b": ("First line should be in imperative mood; try rephrasing", "found '{0}'"),
+    "D402": ('First line should not be the function\'s "signature"', None),
+    "D403": ("First word of the first line should be properly capitalized", "{0!r}, not {1!r}"),
+    "D404": ("First word of the docstring should not be `This`", None),
+    "D405": ("Section name should be properly capitalized", "{0!r}, not {1!r}"),
+    "D406": ("Section name should end with a newline", "{0!r}, not {1!r}"),
+    "D407": ("Missing dashed underline after section", "{0!r}"),
+    "D408": ("Section underline should be in the line following the section's name", "{0!r}"),
+    "D409": (
+        "Section underline should match the length of its name",
+        "Expected {0!r} dashes in section {1!r}, got {2!r}",
+    ),
+    "D410": ("Missing blank line after section", "{0!r}"),
+    "D411": ("Missing blank line before section", "{0!r}"),
+    "D412": ("No blank lines allowed between a section header and its content", "{0!r}"),
+    "D413": ("Missing blank line after last section", "{0!r}"),
+    "D414": ("Section has no content", "{0!r}"),
+    "D415": (
+        "First line should end with a period, question mark, or exclamation point",
+        "not {0!r}",
+    ),
+    "D416": ("Section name should end with a colon", "{0!r}, not {1!r}"),
+    "D417": (
+        "Missing argument descriptions in the docstring",
+        "argument(s) {0} are missing descriptions in {1!r} docstring",
+    ),
+    "D418": ("Function/ Method decorated with @overload shouldn't contain a docstring", None),
+    "D419": ("Docstring is empty", None),
+}
+
+ALL_RULES = frozenset(ident[:4] for ident in MESSAGES)
+PEP257_RULES = ALL_RULES - {
+    "D203", "D212", "D213", "D214", "D215", "D404", "D405", "D406", "D407",
+    "D408", "D409", "D410", "D411", "D413", "D415", "D416", "D417", "D418",
+}
+RELAXED_IGNORE = [
+    "D100",
+    "D201",
+    "D202",
+    "D203",
+    "D204",
+    "D211",
+    "D212",
+    "D401",
+    "D412",
+    "D413",
+]
+STRICT_RULES = PEP257_RULES
+RELAXED_RULES = ALL_RULES - set(RELAXED_IGNORE)
+RULE_SETS = {"strict": STRICT_RULES, "relaxed": RELAXED_RULES}
+
+NUMPY_SECTIONS = (
+    "Short Summary", "Extended Summary", "Parameters", "Returns", "Yields",
+    "Other Parameters", "Raises", "See Also", "Notes", "References",
+    "Examples", "Attributes", "Methods",
+)
+GOOGLE_SECTIONS = (
+    "Args", "Arguments", "Attention", "Attributes", "Caution", "Danger",
+    "Error", "Example", "Examples", "Hint", "Important", "Keyword Args",
+    "Keyword Arguments", "Methods", "Note", "Notes", "Return", "Returns",
+    "Raises", "References", "See Also", "Tip", "Todo", "Warning",
+    "Warnings", "Warns", "Yield", "Yields",
+)
+
+# pydocstyle's imperative-mood word lists.
+IMPERATIVE_VERBS = frozenset("""
+    accept access add adjust aggregate allow append apply archive assert
+    assign attempt authenticate authorize break build cache calculate
+    call cancel capture change check clean clear close collect combine
+    commit compare compute configure confirm connect construct control
+    convert copy count create customize declare decode decorate define
+    delegate delete deprecate derive describe detect determine display
+    download drop dump emit empty enable encapsulate encode end ensure
+    enumerate establish evaluate examine execute exit expand expect
+    export extend extract feed fetch fill filter finalize find fire fix
+    flag force format forward generate get give go group handle help
+    hold identify implement import indicate init initialise initialize
+    initiate input insert instantiate intercept invoke iterate join keep
+    launch list listen load log look make manage manipulate map mark
+    match merge mock modify monitor move normalize note obtain open
+    output override overwrite package pad parse partial pass perform
+    persist pick plot poll populate post prepare print process produce
+    provide publish pull put query raise read record refer refresh
+    register reload remove rename render replace reply report represent
+    request require reset resolve retrieve return roll rollback round
+    run sample save scan search select send serialise serialize serve
+    set show simulate source specify split start step stop store strip
+    submit subscribe sum swap sync synchronise synchronize take tear
+    test time transform translate transmit truncate try turn tweak
+    update upload use validate verify view wait walk wrap write yield
+""".split())
+IMPERATIVE_BLACKLIST = frozenset("""
+    a action always an api base basic business calculation callback
+    collection common constructor convenience convenient current
+    currently custom data default deprecated description dict dictionary
+    does dummy example factory false final formula function generic
+    handler helper here hook implementation importantly internal it main
+    method module new number optional placeholder reference result same
+    schema setup should simple some special sql standard static string
+    subclasses that the these this true unique unit utility what wrapper
+""".split())
+
+# Verbs that double their last consonant although they have more than
+# one syllable (commit -> committed).
+_DOUBLING_VERBS = frozenset((
+    "commit", "control", "emit", "format", "refer", "reset", "submit", "transmit",
+))
+_SHORT_VERB = re.compile(r"[^aeiou]*[aeiou][^aeiouwxy]")
+
+FUNCTION_KINDS = frozenset(("function", "nested function", "method"))
+CLASS_KINDS = frozenset(("class", "nested class"))
+_NESTED_KINDS = {
+    "module": ("function", "class"),
+    "package": ("function", "class"),
+    "function": ("nested function", "nested class"),
+    "nested function": ("nested function", "nested class"),
+    "method": ("nested function", "nested class"),
+    "class": ("method", "nested class"),
+    "nested class": ("method", "nested class"),
+}
+_VARIADIC_MAGIC = ("__init__", "__call__", "__new__")
+_START_QUOTES = ('"""', "'''", 'u"""', "u'''", 'r"""', "r'''", 'ur"""', "ur'''")
+_SECTION_PUNCTUATION = (",", ";", ".", "-", "\\", "/", "]", "}", ")")
+
+_DOCSTRING = re.compile(
+    r'''[uUrR]?(?:"""(?:[^"\\]|\\.|"(?!""))*"""|\'\'\'(?:[^'\\]|\\.|'(?!''))*\'\'\''''
+    r'''|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')''',
+    re.DOTALL,
+)
+_COMMENT = re.compile(r'''(?:[^#'"]|'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*")*(#.*)''')
+_LEADING_SPACE = re.compile(r"\s*")
+_LEADING_WORDS = re.compile(r"[\w ]+")
+_NON_ALPHANUMERIC = re.compile(r"[\W_]+")
+_NESTED_DEFINITION = re.compile(r"\s+(?:(?:class|def|async def)\s|@)")
+_BACKSLASH = re.compile(r"\\[^\nuN]")
+_DOUBLE_QUOTED = re.compile(r'[uU]?[rR]?"""[^"].*')
+_SINGLE_QUOTED = re.compile(r"[uU]?[rR]?'''[^'].*")
+_QUOTES = re.compile(r"""[uU]?[rR]?("+|'+).*""")
+_GOOGLE_ARG = re.compile(r"^\s*(\w+)\s*(\(.*?\))?\s*:\n?\s*.+")
+
+
+class Violation(NamedTuple):
+    """One docstring rule violation; str() gives pydocstyle's report format."""
+
+    filename: str
+    line: int
+    definition: str
+    code: str
+    message: str
+
+    def __str__(self):
+        """Format the violation the way pydocstyle prints it."""
+        return f"{self.filename}:{self.line} {self.definition}:\n        {self.code}: {self.message}"
+
+
+def _inflections(verbs):
+    """
+    Map the regular inflections of each verb back to the verb.
+
+    Covers the forms a docstring summary starts with by mistake:
+    "Returns", "Returned", "Returning" and "Settings".
+    """
+    forms = {}
+    for verb in verbs:
+        consonant_y = verb.endswith("y") and verb[-2] not in "aeiou"
+        doubles = verb in _DOUBLING_VERBS or _SHORT_VERB.fullmatch(verb) is not None
+
+        if verb.endswith(("s", "x", "z", "ch", "sh")):
+            third = verb + "es"
+        elif consonant_y:
+            third = verb[:-1] + "ies"
+        else:
+            third = verb + "s"
+
+        if verb.endswith("e"):
+            past = verb + "d"
+        elif consonant_y:
+            past = verb[:-1] + "ied"
+        elif doubles:
+            past = verb + verb[-1] + "ed"
+        else:
+            past = verb + "ed"
+
+        if verb.endswith("e") and not verb.endswith("ee"):
+            gerund = verb[:-1] + "ing"
+        elif doubles:
+            gerund = verb + verb[-1] + "ing"
+        else:
+            gerund = verb + "ing"
+
+        for form in (third, past, gerund, gerund + "s"):
+            if form not in verbs:
+                forms.setdefault(form, []).append(verb)
+    return forms
+
+
+IMPERATIVE_FORMS = _inflections(IMPERATIVE_VERBS)
+
+
+def _is_blank(text):
+    """Return True if text is empty or whitespace."""
+    return not text.strip()
+
+
+def _leading_space(text):
+    """Return the leading whitespace of text."""
+    return _LEADING_SPACE.match(text).group()
+
+
+def _leading_words(line):
+    """Return the words (and spaces) a stripped line starts with, or None."""
+    match = _LEADING_WORDS.match(line.strip())
+    return match.group() if match is not None else None
+
+
+def _common_prefix_length(a, b):
+    """Return the length of the common prefix of a and b."""
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return length
+
+
+def _noqa(comment):
+    """Return the codes a comment skips: "" for none, "all" for every code."""
+    if "noqa: " in comment:
+        return "".join(comment.split("noqa: ")[1:])
+    if comment.startswith("# noqa"):
+        return "all"
+    return ""
+
+
+def _is_public_name(name):
+    """Return True for a public module or package name."""
+    return not name.startswith("_") or (name.startswith("__") and name.endswith("__"))
+
+
+def _module_is_public(filename):
+    """Return True unless the module or a package above it is private."""
+    path = Path(filename)
+    if not _is_public_name(path.stem):
+        return False
+    syspath = [Path(entry) for entry in sys.path]
+    parent = path.parent
+    while parent != parent.parent and parent not in syspath:
+        if not _is_public_name(parent.name):
+            return False
+        parent = parent.parent
+    return True
+
+
+def _decorator_name(node):
+    """Return the dotted name of a decorator, without its call arguments."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return ""
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def _mentions_all(node):
+    """Return True if an expression or statement refers to __all__."""
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and child.id == "__all__":
+            return True
+        if isinstance(child, ast.Attribute) and child.attr == "__all__":
+            return True
+        if isinstance(child, ast.keyword) and child.arg == "__all__":
+            return True
+    return False
+
+
+def _parenthesized_name(stmt, source):
+    """
+    Return True for ``__all__ = ("name")``.
+
+    pydocstyle evaluates the text between the brackets, which leaves a
+    plain string; names are then looked up in it as substrings.
+    """
+    if not (
+        isinstance(stmt, ast.Assign)
+        and len(stmt.targets) == 1
+        and isinstance(stmt.targets[0], ast.Name)
+        and stmt.targets[0].id == "__all__"
+        and isinstance(stmt.value, ast.Constant)
+        and isinstance(stmt.value.value, str)
+    ):
+        return False
+    segment = ast.get_source_segment(source, stmt)
+    return segment is not None and segment.partition("=")[2].lstrip().startswith("(")
+
+
+def _dunder_all(tree, source):
+    """
+    Return the names in the module's __all__, or None.
+
+    Follows pydocstyle: only a single top-level assignment of a list or
+    tuple of string literals counts; any other top-level use of __all__
+    means public names cannot be known from it.
+    """
+    if "__all__" not in source:
+        return None
+
+    names = None
+    unknown = False
+    for stmt in tree.body:
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.ImportFrom)):
+            continue
+        if (
+            isinstance(stmt, ast.Assign)
+            and len(stmt.targets) == 1
+            and isinstance(stmt.targets[0], ast.Name)
+            and stmt.targets[0].id == "__all__"
+            and isinstance(stmt.value, (ast.List, ast.Tuple))
+            and all(
+                isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                for elt in stmt.value.elts
+            )
+        ) or _parenthesized_name(stmt, source):
+            if names is not None or unknown:
+                names, unknown = None, True
+            elif isinstance(stmt.value, ast.Constant):
+                names = stmt.value.value
+            else:
+                names = tuple(elt.value for elt in stmt.value.elts)
+            continue
+
+        if isinstance(stmt, (ast.If, ast.While)):
+            header = [stmt.test]
+        elif isinstance(stmt, (ast.For, ast.AsyncFor)):
+            header = [stmt.target, stmt.iter]
+        elif isinstance(stmt, (ast.With, ast.AsyncWith)):
+            header = stmt.items
+        elif isinstance(stmt, ast.Match):
+            header = [stmt.subject]
+        elif isinstance(stmt, (ast.Try, ast.TryStar)):
+            header = []
+        else:
+            header = [stmt]
+        if any(_mentions_all(node) for node in header):
+            names, unknown = None, True
+    return names
+
+
+class _Source:
+    """Source text split into lines, with AST positions mapped to offsets."""
+
+    __slots__ = ("text", "lines", "_starts")
+
+    def __init__(self, text):
+        """Split text on newlines, as the tokenizer numbers lines."""
+        self.text = text
+        self.lines = text.split("\n")
+        self._starts = None
+
+    def column(self, lineno, col_offset):
+        """Convert an AST (UTF-8 byte) column to a str index."""
+        line = self.lines[lineno - 1]
+        if line.isascii():
+            return col_offset
+        return len(line.encode("utf-8")[:col_offset].decode("utf-8", "replace"))
+
+    def offset(self, lineno, col_offset):
+        """Return the str offset of an AST position in text."""
+        if self._starts is None:
+            starts = [0]
+            for line in self.lines:
+                starts.append(starts[-1] + len(line) + 1)
+            self._starts = starts
+        return self._starts[lineno - 1] + self.column(lineno, col_offset)
+
+
+class _Definition:
+    """A module, class or function with what the rules need to know about it."""
+
+    __slots__ = (
+        "kind", "name", "node", "parent", "public", "decorators", "skip",
+        "start", "end", "docstring", "text", "doc_start", "doc_end",
+        "indent", "after",
+    )
+
+    def __init__(self, kind, name, node, parent, start, end):
+        """Store where the definition is; the docstring is filled in later."""
+        self.kind = kind
+        self.name = name
+        self.node = node
+        self.parent = parent
+        self.start = start
+        self.end = end
+        self.public = False
+        self.decorators = ()
+        self.skip = ""
+        self.docstring = None
+        self.text = None
+        self.doc_start = self.doc_end = start
+        self.indent = ""
+        self.after = ""
+
+    @property
+    def line(self):
+        """Line reported for violations: the docstring's, else the definition's."""
+        return self.doc_start if self.docstring is not None else self.start
+
+    @property
+    def is_overload(self):
+        """Return True if decorated with @overload."""
+        return "overload" in self.decorators
+
+    @property
+    def is_magic(self):
+        """Return True for dunder methods other than __init__, __call__ and __new__."""
+        return (
+            self.name.startswith("__")
+            and self.name.endswith("__")
+            and self.name not in _VARIADIC_MAGIC
+        )
+
+    def describe(self):
+        """Return the definition as pydocstyle names it in reports."""
+        if self.kind in ("module", "package"):
+            return "at module level"
+        text = f"in {'public' if self.public else 'private'} {self.kind} `{self.name}`"
+        if self.skip:
+            text += f" (skipping {self.skip})"
+        return text
+
+    def read_docstring(self, source, body):
+        """Take the docstring from the first statement of body, if it is one."""
+        first = body[0] if body else None
+        if not isinstance(first, ast.Expr):
+            return
+        offset = source.offset(first.lineno, first.col_offset)
+        match = _DOCSTRING.match(source.text, offset)
+        if match is None:
+            return
+
+        raw = match.group()
+        self.docstring = raw
+        self.text = ast.literal_eval(raw)
+        self.doc_start = first.lineno
+        self.doc_end = first.lineno + raw.count("\n")
+        column = source.column(first.lineno, first.col_offset)
+        self.indent = source.lines[first.lineno - 1][:column]
+        line_end = source.text.find("\n", match.end())
+        self.after = source.text[match.end():line_end if line_end != -1 else None]
+
+
+def _trailing_comment(line):
+    """Return the comment at the end of a code line, or ""."""
+    if "#" not in line:
+        return ""
+    match = _COMMENT.match(line)
+    return match.group(1).rstrip("\r") if match else ""
+
+
+def _definition_skip(source, node):
+    """Return the noqa codes given after a def or class header."""
+    first = node.body[0]
+    lines = source.lines
+    if lines[first.lineno - 1][:source.column(first.lineno, first.col_offset)].strip():
+        return ""
+
+    header = first.lineno - 1
+    while header > node.lineno and (
+        _is_blank(lines[header - 1]) or lines[header - 1].lstrip().startswith("#")
+    ):
+        header -= 1
+
+    comments = [_trailing_comment(lines[header - 1])]
+    comments.extend(
+        line.lstrip().rstrip("\r") for line in lines[header:first.lineno - 1]
+        if line.lstrip().startswith("#")
+    )
+    for comment in comments:
+        skip = _noqa(comment)
+        if skip:
+            return skip
+    return ""
+
+
+def _module_skip(lines):
+    """Return the noqa codes given in the comments heading a module."""
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if not stripped.startswith("#"):
+            break
+        skip = _noqa(line.lstrip().rstrip("\r"))
+        if skip:
+            return skip
+    return ""
+
+
+def _nested_bodies(stmt):
+    """Yield the statement lists inside a compound statement, in source order."""
+    for field in ("body", "handlers", "orelse", "finalbody", "cases"):
+        value = getattr(stmt, field, None)
+        if not value:
+            continue
+        if field in ("handlers", "cases"):
+            for part in value:
+                yield part.body
+        else:
+            yield value
+
+
+def _children(parent, body, source, dunder_all):
+    """Yield the definitions in body and, depth first, the ones inside them."""
+    for stmt in body:
+        if not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            for nested in _nested_bodies(stmt):
+                yield from _children(parent, nested, source, dunder_all)
+            continue
+
+        kind = _NESTED_KINDS[parent.kind][isinstance(stmt, ast.ClassDef)]
+        definition = _Definition(kind, stmt.name, stmt, parent, stmt.lineno, stmt.end_lineno)
+        definition.decorators = tuple(_decorator_name(d) for d in stmt.decorator_list)
+        definition.skip = _definition_skip(source, stmt)
+        definition.public = _is_public(definition, dunder_all)
+        definition.read_docstring(source, stmt.body)
+        yield definition
+        yield from _children(definition, stmt.body, source, dunder_all)
+
+
+def _is_public(definition, dunder_all):
+    """Apply pydocstyle's publicity rules to a class or function."""
+    name = definition.name
+    if definition.kind in ("function", "class"):
+        return name in dunder_all if dunder_all is not None else not name.startswith("_")
+    if definition.kind == "nested class":
+        parent = definition.parent
+        return not name.startswith("_") and parent.kind in CLASS_KINDS and parent.public
+    if definition.kind == "method":
+        if any(decorator.startswith(name + ".") for decorator in definition.decorators):
+            return False
+        name_is_public = (
+            not name.startswith("_") or name in _VARIADIC_MAGIC or definition.is_magic
+        )
+        return definition.parent.public and name_is_public
+    return False
+
+
+def _definitions(analysis, filename, source):
+    """Yield the module and every class and function in it, depth first."""
+    tree = analysis.tree
+    kind = "package" if filename.endswith("__init__.py") else "module"
+    module = _Definition(kind, filename, tree, None, 1, len(source.lines))
+    module.public = _module_is_public(filename)
+    module.skip = _module_skip(source.lines)
+    module.read_docstring(source, tree.body)
+    yield module
+    yield from _children(module, tree.body, source, _dunder_all(tree, analysis.source))
+
+
+def _check_missing(definition, lines):
+    """D10x: public definitions should have docstrings."""
+    if definition.docstring is not None or not definition.public:
+        return
+    kind = definition.kind
+    if kind == "module":
+        yield ("D100",)
+    elif kind == "package":
+        yield ("D104",)
+    elif kind == "class":
+        yield ("D101",)
+    elif kind == "nested class":
+        yield ("D106",)
+    elif kind == "method":
+        if definition.is_magic:
+            yield ("D105",)
+        elif definition.name == "__init__":
+            yield ("D107",)
+        elif not definition.is_overload:
+            yield ("D102",)
+    elif kind == "nested function" or not definition.is_overload:
+        yield ("D103",)
+
+
+def _check_empty(definition, lines):
+    """D419: the docstring should not be empty."""
+    if _is_blank(definition.text):
+        yield ("D419",)
+
+
+def _check_one_liner(definition, lines):
+    """D200: a one-line docstring should fit on one line with its quotes."""
+    text_lines = definition.text.split("\n")
+    if len(text_lines) > 1 and sum(1 for line in text_lines if not _is_blank(line)) == 1:
+        yield ("D200", len(text_lines))
+
+
+def _blanks_around(definition, lines):
+    """
+    Return (blank lines before, blank lines after, code follows) for a docstring.
+
+    Counts within the definition, from its header to its last statement.
+    """
+    before = 0
+    number = definition.doc_start - 1
+    while number >= definition.start and _is_blank(lines[number - 1]):
+        before += 1
+        number -= 1
+
+    following = lines[definition.doc_end:definition.end]
+    after = 0
+    for line in following:
+        if not _is_blank(line):
+            break
+        after += 1
+    return before, after, after < len(following)
+
+
+def _check_function_blanks(definition, lines):
+    """D201, D202: no blank lines around a function docstring."""
+    before, after, code_follows = _blanks_around(definition, lines)
+    if before:
+        yield ("D201", before)
+    if code_follows and after:
+        # One blank line before an inner function or class is fine.
+        following = "\n".join([definition.after] + lines[definition.doc_end:definition.end])
+        if not (after == 1 and _NESTED_DEFINITION.match(following)):
+            yield ("D202", after)
+
+
+def _check_class_blanks(definition, lines):
+    """D211, D203, D204: blank lines around a class docstring."""
+    before, after, code_follows = _blanks_around(definition, lines)
+    if before:
+        yield ("D211", before)
+    if before != 1:
+        yield ("D203", before)
+    if code_follows and after != 1:
+        yield ("D204", after)
+
+
+def _check_blank_after_summary(definition, lines):
+    """D205: one blank line between the summary line and the description."""
+    text_lines = definition.text.strip().split("\n")
+    if len(text_lines) > 1:
+        blanks = 0
+        for line in text_lines[1:]:
+            if not _is_blank(line):
+                break
+            blanks += 1
+        if blanks != 1:
+            yield ("D205", blanks)
+
+
+def _check_indent(definition, lines):
+    """D206, D208, D207: the docstring should be indented like its quotes."""
+    raw_lines = definition.docstring.split("\n")
+    if len(raw_lines) < 2:
+        return
+    indent = definition.indent
+    # The first line and line continuations need no indent.
+    indents = [
+        _leading_space(line)
+        for i, line in enumerate(raw_lines)
+        if i and not raw_lines[i - 1].endswith("\\") and not _is_blank(line)
+    ]
+    if set(" \t") == set("".join(indents) + indent):
+        yield ("D206",)
+    if (len(indents) > 1 and min(indents[:-1]) > indent) or (indents and indents[-1] > indent):
+        yield ("D208",)
+    if indents and min(indents) < indent:
+        yield ("D207",)
+
+
+def _check_closing_quotes(definition, lines):
+    """D209: closing quotes of a multi-line docstring go on their own line."""
+    if sum(1 for line in definition.text.split("\n") if not _is_blank(line)) > 1:
+        if definition.docstring.split("\n")[-1].strip() not in ('"""', "'''"):
+            yield ("D209",)
+
+
+def _check_surrounding_whitespace(definition, lines):
+    """D210: no whitespace around the docstring text."""
+    text_lines = definition.text.split("\n")
+    if text_lines[0].startswith(" ") or (len(text_lines) == 1 and text_lines[0].endswith(" ")):
+        yield ("D210",)
+
+
+def _check_summary_start(definition, lines):
+    """D212, D213: where a multi-line summary starts."""
+    if len(definition.text.split("\n")) > 1:
+        first = definition.docstring.split("\n")[0].strip().lower()
+        yield ("D212",) if first in _START_QUOTES else ("D213",)
+
+
+def _check_quotes(definition, lines):
+    """D300: use triple double quotes, or triple single quotes if the text has triple double quotes."""
+    regex = _SINGLE_QUOTED if '"""' in definition.text else _DOUBLE_QUOTED
+    if not regex.match(definition.docstring):
+        yield ("D300", _QUOTES.match(definition.docstring).group(1))
+
+
+def _check_backslashes(definition, lines):
+    """D301: use a raw docstring if it contains backslashes."""
+    docstring = definition.docstring
+    if _BACKSLASH.search(docstring) and not docstring.startswith(("r", "ur")):
+        yield ("D301",)
+
+
+def _summary_line(definition):
+    """Return the first line of the stripped docstring text."""
+    return definition.text.strip().split("\n")[0]
+
+
+def _check_period(definition, lines):
+    """D400: the first line should end with a period."""
+    summary = _summary_line(definition)
+    if summary and not summary.endswith("."):
+        yield ("D400", summary[-1])
+
+
+def _check_punctuation(definition, lines):
+    """D415: the first line should end with a period, ? or !."""
+    summary = _summary_line(definition)
+    if summary and not summary.endswith((".", "!", "?")):
+        yield ("D415", summary[-1])
+
+
+def _check_imperative_mood(definition, lines):
+    """D401: the first line should be in imperative mood."""
+    name = definition.name
+    stripped = definition.text.strip()
+    if not stripped or name.startswith("test") or name == "runTest":
+        return
+
+    first_word = _NON_ALPHANUMERIC.sub("", stripped.split()[0])
+    check_word = first_word.lower()
+    if check_word in IMPERATIVE_BLACKLIST:
+        yield ("D401b", first_word)
+        return
+
+    verbs = IMPERATIVE_FORMS.get(check_word)
+    if verbs:
+        best = max(sorted(verbs), key=lambda verb: _common_prefix_length(check_word, verb))
+        yield ("D401", best.capitalize(), first_word)
+
+
+def _check_signature(definition, lines):
+    """D402: the first line should not repeat the function's signature."""
+    if definition.name + "(" in _summary_line(definition).replace(" ", ""):
+        yield ("D402",)
+
+
+def _check_capitalized(definition, lines):
+    """D403: the first word should be capitalized."""
+    words = definition.text.split()
+    if not words:
+        return
+    first_word = words[0]
+    if first_word == first_word.upper():
+        return
+    if any(char not in string.ascii_letters and char != "'" for char in first_word):
+        return
+    if first_word != first_word.capitalize():
+        yield ("D403", first_word.capitalize(), first_word)
+
+
+def _check_overload(definition, lines):
+    """D418: @overload stubs should not have docstrings."""
+    if definition.is_overload:
+        yield ("D418",)
+
+
+def _check_starts_with_this(definition, lines):
+    """D404: the docstring should not start with "This"."""
+    stripped = definition.text.strip()
+    if stripped and _NON_ALPHANUMERIC.sub("", stripped.split()[0]).lower() == "this":
+        yield ("D404",)
+
+
+class _Section(NamedTuple):
+    """A section header found in a docstring and the lines under it."""
+
+    name: str
+    previous_line: str
+    line: str
+    following_lines: list
+    index: int
+    is_last: bool
+
+
+def _is_section(section):
+    """Return True if a suspected header really starts a section."""
+    suffix = section.line.strip().lstrip(section.name.strip()).strip()
+    looks_like_name = _is_blank(suffix) or suffix == ":"
+    previous = section.previous_line
+    ends_paragraph = _is_blank(previous) or previous.strip().endswith(_SECTION_PUNCTUATION)
+    return looks_like_name and ends_paragraph
+
+
+def _sections(raw_lines, valid_names):
+    """Return the sections of a docstring whose names are in valid_names."""
+    lower_names = [name.lower() for name in valid_names]
+    found = []
+    for index, line in enumerate(raw_lines):
+        if _leading_words(line.lower()) not in lower_names:
+            continue
+        section = _Section(
+            _leading_words(line.strip()), raw_lines[index - 1], line,
+            raw_lines[index + 1:], index, False,
+        )
+        if _is_section(section):
+            found.append(section)
+
+    sections = []
+    for position, section in enumerate(found):
+        is_last = position == len(found) - 1
+        end = -1 if is_last else found[position + 1].index
+        sections.append(section._replace(
+            following_lines=raw_lines[section.index + 1:end], is_last=is_last,
+        ))
+    return sections
+
+
+def _check_underline(name, section, indentation):
+    """D407, D408, D409, D412, D414, D215: dashed underline under a section name."""
+    following = section.following_lines
+    blanks = 0
+    for line in following:
+        if not _is_blank(line):
+            break
+        blanks += 1
+    else:
+        yield ("D407", name)
+        yield ("D414", name)
+        return
+
+    underline = following[blanks]
+    if "".join(set(underline.strip())) != "-":
+        yield ("D407", name)
+        if blanks > 0:
+            yield ("D412", name)
+        return
+
+    if blanks > 0:
+        yield ("D408", name)
+    if underline.strip() != "-" * len(name):
+        yield ("D409", len(name), name, len(underline.strip()))
+    if _leading_space(underline) > indentation:
+        yield ("D215", name)
+
+    content = blanks + 1
+    if content < len(following):
+        if _is_blank(following[content]):
+            if not _is_blank("".join(following[content:])):
+                yield ("D412", name)
+            else:
+                yield ("D414", name)
+    else:
+        yield ("D414", name)
+
+
+def _check_common_section(definition, section, valid_names):
+    """D405, D214, D413, D410, D411 and the underline checks for one section."""
+    indentation = definition.indent
+    name = section.name.title()
+    if section.name not in valid_names and name in valid_names:
+        yield ("D405", name, section.name)
+    if _leading_space(section.line) > indentation:
+        yield ("D214", name)
+    if not section.following_lines or not _is_blank(section.following_lines[-1]):
+        yield ("D413", name) if section.is_last else ("D410", name)
+    if not _is_blank(section.previous_line):
+        yield ("D411", name)
+    yield from _check_underline(name, section, indentation)
+
+
+def _check_missing_args(definition, documented):
+    """D417: every argument of a function should be described."""
+    if definition.kind not in FUNCTION_KINDS:
+        return
+    arguments = definition.node.args
+    names = [arg.arg for arg in arguments.args + arguments.kwonlyargs]
+    if definition.kind == "method" and "staticmethod" not in definition.decorators:
+        names = names[1:]
+    missing = {name for name in names if not name.startswith("_")} - documented
+    if missing:
+        yield ("D417", ", ".join(sorted(missing)), definition.name)
+
+
+def _check_numpy_parameters(definition, section):
+    """D417 for a NumPy "Parameters" section."""
+    documented = set()
+    indent = _leading_space(section.line)
+    content = "\n".join(section.following_lines).replace("\\\n", "").split("\n")
+    for current, following in zip(content, content[1:]):
+        if (
+            _leading_space(current) == indent
+            and len(_leading_space(following)) > len(_leading_space(current))
+            and following.strip()
+        ):
+            parameters = current.split(":", 1)[0] if ":" in current else current.strip()
+            documented.update(parameter.strip() for parameter in parameters.split(","))
+    yield from _check_missing_args(definition, documented)
+
+
+def _check_google_args(definition, section):
+    """D417 for a Google "Args" section."""
+    following = section.following_lines
+    if following:
+        # Lines indented less than the first one are not argument docs.
+        first = following[0]
+        prefix = first[: -len(first.lstrip())]
+        following = [line for line in following if line.startswith(prefix) or line == ""]
+    content = dedent("\n".join(following)).strip()
+
+    entries = []
+    for line in content.splitlines(keepends=True):
+        if not line[:1].isspace():
+            entries.append(line)
+        else:
+            entries[-1] += line
+
+    documented = set()
+    for entry in entries:
+        match = _GOOGLE_ARG.match(entry)
+        if match:
+            documented.add(match.group(1))
+    yield from _check_missing_args(definition, documented)
+
+
+def _check_sections(definition, lines):
+    """D405-D417, D214, D215: NumPy sections if there are any, else Google ones."""
+    raw_lines = definition.docstring.split("\n")
+    if len(raw_lines) < 2:
+        return
+
+    numpy_sections = _sections(raw_lines, NUMPY_SECTIONS)
+    for section in numpy_sections:
+        yield from _check_common_section(definition, section, NUMPY_SECTIONS)
+        name = section.name.title()
+        suffix = section.line.strip().lstrip(section.name)
+        if suffix:
+            yield ("D406", name, section.line.strip())
+        if name == "Parameters":
+            yield from _check_numpy_parameters(definition, section)
+    if numpy_sections:
+        return
+
+    for section in _sections(raw_lines, GOOGLE_SECTIONS):
+        yield from _check_common_section(definition, section, GOOGLE_SECTIONS)
+        name = section.name.title()
+        suffix = section.line.strip().lstrip(section.name)
+        if suffix != ":":
+            yield ("D416", name + ":", section.line.strip())
+        if name in ("Args", "Arguments"):
+            yield from _check_google_args(definition, section)
+
+
+# Checks run in this order, so violations come out in pydocstyle's order.
+# The first two are terminal: once one reports, the definition is done.
+CHECKS = (
+    (None, _check_missing),
+    (None, _check_empty),
+    (None, _check_one_liner),
+    (FUNCTION_KINDS, _check_function_blanks),
+    (CLASS_KINDS, _check_class_blanks),
+    (None, _check_blank_after_summary),
+    (None, _check_indent),
+    (None, _check_closing_quotes),
+    (None, _check_surrounding_whitespace),
+    (None, _check_summary_start),
+    (None, _check_quotes),
+    (None, _check_backslashes),
+    (None, _check_period),
+    (None, _check_punctuation),
+    (FUNCTION_KINDS, _check_imperative_mood),
+    (FUNCTION_KINDS, _check_signature),
+    (FUNCTION_KINDS, _check_capitalized),
+    (FUNCTION_KINDS, _check_overload),
+    (None, _check_starts_with_this),
+    (None, _check_sections),
+)
+_TERMINAL_CHECKS = 2
+
+
+def _check_definition(definition, lines):
+    """Yield (message id, params) for each violation in one definition."""
+    if definition.skip == "all":
+        return
+    for position, (kinds, check) in enumerate(CHECKS):
+        if definition.docstring is None and position:
+            return
+        if kinds is not None and definition.kind not in kinds:
+            continue
+        for ident, *params in check(definition, lines):
+            if ident[:4] in definition.skip:
+                continue
+            yield ident, params
+            if position < _TERMINAL_CHECKS:
+                return
+
+
+def check_analysis(analysis, filename="<source>", rules=RELAXED_RULES):
+    """
+    Check the docstrings of an already parsed file.
+
+    Runs pydocstyle's checks on the SourceAnalysis tree, with the same
+    codes, messages, line numbers and ``# noqa`` handling, without
+    tokenizing or parsing the file again.
+
+    Args:
+        analysis: A SourceAnalysis.
+        filename: Name used in reports and to tell packages (__init__.py)
+            and private modules apart.
+        rules: The codes to report, e.g. STRICT_RULES or RELAXED_RULES.
+
+    Returns:
+        list: Violation tuples, in file order.
+    """
+    source = _Source(analysis.source)
+    violations = []
+    for definition in _definitions(analysis, filename, source):
+        for ident, params in _check_definition(definition, source.lines):
+            code = ident[:4]
+            if code not in rules:
+                continue
+            description, context = MESSAGES[ident]
+            if context is not None:
+                description += f" ({context.format(*params)})"
+            violations.append(
+                Violation(filename, definition.line, definition.describe(), code, description)
+            )
+    return violations
+
+
+def check_source(source_code, filename="<source>", rules=RELAXED_RULES):
+    """
+    Check the docstrings of a source string or SourceAnalysis.
+
+    Raises SyntaxError if a source string does not parse.
+    """
+    return check_analysis(analyze(source_code), filename, rules)
@@ -1,89 +1,149 @@
-import tempfile
 import os
-from pydocstyle import check
+import tokenize
+from collections.abc import Mapping
 
+from docgen import profiling
+from docgen.analyzer.parser import analyze
+from docgen.reports import rules
+from docgen.reports.rules import RELAXED_IGNORE, RULE_SETS  # noqa: F401
 
-def _normalize_for_strict_pep257(source_code: str) -> str:
-    """Function _normalize_for_strict_pep257."""
-    lines = source_code.splitlines()
-    normalized = []
-    after_class_docstring = False
-    in_class = False
+BACKENDS = ("native", "pydocstyle")
 
-    for i, line in enumerate(lines):
-        stripped = line.strip()
 
-        if stripped.startswith("class "):
-            in_class = True
-            normalized.append(line)
-            continue
+def _rule_set(mode):
+    """
+    Return the codes checked in mode.
 
-        if in_class and stripped.startswith('"""'):
-            normalized.append(line)
-            after_class_docstring = True
-            in_class = False
-            continue
+    mode is a rule-set name ("strict" or "relaxed") or a collection of
+    codes such as {"D103", "D400"}.
+    """
+    if isinstance(mode, str):
+        try:
+            return RULE_SETS[mode]
+        except KeyError:
+            raise ValueError(f"Unknown validation mode: {mode!r}") from None
+    return frozenset(mode)
 
-        if after_class_docstring:
-            normalized.append("")
-            after_class_docstring = False
 
-        if stripped.startswith("def "):
-            normalized.append(line)
-            continue
-
-        if normalized and normalized[-1].strip().startswith(("def ", "class ")) and stripped == "":
-            continue
-
-        normalized.append(line)
+def _check_native(source_code, filename, codes):
+    """Run the built-in rule engine on a source string or SourceAnalysis."""
+    try:
+        analysis = analyze(source_code)
+    except (SyntaxError, ValueError):
+        return ["Cannot parse file."]
 
-    return "\n".join(normalized)
+    with profiling.stage("validate", len(analysis.source)):
+        return [str(violation) for violation in rules.check_analysis(analysis, filename, codes)]
 
 
-def validate_docstrings(source_code: str, mode="relaxed"):
-    """Function validate_docstrings."""
-    if mode == "strict":
-        source_code = _normalize_for_strict_pep257(source_code)
+def _check_pydocstyle(source_code, filename, codes):
+    """
+    Run pydocstyle over in-memory source and return violation strings.
 
-    with tempfile.NamedTemporaryFile(
-        suffix=".py",
-        delete=False,
-        mode="w",
-        encoding="utf-8"
-    ) as temp_file:
-        temp_file.write(source_code)
-        temp_path = temp_file.name
+    Mirrors pydocstyle.check() without requiring the source to exist
+    on disk. Kept as a cross-check of the native engine.
+    """
+    from pydocstyle.checker import ConventionChecker
+    from pydocstyle.parser import AllError, ParseError
 
+    source_code = getattr(source_code, "source", source_code)
     violations = []
 
-    try:
-        if mode == "strict":
-            errors = check([temp_path])
-        else:
-            errors = check(
-                [temp_path],
-                ignore=[
-                    "D100",
-                    "D201",
-                    "D202",
-                    "D203",
-                    "D204",
-                    "D211",
-                    "D212",
-                    "D401",
-                    "D412",
-                    "D413",
-                ]
-            )
-
-        for error in errors:
+    with profiling.stage("validate", len(source_code)):
+        try:
+            for error in ConventionChecker().check_source(source_code, filename):
+                if getattr(error, "code", None) in codes:
+                    violations.append(str(error))
+        except (AllError, ParseError) as error:
             violations.append(str(error))
+        except tokenize.TokenError:
+            violations.append(f"invalid syntax in file {filename}")
+
+    return violations
+
+
+def _check_source(source_code, filename, mode, backend="native"):
+    """Return the violation strings for one source in the given mode."""
+    codes = _rule_set(mode)
+    if backend == "native":
+        return _check_native(source_code, filename, codes)
+    if backend == "pydocstyle":
+        return _check_pydocstyle(source_code, filename, codes)
+    raise ValueError(f"Unknown validation backend: {backend!r}")
 
-    finally:
-        os.remove(temp_path)
 
+def _result(violations):
+    """Wrap a list of violations in the report shape used by the UI."""
     return {
         "status": "Pass" if not violations else "Fail",
         "count": len(violations),
         "violations": violations,
-    }
\ No newline at end of file
+    }
+
+
+def validate_docstrings(source_code, mode="relaxed", filename="<source>", backend="native"):
+    """Function validate_docstrings.
+
+    Accepts either a source string or a SourceAnalysis, whose tree the
+    native backend checks without parsing again. mode is "strict"
+    (pydocstyle's pep257 convention), "relaxed" or a set of codes;
+    backend="pydocstyle" runs pydocstyle itself, if installed, instead.
+    """
+    return _result(_check_source(source_code, filename, mode, backend))
+
+
+def _validate_item(item):
+    """Validate one (name, source) or (path, None) pair in a worker."""
+    name, source_code, mode, backend = item
+
+    if source_code is None:
+        try:
+            with open(name, "r", encoding="utf-8") as f:
+                source_code = f.read()
+        except (OSError, UnicodeDecodeError) as error:
+            return _result([str(error)])
+
+    return _result(_check_source(source_code, name, mode, backend))
+
+
+def validate_many(sources, mode="relaxed", workers=None, chunksize=None, backend="native"):
+    """
+    Validate many files in one call.
+
+    Args:
+        sources: A mapping of name to source text (or SourceAnalysis),
+            validated in memory, or an iterable of file paths.
+        mode: "strict", "relaxed" or a set of codes, as in
+            validate_docstrings.
+        workers: Size of the process pool. Defaults to the CPU count;
+            1 validates in the calling process.
+        chunksize: Items per work unit sent to a worker.
+        backend: "native" or "pydocstyle".
+
+    Returns:
+        A dict mapping each name or path to its status/count/violations
+        report, in input order.
+    """
+    if isinstance(sources, Mapping):
+        items = [
+            (str(name), getattr(source, "source", source), mode, backend)
+            for name, source in sources.items()
+        ]
+    else:
+        items = [(os.fspath(path), None, mode, backend) for path in sources]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(items) <= 1:
+        results = map(_validate_item, items)
+        return {item[0]: result for item, result in zip(items, results)}
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if chunksize is None:
+        chunksize = max(1, len(items) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_validate_item, items, chunksize=chunksize)
+        return {item[0]: result for item, result in zip(items, results)}
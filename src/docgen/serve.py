@@ -0,0 +1,514 @@
+import argparse
+import asyncio
+import collections
+import contextlib
+import http
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from docgen.check_docs import count_items
+from docgen.generator.styled_generator import generate_docstrings
+from docgen.injector.docstring_injector import inject_docstrings
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+BATCH_SIZE = 32
+BATCH_WINDOW = 0.002
+MAX_PENDING = 256
+MAX_BODY_BYTES = 16 * 1024 * 1024
+LATENCY_SAMPLES = 4096
+
+POOL_ENDPOINTS = ("/coverage", "/inject", "/validate")
+INLINE_ENDPOINTS = ("/generate",)
+
+
+class HttpError(Exception):
+    """A request that is answered with an error status."""
+
+    def __init__(self, status, message):
+        """Store the HTTP status and the message sent back to the client."""
+        super().__init__(message)
+        self.status = status
+
+
+def _warm_worker():
+    """Import the analysis modules once in each worker process."""
+    import docgen.reports.validation  # noqa: F401
+
+
+def _ping():
+    """Return the worker pid; used to start every worker before serving."""
+    return os.getpid()
+
+
+def _field(payload, name, types, default=KeyError):
+    """
+    Return payload[name], checking that it has one of the given types.
+
+    A missing field raises KeyError unless a default is given; a field
+    of the wrong type (null included) raises TypeError. run_task answers
+    both with 400.
+    """
+    if name not in payload:
+        if default is KeyError:
+            raise KeyError(name)
+        return default
+    value = payload[name]
+    if not isinstance(value, types):
+        expected = " or ".join(
+            {str: "a string", list: "a list", dict: "an object"}[kind]
+            for kind in (types if isinstance(types, tuple) else (types,))
+        )
+        raise TypeError(f"Field {name!r} must be {expected}")
+    return value
+
+
+def run_task(endpoint, payload):
+    """
+    Answer one request body with the package API.
+
+    Args:
+        endpoint: Request path, e.g. "/coverage".
+        payload: Decoded JSON object sent by the client.
+
+    Returns:
+        tuple: (status, body), an HTTP status code and a JSON-ready dict.
+        Bad input gets a 4xx answer and any other failure a 500; neither
+        raises, so one bad request cannot fail the rest of its batch.
+    """
+    try:
+        if endpoint == "/coverage":
+            filename = _field(payload, "filename", str, "<source>")
+            total, documented, missing = count_items(_field(payload, "source", str), filename)
+            prefix = f"{filename} -> "
+            return 200, {
+                "total": total,
+                "documented": documented,
+                "coverage": round(documented / total * 100, 2) if total else 0,
+                "missing": [item[len(prefix):] for item in missing],
+            }
+
+        if endpoint == "/inject":
+            updated, plan = inject_docstrings(
+                _field(payload, "source", str),
+                _field(payload, "style", str, "Google"),
+                return_plan=True,
+            )
+            return 200, {
+                "source": updated,
+                "edits": [
+                    {"position": edit.position, "lines": list(edit.lines)}
+                    for edit in plan
+                ],
+            }
+
+        if endpoint == "/validate":
+            from docgen.reports.validation import validate_docstrings
+
+            return 200, validate_docstrings(
+                _field(payload, "source", str),
+                _field(payload, "mode", (str, list), "relaxed"),
+                _field(payload, "filename", str, "<source>"),
+            )
+
+        if endpoint == "/generate":
+            functions = _field(payload, "functions", list)
+            if not all(isinstance(function, dict) for function in functions):
+                raise TypeError("Field 'functions' must be a list of objects")
+            return 200, {
+                "docstrings": generate_docstrings(
+                    functions, _field(payload, "style", str, "google")
+                )
+            }
+    except SyntaxError as error:
+        return 422, {"error": f"Syntax error: {error.msg} (line {error.lineno})"}
+    except KeyError as error:
+        return 400, {"error": f"Missing field: {error.args[0]}"}
+    except ImportError as error:
+        return 501, {"error": str(error)}
+    except (TypeError, ValueError) as error:
+        return 400, {"error": str(error)}
+    except Exception as error:
+        return 500, {"error": str(error) or type(error).__name__}
+
+    return 404, {"error": "Not found"}
+
+
+def run_batch(tasks):
+    """Answer a batch of (endpoint, payload) tasks in one worker round trip."""
+    return [run_task(endpoint, payload) for endpoint, payload in tasks]
+
+
+def _percentile(ordered, fraction):
+    """Return the value at fraction of a sorted, non-empty list."""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ServerStats:
+    """
+    Request counters and a window of recent latencies for /stats.
+    """
+
+    def __init__(self):
+        """Start counting from now."""
+        self.started = time.monotonic()
+        self.requests = collections.Counter()
+        self.errors = 0
+        self.rejected = 0
+        self.batches = 0
+        self.batched = 0
+        self.pool_restarts = 0
+        self.latencies = collections.deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, path, status, seconds):
+        """Count one answered request."""
+        self.requests[path] += 1
+        if status >= 400:
+            self.errors += 1
+        self.latencies.append(seconds)
+
+    def snapshot(self) -> dict:
+        """
+        Return throughput and latency figures since the server started.
+
+        Latency percentiles are in milliseconds over the most recent
+        LATENCY_SAMPLES requests.
+        """
+        uptime = time.monotonic() - self.started
+        total = sum(self.requests.values())
+        latency = {}
+        if self.latencies:
+            ordered = sorted(self.latencies)
+            latency = {
+                "p50": round(_percentile(ordered, 0.50) * 1000, 3),
+                "p95": round(_percentile(ordered, 0.95) * 1000, 3),
+                "p99": round(_percentile(ordered, 0.99) * 1000, 3),
+                "max": round(ordered[-1] * 1000, 3),
+            }
+
+        return {
+            "uptime": round(uptime, 3),
+            "requests": total,
+            "by_endpoint": dict(self.requests),
+            "throughput": round(total / uptime, 2) if uptime else 0,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "mean_batch_size": round(self.batched / self.batches, 2) if self.batches else 0,
+            "pool_restarts": self.pool_restarts,
+            "latency_ms": latency,
+        }
+
+
+class AnalysisServer:
+    """
+    Asyncio HTTP server in front of a pre-warmed process pool.
+
+    Parsing requests are queued and handed to the pool in batches of up
+    to batch_size, collected for at most batch_window seconds, with one
+    batch in flight per worker. When max_pending requests are already
+    queued, new ones are refused with 503 so clients back off instead of
+    piling up memory. If a worker dies, the batch it was running fails
+    with 500 and the pool is replaced, so later requests are served.
+    """
+
+    def __init__(
+        self,
+        host=DEFAULT_HOST,
+        port=DEFAULT_PORT,
+        workers=None,
+        batch_size=BATCH_SIZE,
+        batch_window=BATCH_WINDOW,
+        max_pending=MAX_PENDING,
+    ):
+        """Configure the server; nothing starts until start()."""
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.max_pending = max_pending
+        self.stats = ServerStats()
+        self._executor = None
+        self._server = None
+        self._queue = None
+        self._batchers = []
+
+    async def start(self):
+        """Start and warm the worker pool, then listen for connections."""
+        loop = asyncio.get_running_loop()
+        self._start_pool()
+        await asyncio.gather(*[
+            loop.run_in_executor(self._executor, _ping) for _ in range(self.workers)
+        ])
+
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._batchers = [
+            asyncio.create_task(self._batcher()) for _ in range(self.workers)
+        ]
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.stats = ServerStats()
+
+    async def close(self):
+        """Stop listening, cancel queued work and shut the pool down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._batchers:
+            task.cancel()
+        await asyncio.gather(*self._batchers, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    def _start_pool(self):
+        """Create the worker pool; every worker warms up as it starts."""
+        self._executor = ProcessPoolExecutor(self.workers, initializer=_warm_worker)
+
+    def _replace_pool(self, broken):
+        """
+        Replace a pool whose worker died.
+
+        Every batch in flight on the pool fails at once; only the first
+        batcher to notice replaces it.
+        """
+        if self._executor is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._start_pool()
+        self.stats.pool_restarts += 1
+
+    async def _batcher(self):
+        """Feed queued requests to the pool in batches."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            if self.batch_window and self._queue.qsize() < self.batch_size - 1:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            tasks = [(endpoint, payload) for endpoint, payload, _ in batch]
+            executor = self._executor
+            try:
+                results = await loop.run_in_executor(executor, run_batch, tasks)
+            except BrokenProcessPool:
+                results = [(500, {"error": "Worker process died"})] * len(batch)
+                self._replace_pool(executor)
+            except Exception as error:
+                results = [(500, {"error": str(error) or type(error).__name__})] * len(batch)
+
+            self.stats.batches += 1
+            self.stats.batched += len(batch)
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def dispatch(self, method, path, body):
+        """
+        Route one request.
+
+        Returns:
+            tuple: (status, body) as returned by run_task.
+        """
+        if path == "/health":
+            return 200, {"status": "ok", "workers": self.workers}
+        if path == "/stats":
+            return 200, self.stats.snapshot()
+        if path not in POOL_ENDPOINTS + INLINE_ENDPOINTS:
+            raise HttpError(404, "Not found")
+        if method != "POST":
+            raise HttpError(405, "Use POST")
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise HttpError(400, "Invalid JSON") from None
+        if not isinstance(payload, dict):
+            raise HttpError(400, "Request body must be a JSON object")
+
+        if path in INLINE_ENDPOINTS:
+            return run_task(path, payload)
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((path, payload, future))
+        except asyncio.QueueFull:
+            self.stats.rejected += 1
+            raise HttpError(503, "Server busy, retry later") from None
+        return await future
+
+    async def _handle_connection(self, reader, writer):
+        """Serve requests on one connection until it closes."""
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except HttpError as error:
+                    await _write_response(writer, error.status, {"error": str(error)}, False)
+                    break
+                if request is None:
+                    break
+
+                method, path, keep_alive, body = request
+                start = time.perf_counter()
+                try:
+                    status, payload = await self.dispatch(method, path, body)
+                except HttpError as error:
+                    status, payload = error.status, {"error": str(error)}
+                except Exception as error:
+                    status, payload = 500, {"error": str(error) or type(error).__name__}
+                await _write_response(writer, status, payload, keep_alive)
+                self.stats.record(path, status, time.perf_counter() - start)
+
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+async def _read_request(reader):
+    """
+    Read one HTTP request.
+
+    Returns:
+        tuple: (method, path, keep_alive, body), or None when the client
+        closed the connection between requests.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as error:
+        if not error.partial:
+            return None
+        raise
+    except asyncio.LimitOverrunError:
+        raise HttpError(431, "Request headers too large") from None
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HttpError(400, "Malformed request line") from None
+
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name:
+            headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(400, "Invalid Content-Length") from None
+    if length > MAX_BODY_BYTES:
+        raise HttpError(413, "Request body too large")
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+    body = await reader.readexactly(length) if length else b""
+    return method, target.split("?", 1)[0], keep_alive, body
+
+
+async def _write_response(writer, status, payload, keep_alive):
+    """Send a JSON response."""
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    headers = [
+        f"HTTP/1.1 {status} {http.HTTPStatus(status).phrase}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if status == 503:
+        headers.append("Retry-After: 1")
+
+    writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+
+def format_stats(stats):
+    """Return a one-line summary of a ServerStats snapshot."""
+    latency = stats["latency_ms"]
+    line = (
+        f"{stats['requests']} requests in {stats['uptime']:.1f}s "
+        f"({stats['throughput']:.1f}/s), {stats['rejected']} rejected, "
+        f"mean batch {stats['mean_batch_size']}"
+    )
+    if latency:
+        line += f", latency p50 {latency['p50']} ms, p95 {latency['p95']} ms"
+    return line
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, **options):
+    """
+    Run the analysis server until interrupted.
+
+    Keyword options are passed on to AnalysisServer.
+    """
+    server = AnalysisServer(host, port, workers, **options)
+
+    async def run():
+        """Start the server and wait until the task is cancelled."""
+        await server.start()
+        print(
+            f"Serving docgen on http://{server.host}:{server.port} "
+            f"with {server.workers} workers"
+        )
+        sys.stdout.flush()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    print(format_stats(server.stats.snapshot()))
+
+
+def main(argv=None):
+    """
+    Entry point for ``docgen serve``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="docgen serve",
+        description="Serve coverage, injection, generation and validation over HTTP.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST,
+                        help="Interface to bind (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help="Port to listen on (default: 8765; 0 picks a free one).")
+    parser.add_argument("-j", "--workers", type=int, default=0,
+                        help="Worker processes (default: 0, one per CPU).")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="Most requests sent to a worker at once (default: 32).")
+    parser.add_argument("--batch-window", type=float, default=BATCH_WINDOW * 1000,
+                        help="Milliseconds to wait for a batch to fill (default: 2).")
+    parser.add_argument("--max-pending", type=int, default=MAX_PENDING,
+                        help="Queued requests before answering 503 (default: 256).")
+    args = parser.parse_args(argv)
+
+    serve(
+        args.host,
+        args.port,
+        args.workers if args.workers > 0 else None,
+        batch_size=max(1, args.batch_size),
+        batch_window=max(0.0, args.batch_window / 1000),
+        max_pending=max(1, args.max_pending),
+    )
+
+
+if __name__ == "__main__":
+    main()
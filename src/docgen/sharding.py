@@ -0,0 +1,228 @@
+import argparse
+import heapq
+import json
+import os
+import pathlib
+import sys
+
+PARTIAL_FORMAT = 1
+
+
+def parse_shard(text):
+    """
+    Parse a ``i/N`` shard argument into (i, N), with 1 <= i <= N.
+
+    Raises argparse.ArgumentTypeError for anything else, so it can be
+    used directly as an argparse type.
+    """
+    index, _, count = text.partition("/")
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {text!r}") from None
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {text!r} must be i/N with 1 <= i <= N")
+    return index, count
+
+
+def _size(path):
+    """Return the size of path in bytes, or 0 if it cannot be read."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def assign_shards(files, count):
+    """
+    Split files into count groups of roughly equal total size.
+
+    Files are placed largest first, each on the currently lightest
+    shard (ties go to the lower shard number). The result depends only
+    on the paths and sizes, not on walk order or machine, so every CI
+    runner computes the same split independently.
+
+    Returns:
+        list: For each shard, the indexes into files it owns, ascending.
+    """
+    sizes = [_size(file) for file in files]
+    order = sorted(range(len(files)), key=lambda i: (-sizes[i], os.fspath(files[i])))
+    loads = [(0, shard) for shard in range(count)]
+    shards = [[] for _ in range(count)]
+
+    for index in order:
+        load, shard = heapq.heappop(loads)
+        shards[shard].append(index)
+        heapq.heappush(loads, (load + sizes[index], shard))
+
+    for indexes in shards:
+        indexes.sort()
+    return shards
+
+
+def shard_files(files, shard):
+    """
+    Return (indexes, files) of one shard given as an (i, N) pair.
+
+    indexes are the positions of the shard's files in the full list,
+    which a partial report records so the merge restores walk order.
+    """
+    index, count = shard
+    indexes = assign_shards(files, count)[index - 1]
+    return indexes, [files[i] for i in indexes]
+
+
+def partial_report(shard, file_count, indexes, files, results, threshold, walk=None):
+    """
+    Collect a shard's count_items results into a compact partial report.
+
+    Scanning stops at the first file that does not parse, as the full
+    check does; the merge reports the earliest such file of all shards.
+
+    Args:
+        shard: The (i, N) pair that was scanned.
+        file_count: Number of files in the whole tree.
+        indexes: Positions of files in the whole tree.
+        files: The shard's paths.
+        results: Iterator of count_items triples matching files.
+        threshold: Coverage threshold for the merged verdict.
+        walk: Optional WalkStats dict of the whole tree.
+
+    Returns:
+        dict: JSON-ready report; see merge_reports.
+    """
+    entries = []
+    error = None
+    for index, file in zip(indexes, files):
+        try:
+            total, documented, missing = next(results)
+        except SyntaxError:
+            error = [index, str(file)]
+            break
+        prefix = len(f"{pathlib.Path(file).name} -> ")
+        entries.append([index, str(file), total, documented, [item[prefix:] for item in missing]])
+
+    return {
+        "format": PARTIAL_FORMAT,
+        "shard": list(shard),
+        "files": file_count,
+        "threshold": threshold,
+        "walk": walk,
+        "results": entries,
+        "error": error,
+    }
+
+
+def write_report(report, path=None):
+    """Write a partial report to path atomically, or to stdout if path is None."""
+    text = json.dumps(report, separators=(",", ":")) + "\n"
+    if path is None:
+        sys.stdout.write(text)
+        return
+
+    from docgen.profiling import write_atomic
+
+    write_atomic(path, text)
+
+
+class MergeError(Exception):
+    """Raised when partial reports do not add up to one whole-tree run."""
+
+
+def merge_reports(reports):
+    """
+    Combine the partial reports of every shard of one run.
+
+    Checks that the reports come from the same split, that every shard
+    appears exactly once and that, unless a file failed to parse, each
+    file of the tree was counted.
+
+    Returns:
+        dict: total, documented, missing (items in walk order, as
+        count_items labels them), error (the first unparsable path, or
+        None), threshold and walk.
+    """
+    if not reports:
+        raise MergeError("no partial reports given")
+
+    first = reports[0]
+    seen = set()
+    for report in reports:
+        if report.get("format") != PARTIAL_FORMAT:
+            raise MergeError(f"unsupported partial report format: {report.get('format')!r}")
+        index, count = report["shard"]
+        if (count, report["files"]) != (first["shard"][1], first["files"]):
+            raise MergeError("partial reports come from different splits or trees")
+        if index in seen:
+            raise MergeError(f"shard {index}/{count} given more than once")
+        seen.add(index)
+
+    count = first["shard"][1]
+    errors = [report["error"] for report in reports if report["error"] is not None]
+    entries = sorted(entry for report in reports for entry in report["results"])
+
+    absent = sorted(set(range(1, count + 1)) - seen)
+    if absent:
+        raise MergeError(f"missing shard(s): {', '.join(f'{i}/{count}' for i in absent)}")
+    if not errors and len(entries) != first["files"]:
+        raise MergeError(f"expected {first['files']} files, got {len(entries)}")
+
+    missing = []
+    for _, path, _, _, names in entries:
+        prefix = f"{pathlib.Path(path).name} -> "
+        missing.extend(prefix + name for name in names)
+
+    return {
+        "total": sum(entry[2] for entry in entries),
+        "documented": sum(entry[3] for entry in entries),
+        "missing": missing,
+        "error": min(errors)[1] if errors else None,
+        "threshold": first["threshold"],
+        "walk": first["walk"],
+    }
+
+
+def main(argv=None):
+    """
+    Entry point for ``docgen merge``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="docgen merge",
+        description="Combine the partial reports of a sharded run into one "
+                    "coverage report and verdict.",
+    )
+    parser.add_argument("reports", nargs="+", metavar="REPORT",
+                        help="Partial report files written with --shard.")
+    args = parser.parse_args(argv)
+
+    reports = []
+    for path in args.reports:
+        try:
+            with open(path, encoding="utf-8") as f:
+                reports.append(json.load(f))
+        except (OSError, ValueError) as exc:
+            print(f"Cannot read partial report {path}: {exc}")
+            sys.exit(2)
+
+    try:
+        merged = merge_reports(reports)
+    except MergeError as exc:
+        print(f"Cannot merge partial reports: {exc}")
+        sys.exit(2)
+
+    if merged["error"] is not None:
+        print(f"Syntax error in file: {merged['error']}")
+        sys.exit(1)
+
+    from docgen.check_docs import print_report
+    from docgen.discovery import WalkStats
+
+    walk = WalkStats.from_dict(merged["walk"]) if merged["walk"] is not None else None
+    print_report(
+        merged["total"], merged["documented"], merged["missing"],
+        merged["threshold"], walk,
+    )
+
+
+if __name__ == "__main__":
+    main()
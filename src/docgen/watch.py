@@ -0,0 +1,304 @@
+import argparse
+import ast
+import os
+import pathlib
+import queue
+import sys
+import threading
+import time
+
+from docgen.check_docs import CHUNKS_PER_WORKER, SRC_DIR
+from docgen.reports.rollup import CoverageTree, file_symbols, symbol_counts
+
+DEBOUNCE_SECONDS = 0.05
+POLL_INTERVAL = 0.5
+# watchdog event types that can change a file's contents; opens and
+# reads (including the watcher's own) are ignored.
+CHANGE_EVENTS = frozenset({"created", "modified", "deleted", "moved", "closed"})
+
+
+class CoverageIndex:
+    """
+    In-memory per-file coverage results with running totals.
+
+    Updating one file adjusts the totals by that file's delta, so the
+    repository coverage is known without rescanning anything. The same
+    results are rolled up per package, module and class in ``tree``.
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        self.files = {}
+        self.total = 0
+        self.documented = 0
+        self.tree = CoverageTree()
+
+    @property
+    def coverage(self) -> float:
+        """Documentation coverage percentage across all indexed files."""
+        return (self.documented / self.total * 100) if self.total else 0.0
+
+    def update(self, path, result, symbols=None):
+        """
+        Store the count_items result for path and return the previous one.
+
+        symbols, the file's Symbol list, breaks the file down by class and
+        function in the tree; without it only the file's counts are kept.
+        """
+        previous = self.files.get(path, (0, 0, []))
+        self.files[path] = result
+        self.total += result[0] - previous[0]
+        self.documented += result[1] - previous[1]
+        if symbols is None:
+            self.tree.set_counts(path, result[0], result[1])
+        else:
+            self.tree.set_file(path, symbols)
+        return previous
+
+    def remove(self, path):
+        """Drop path from the index and return its last result."""
+        previous = self.files.pop(path, (0, 0, []))
+        self.total -= previous[0]
+        self.documented -= previous[1]
+        self.tree.remove_file(path)
+        return previous
+
+
+def analyze_symbols(path):
+    """
+    Return the Symbol list of path, or None if it is gone or does not parse.
+    """
+    try:
+        source = pathlib.Path(path).read_text(encoding="utf-8")
+        return file_symbols(ast.parse(source))
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+        return None
+
+
+def build_index(root, workers=1):
+    """Scan every Python file below root once and index the results."""
+    index = CoverageIndex()
+    files = [str(path) for path in pathlib.Path(root).rglob("*.py")]
+
+    if workers > 1 and len(files) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(files) // (workers * CHUNKS_PER_WORKER))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(analyze_symbols, files, chunksize=chunksize))
+    else:
+        results = map(analyze_symbols, files)
+
+    for path, symbols in zip(files, results):
+        if symbols is None:
+            print(f"Syntax error in file: {path}")
+        else:
+            index.update(path, symbol_counts(symbols, pathlib.Path(path).name), symbols)
+
+    return index
+
+
+def _snapshot(root):
+    """Return {path: (mtime_ns, size)} for every Python file below root."""
+    snapshot = {}
+    for path in pathlib.Path(root).rglob("*.py"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        snapshot[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class PollingWatcher:
+    """
+    Fallback watcher that compares stat snapshots of the tree.
+    """
+
+    def __init__(self, root, changes, interval=POLL_INTERVAL):
+        """Watch root, putting changed paths onto the changes queue."""
+        self.root = root
+        self.changes = changes
+        self.interval = interval
+        self._stop = threading.Event()
+        self._previous = _snapshot(root)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def poll(self):
+        """Queue every path added, removed or modified since the last poll."""
+        current = _snapshot(self.root)
+        for path in current.keys() | self._previous.keys():
+            if current.get(path) != self._previous.get(path):
+                self.changes.put(path)
+        self._previous = current
+
+    def _run(self):
+        """Poll until stopped."""
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def start(self):
+        """Start polling in a background thread."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop polling."""
+        self._stop.set()
+
+
+def _native_watcher(root, changes):
+    """
+    Return a started watchdog observer (inotify on Linux), or None if
+    watchdog is not installed.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    absolute = os.path.isabs(str(root))
+
+    class _Handler(FileSystemEventHandler):
+        """Forward Python file events to the changes queue."""
+
+        def on_any_event(self, event):
+            """Queue the source and destination paths of a change event."""
+            if event.is_directory or event.event_type not in CHANGE_EVENTS:
+                return
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if path and str(path).endswith(".py"):
+                    path = os.fsdecode(path)
+                    changes.put(os.path.abspath(path) if absolute else os.path.relpath(path))
+
+    observer = Observer()
+    observer.schedule(_Handler(), str(root), recursive=True)
+    observer.start()
+    return observer
+
+
+def apply_changes(index, paths):
+    """
+    Re-analyze the changed paths and update the index.
+
+    Yields (path, previous, current, before, after) for every path whose
+    result changed, where current is None for files that were removed
+    or no longer parse, and before/after are the coverage percentages.
+    """
+    for path in sorted(paths):
+        before = index.coverage
+        symbols = analyze_symbols(path)
+        result = None if symbols is None else symbol_counts(symbols, pathlib.Path(path).name)
+
+        if result is None:
+            if path not in index.files:
+                if os.path.exists(path):
+                    yield path, (0, 0, []), None, before, before
+                continue
+            previous = index.remove(path)
+        else:
+            previous = index.update(path, result, symbols)
+
+        if previous != result:
+            yield path, previous, result, before, index.coverage
+
+
+def format_update(path, previous, current, before, after):
+    """Return the report lines for one file change."""
+    if current is None:
+        status = "syntax error" if os.path.exists(path) else "removed"
+        lines = [f"{path}: {status}"]
+    else:
+        delta = current[1] - previous[1]
+        lines = [f"{path}: {current[1]}/{current[0]} documented ({delta:+d})"]
+        for item in sorted(set(current[2]) - set(previous[2])):
+            lines.append(f"   + {item}")
+        for item in sorted(set(previous[2]) - set(current[2])):
+            lines.append(f"   - {item}")
+
+    lines.append(f"   coverage {after:.2f}% ({after - before:+.2f}%)")
+    return lines
+
+
+def _drain(changes, first):
+    """Collect paths arriving within the debounce window after first."""
+    paths = {first}
+    deadline = time.monotonic() + DEBOUNCE_SECONDS
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return paths
+        try:
+            paths.add(changes.get(timeout=remaining))
+        except queue.Empty:
+            return paths
+
+
+def watch(root=SRC_DIR, workers=1, poll=False, interval=POLL_INTERVAL):
+    """
+    Index root, then print coverage deltas whenever files change.
+    """
+    index = build_index(root, workers)
+    print(
+        f"Watching {root}: {len(index.files)} files, "
+        f"{index.documented}/{index.total} documented, "
+        f"coverage {index.coverage:.2f}%"
+    )
+    sys.stdout.flush()
+
+    changes = queue.Queue()
+    observer = None if poll else _native_watcher(root, changes)
+    poller = None
+    if observer is None:
+        poller = PollingWatcher(root, changes, interval)
+        poller.start()
+
+    try:
+        while True:
+            paths = _drain(changes, changes.get())
+
+            start = time.perf_counter()
+            updates = list(apply_changes(index, paths))
+            elapsed = (time.perf_counter() - start) * 1000
+
+            for update in updates:
+                for line in format_update(*update):
+                    print(line)
+            if updates:
+                print(f"   [{len(paths)} file(s) re-checked in {elapsed:.1f} ms]")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        if poller is not None:
+            poller.stop()
+
+
+def main(argv=None):
+    """
+    Entry point for ``docgen watch``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="docgen watch",
+        description="Re-check changed files and print live coverage deltas.",
+    )
+    parser.add_argument("root", nargs="?", default=SRC_DIR,
+                        help="Directory to watch (default: src).")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="Worker processes for the initial scan.")
+    parser.add_argument("--poll", action="store_true",
+                        help="Use stat polling instead of native file events.")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL,
+                        help="Polling interval in seconds (default: 0.5).")
+    args = parser.parse_args(argv)
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    watch(args.root, workers, args.poll, args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import ast
+
+from docgen.analyzer.parser import analyze, parse_code
+from docgen.injector.docstring_injector import inject_docstrings
+from docgen.reports.coverage import (
+    generate_coverage_report,
+    generate_injected_coverage_report,
+)
+
+SOURCE = """
+def add(a, b):
+    return a + b
+
+
+class Shape:
+    \"\"\"A shape.\"\"\"
+
+    def area(self):
+        return 0
+
+    def name(self):
+        \"\"\"Return the name.\"\"\"
+        return "shape"
+"""
+
+
+def test_analysis_parses_once(monkeypatch):
+    """Test that every stage reuses the tree of a SourceAnalysis."""
+    analysis = analyze(SOURCE)
+    calls = []
+    original_parse = ast.parse
+    monkeypatch.setattr(ast, "parse", lambda *a, **k: calls.append(a) or original_parse(*a, **k))
+
+    parse_code(analysis)
+    inject_docstrings(analysis)
+
+    assert calls == []
+    assert analyze(analysis) is analysis
+
+
+def test_injected_coverage_matches_reparse():
+    """Test that coverage from recorded edits equals a fresh parse."""
+    analysis = analyze(SOURCE)
+    functions, classes = parse_code(analysis)
+    updated = inject_docstrings(analysis)
+
+    from_edits = generate_injected_coverage_report(
+        functions, classes, analysis.injected_lines
+    )
+    reparsed = generate_coverage_report(*parse_code(updated))
+
+    assert analysis.injected_lines == [2, 9]
+    assert from_edits == reparsed
+    assert generate_coverage_report(functions, classes)["documented"] == 1
+
+
+def test_records_behave_like_dicts():
+    """Test that slotted records keep the old dict interface."""
+    functions, classes = parse_code(SOURCE)
+    add = functions[0]
+    shape = classes[0]
+
+    assert add["name"] == add.name == "add"
+    assert list(add["params"]) == ["a", "b"]
+    assert add.get("missing") is None
+    assert dict(add) == add == {
+        "name": "add",
+        "params": ["a", "b"],
+        "has_docstring": False,
+        "type": "function",
+        "lineno": 2,
+    }
+    assert shape == shape.to_dict()
+    assert [m["name"] for m in shape["methods"]] == ["area", "name"]
+    assert not hasattr(add, "__dict__")
+
+
+def test_records_round_trip_through_dicts():
+    """Test that to_dict/from_dict preserve every field."""
+    from docgen.analyzer.parser import ClassRecord
+
+    _, classes = parse_code(SOURCE)
+    data = classes[0].to_dict()
+
+    assert data["methods"][0]["params"] == ["self"]
+    assert ClassRecord.from_dict(data).to_dict() == data
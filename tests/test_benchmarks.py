@@ -0,0 +1,35 @@
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "benchmarks"))
+
+from corpus import generate_corpus
+from run import compare
+
+
+def test_corpus_is_deterministic():
+    """Test that the same seed and scale produce the same corpus."""
+    first = generate_corpus(seed=3, scale=0.05)
+    second = generate_corpus(seed=3, scale=0.05)
+
+    assert first == second
+    assert any(name.startswith("huge/") for name, _ in first)
+    assert generate_corpus(seed=4, scale=0.05) != first
+
+
+def test_compare_flags_regressions():
+    """Test that only stages slower than the threshold are reported."""
+    baseline = {"stages": {
+        "parse_code": {"lines_per_s": 1000.0},
+        "count_items": {"lines_per_s": 1000.0},
+    }}
+    results = {
+        "parse_code": {"lines_per_s": 700.0},
+        "count_items": {"lines_per_s": 800.0},
+        "inject_docstrings": {"lines_per_s": 1.0},
+    }
+
+    regressions = compare(results, baseline, threshold=0.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("parse_code")
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from docgen import check_docs
+from docgen.cache import AnalysisCache, cached_parse_code
+from docgen.check_docs import scan_files, scan_files_cached
+
+
+def _make_files(root):
+    """Create two small modules and return their paths."""
+    first = root / "first.py"
+    first.write_text("def first():\n    pass\n", encoding="utf-8")
+    second = root / "second.py"
+    second.write_text('def second():\n    """Doc."""\n', encoding="utf-8")
+    return [first, second]
+
+
+def test_warm_run_matches_cold_run(tmp_path):
+    """Test that cached results equal a fresh scan and are hits."""
+    files = _make_files(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    cache = AnalysisCache(cache_dir)
+    cold = list(scan_files_cached(files, cache))
+    cache.save()
+
+    warm_cache = AnalysisCache(cache_dir)
+    warm = list(scan_files_cached(files, warm_cache))
+
+    assert cold == warm == list(scan_files(files))
+    assert warm_cache.hits == 2
+    assert warm_cache.misses == 0
+
+
+def test_changed_file_is_reanalyzed(tmp_path):
+    """Test that editing a file invalidates its entry."""
+    files = _make_files(tmp_path)
+    cache = AnalysisCache(tmp_path / "cache")
+    list(scan_files_cached(files, cache))
+
+    files[0].write_text('def first():\n    """Now documented."""\n', encoding="utf-8")
+    stat = os.stat(files[0])
+    os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    results = list(scan_files_cached(files, cache))
+
+    assert results[0] == (1, 1, [])
+    assert cache.misses == 3
+
+
+def test_eviction_respects_entry_limit(tmp_path):
+    """Test that the least recently used entries are evicted on save."""
+    files = _make_files(tmp_path)
+    cache = AnalysisCache(tmp_path / "cache", max_entries=1)
+    list(scan_files_cached(files, cache))
+    cache.save()
+
+    reloaded = AnalysisCache(tmp_path / "cache")
+    assert reloaded.lookup(files[0], "count_items") is None
+    assert reloaded.lookup(files[1], "count_items") == [1, 1, []]
+
+
+def test_cached_parse_code(tmp_path):
+    """Test that parse_code results round-trip through the cache."""
+    files = _make_files(tmp_path)
+    cache = AnalysisCache(tmp_path / "cache")
+
+    functions, classes = cached_parse_code(cache, files[1])
+    again, _ = cached_parse_code(cache, files[1])
+
+    assert functions == again
+    assert functions[0]["name"] == "second"
+    assert classes == []
+    assert cache.hits == 1
+
+
+def test_prefiltered_results_do_not_serve_full_runs(tmp_path, monkeypatch, capsys):
+    """Test that a --prefilter run's cache does not hide a later syntax error."""
+    src = tmp_path / "src"
+    src.mkdir()
+    _make_files(src)
+    (src / "broken.py").write_text("x = (\n", encoding="utf-8")
+    monkeypatch.setattr(check_docs, "SRC_DIR", str(src))
+    cache_args = ["--cache-dir", str(tmp_path / "cache")]
+
+    with pytest.raises(SystemExit):
+        check_docs.main([*cache_args, "--prefilter"])
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit) as exc_info:
+        check_docs.main(cache_args)
+
+    assert exc_info.value.code == 1
+    assert f"Syntax error in file: {src / 'broken.py'}" in capsys.readouterr().out
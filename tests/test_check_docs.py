@@ -0,0 +1,161 @@
+import shutil
+import subprocess
+
+import pytest
+from docgen import check_docs
+from docgen.check_docs import scan_files
+
+
+def _write_tree(root, count=12):
+    """Create a small source tree with a mix of documented items."""
+    files = []
+    for i in range(count):
+        path = root / f"module_{i}.py"
+        body = f"def func_{i}():\n"
+        if i % 3 == 0:
+            body += '    """Documented."""\n'
+        body += "    return 1\n"
+        path.write_text(body, encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def test_parallel_scan_matches_serial(tmp_path):
+    """Test that the process pool yields the same results in the same order."""
+    files = _write_tree(tmp_path)
+
+    serial = list(scan_files(files, workers=1))
+    parallel = list(scan_files(files, workers=2, chunksize=3))
+
+    assert parallel == serial
+
+
+def test_main_parallel_output_matches_serial(tmp_path, monkeypatch, capsys):
+    """Test that main prints the same report and exit code in both modes."""
+    _write_tree(tmp_path)
+    monkeypatch.setattr(check_docs, "SRC_DIR", str(tmp_path))
+
+    with pytest.raises(SystemExit) as serial_exit:
+        check_docs.main([])
+    serial_out = capsys.readouterr().out
+
+    with pytest.raises(SystemExit) as parallel_exit:
+        check_docs.main(["--workers", "2", "--chunksize", "2"])
+    parallel_out = capsys.readouterr().out
+
+    assert serial_exit.value.code == parallel_exit.value.code == 1
+    assert parallel_out == serial_out
+    assert "Undocumented items:" in serial_out
+
+
+def test_main_parallel_reports_syntax_error(tmp_path, monkeypatch, capsys):
+    """Test that a syntax error is reported for the offending file."""
+    _write_tree(tmp_path, count=4)
+    broken = tmp_path / "broken.py"
+    broken.write_text("def broken(:\n", encoding="utf-8")
+    monkeypatch.setattr(check_docs, "SRC_DIR", str(tmp_path))
+
+    with pytest.raises(SystemExit) as exc_info:
+        check_docs.main(["--workers", "2"])
+
+    assert exc_info.value.code == 1
+    assert f"Syntax error in file: {broken}" in capsys.readouterr().out
+
+
+def test_count_changed_items_only_counts_overlapping_spans():
+    """Test that only definitions touching a changed range are counted."""
+    source = (
+        "def untouched():\n"
+        "    pass\n"
+        "\n"
+        "@decorator\n"
+        "def changed():\n"
+        "    return 1\n"
+        "\n"
+        "class Edited:\n"
+        '    """Doc."""\n'
+        "    value = 2\n"
+    )
+
+    total, documented, missing = check_docs.count_changed_items(
+        source, "mod.py", [(4, 4), (10, 10)]
+    )
+
+    assert (total, documented) == (2, 1)
+    assert missing == ["mod.py -> changed"]
+
+
+def test_parse_diff_ranges():
+    """Test hunk parsing for additions, modifications and deletions."""
+    from docgen.git_diff import parse_diff
+
+    diff = (
+        "diff --git a/src/a.py b/src/a.py\n"
+        "--- a/src/a.py\n"
+        "+++ b/src/a.py\n"
+        "@@ -3,0 +4,2 @@ def f():\n"
+        "@@ -10 +12 @@ def g():\n"
+        "@@ -20,3 +21,0 @@\n"
+        "diff --git a/src/gone.py b/src/gone.py\n"
+        "--- a/src/gone.py\n"
+        "+++ /dev/null\n"
+        "@@ -1,2 +0,0 @@\n"
+        "+++ b/src/with space.py\t\n"
+        "@@ -1 +1 @@\n"
+        '+++ "b/src/tab\\there\\"\\303\\251.py"\n'
+        "@@ -0,0 +1 @@\n"
+    )
+
+    assert parse_diff(diff) == {
+        "src/a.py": [(4, 5), (12, 12), (21, 21)],
+        "src/with space.py": [(1, 1)],
+        'src/tab\there"\u00e9.py': [(1, 1)],
+    }
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_since_ignores_diff_prefix_config(tmp_path, monkeypatch, capsys):
+    """Test that --since finds changes when diff.noprefix is set."""
+    def git(*args):
+        """Run git in the temporary repository."""
+        subprocess.run(
+            ["git", "-c", "user.name=docgen", "-c", "user.email=docgen@example.com", *args],
+            cwd=tmp_path, check=True, capture_output=True,
+        )
+
+    module = tmp_path / "src" / "with space.py"
+    module.parent.mkdir()
+    module.write_text('def kept():\n    """Doc."""\n', encoding="utf-8")
+    git("init", "-q")
+    git("config", "diff.noprefix", "true")
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    module.write_text(module.read_text(encoding="utf-8") + "\n\ndef added():\n    pass\n",
+                      encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(check_docs, "SRC_DIR", "src")
+
+    with pytest.raises(SystemExit) as exc_info:
+        check_docs.main(["--since", "HEAD"])
+
+    assert exc_info.value.code == 1
+    assert " - with space.py -> added" in capsys.readouterr().out
+
+
+def test_ndjson_stream_matches_text_report(tmp_path, monkeypatch, capsys):
+    """Test that NDJSON records carry the same totals and verdict."""
+    import json
+
+    _write_tree(tmp_path, count=6)
+    monkeypatch.setattr(check_docs, "SRC_DIR", str(tmp_path))
+
+    with pytest.raises(SystemExit) as exc_info:
+        check_docs.main(["--format", "ndjson", "--workers", "2"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert exc_info.value.code == 1
+    assert [r["type"] for r in records] == ["file"] * 6 + ["summary"]
+    summary = records[-1]
+    assert (summary["total"], summary["documented"], summary["passed"]) == (6, 2, False)
+    missing = [name for r in records[:-1] for name in r["missing"]]
+    assert sorted(missing) == sorted(f"func_{i}" for i in range(6) if i % 3)
@@ -0,0 +1,79 @@
+import os
+
+from docgen.config import config_loader
+from docgen.config.config_loader import DEFAULT_CONFIG, ConfigResolver
+
+
+def _write_config(directory, body):
+    """Write a pyproject.toml with a docstring_analyzer table."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "pyproject.toml"
+    path.write_text(f"[tool.docstring_analyzer]\n{body}\n", encoding="utf-8")
+    return path
+
+
+def test_nested_projects_merge_over_outer_layers(tmp_path):
+    """Test that the nearest project overrides enclosing ones key by key."""
+    _write_config(tmp_path, 'docstring_style = "numpy"\nmin_coverage = 90')
+    _write_config(tmp_path / "packages" / "inner", "min_coverage = 50")
+    module = tmp_path / "packages" / "inner" / "src" / "mod.py"
+    module.parent.mkdir(parents=True)
+    module.write_text("", encoding="utf-8")
+    resolver = ConfigResolver()
+
+    inner = resolver.resolve(module)
+    outer = resolver.resolve_directory(tmp_path / "packages")
+
+    assert (inner["docstring_style"], inner["min_coverage"]) == ("numpy", 50)
+    assert (outer["docstring_style"], outer["min_coverage"]) == ("numpy", 90)
+    assert inner["validation_mode"] == DEFAULT_CONFIG["validation_mode"]
+    assert resolver.resolve(module.parent / "other.py") is inner
+
+
+def test_config_files_are_parsed_once(tmp_path, monkeypatch):
+    """Test that resolving many files parses each config file once."""
+    _write_config(tmp_path, 'docstring_style = "rest"')
+    calls = []
+    original = config_loader.tomllib.load
+    monkeypatch.setattr(
+        config_loader.tomllib, "load", lambda f: calls.append(f.name) or original(f)
+    )
+    resolver = ConfigResolver(check_interval=0)
+
+    for index in range(50):
+        assert resolver.resolve(tmp_path / f"m{index}.py")["docstring_style"] == "rest"
+
+    assert len(calls) == 1
+
+
+def test_changes_are_picked_up_by_mtime(tmp_path):
+    """Test that edited, added and removed config files take effect."""
+    resolver = ConfigResolver(check_interval=0)
+    module = tmp_path / "pkg" / "mod.py"
+    module.parent.mkdir()
+
+    config = _write_config(tmp_path, 'docstring_style = "numpy"')
+    assert resolver.resolve(module)["docstring_style"] == "numpy"
+
+    config.write_text('[tool.docstring_analyzer]\ndocstring_style = "rest"\n', encoding="utf-8")
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert resolver.resolve(module)["docstring_style"] == "rest"
+
+    _write_config(module.parent, 'docstring_style = "google"')
+    assert resolver.resolve(module)["docstring_style"] == "google"
+
+    (module.parent / "pyproject.toml").unlink()
+    assert resolver.resolve(module)["docstring_style"] == "rest"
+
+
+def test_load_config_fills_defaults(tmp_path, monkeypatch):
+    """Test that load_config returns a full, modifiable dict for the cwd."""
+    _write_config(tmp_path, 'docstring_style = "numpy"')
+    monkeypatch.chdir(tmp_path)
+
+    config = config_loader.load_config()
+    config["min_coverage"] = 0
+
+    assert config["docstring_style"] == "numpy"
+    assert config_loader.load_config()["min_coverage"] == DEFAULT_CONFIG["min_coverage"]
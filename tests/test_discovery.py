@@ -0,0 +1,57 @@
+import pathlib
+
+from docgen.discovery import PathMatcher, WalkStats, walk_files
+
+
+def _touch(root, *paths):
+    """Create files (with a few bytes each) below root."""
+    for path in paths:
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("x = 1\n", encoding="utf-8")
+
+
+def test_walk_matches_rglob_order(tmp_path):
+    """Test that the walker lists files exactly like rglob("*.py")."""
+    _touch(tmp_path, "b.py", "a.py", "pkg/z.py", "pkg/sub/y.py", "other/x.py", "notes.txt")
+
+    assert walk_files(tmp_path, exclude=()) == list(pathlib.Path(tmp_path).rglob("*.py"))
+
+
+def test_excluded_directories_are_pruned(tmp_path):
+    """Test pattern kinds, virtualenv detection and the skip counters."""
+    _touch(
+        tmp_path,
+        "keep.py", "pkg/mod.py", "pkg/mod_test.py",
+        "vendor/lib.py", "pkg/vendor/inner.py",
+        "build/gen.py", "pkg/build/kept.py",
+        "env/lib/site.py", ".git/hooks/hook.py",
+    )
+    (tmp_path / "env" / "pyvenv.cfg").write_text("", encoding="utf-8")
+    stats = WalkStats()
+
+    files = walk_files(
+        tmp_path,
+        exclude=(".git/", "vendor/", "/build", "*_test.py"),
+        stats=stats,
+    )
+
+    assert [f.relative_to(tmp_path).as_posix() for f in files] == [
+        "keep.py", "pkg/mod.py", "pkg/build/kept.py",
+    ]
+    assert (stats.files, stats.skipped_files, stats.skipped_bytes) == (3, 1, 6)
+    assert stats.pruned_dirs == 5
+
+
+def test_matcher_patterns():
+    """Test anchoring, double stars, character classes and ancestor checks."""
+    matcher = PathMatcher(["docs/**/*.py", "gen_[0-9].py", "# comment", "tmp/"])
+
+    assert matcher.matches("docs/a/b/c.py")
+    assert matcher.matches("docs/c.py")
+    assert not matcher.matches("src/docs/c.py")
+    assert matcher.matches("deep/gen_3.py")
+    assert not matcher.matches("gen_x.py")
+    assert not matcher.matches("tmp")
+    assert matcher.matches("tmp", is_dir=True)
+    assert matcher.excludes("a/tmp/b.py")
@@ -4,3 +4,42 @@ def test_generate_docstring_structure():
     func = {"name": "add", "params": ["a", "b"]}
     doc = generate_google_style(func)
     assert "Args:" in doc
+
+
+def test_generate_docstrings_batch_matches_single():
+    from generator.styled_generator import generate_docstring, generate_docstrings
+    funcs = [
+        {"name": "add", "params": ["a", "b"]},
+        {"name": "run", "params": []},
+        {"name": "add", "params": ["a", "b"]},
+    ]
+    for style in ("google", "NumPy", "rest"):
+        assert generate_docstrings(funcs, style) == [
+            generate_docstring(func, style) for func in funcs
+        ]
+
+
+def test_register_custom_style():
+    import pytest
+    from generator.styled_generator import (
+        DocstringFormatter, STYLES, generate_docstring, register_style
+    )
+    register_style("Short", DocstringFormatter('"""{name}: {params}."""', "{param}"))
+    try:
+        assert generate_docstring({"name": "add", "params": ["a"]}, "short") == '"""add: a."""'
+    finally:
+        STYLES.pop("short")
+    with pytest.raises(ValueError):
+        generate_docstring({"name": "add", "params": []}, "short")
+
+
+def test_inline_lines_for_injection():
+    from generator.styled_generator import get_style
+    lines = get_style("google").render_lines("add", ["a"])
+    assert lines == (
+        '"""', "add function.", "", "Args:", "    a: Description.",
+        "", "Returns:", "    Description.", '"""',
+    )
+    assert get_style("google").render_lines("Shape", is_class=True) == (
+        '"""', "Shape class.", '"""',
+    )
@@ -0,0 +1,36 @@
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "scripts"))
+
+import inject_docs
+
+
+def test_bulk_injection_rewrites_only_changed_files(tmp_path):
+    """Test that documented files are left untouched and others rewritten."""
+    documented = tmp_path / "documented.py"
+    documented.write_text('def ok():\n    """Doc."""\n', encoding="utf-8")
+    missing = tmp_path / "missing.py"
+    missing.write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    before = documented.stat().st_mtime_ns
+
+    results = {path: changed for path, changed, _, error in inject_docs.run(
+        [str(documented), str(missing)], workers=2
+    )}
+
+    assert results == {str(documented): False, str(missing): True}
+    assert documented.stat().st_mtime_ns == before
+    assert '"""add.' in missing.read_text(encoding="utf-8")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["documented.py", "missing.py"]
+
+
+def test_syntax_errors_are_reported_not_raised(tmp_path):
+    """Test that a broken file is reported and left as it was."""
+    broken = tmp_path / "broken.py"
+    broken.write_text("def broken(:\n", encoding="utf-8")
+
+    path, changed, _, error = inject_docs.process_file(str(broken))
+
+    assert not changed
+    assert error.startswith("SyntaxError")
+    assert broken.read_text(encoding="utf-8") == "def broken(:\n"
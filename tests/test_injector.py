@@ -0,0 +1,56 @@
+from docgen.analyzer.parser import analyze
+from docgen.injector.docstring_injector import inject_docstrings, splice_lines
+
+SOURCE = """
+class Shape:
+    def area(self):
+        return 0
+
+    def name(self):
+        \"\"\"Return the name.\"\"\"
+        return "shape"
+
+
+def add(a, b):
+    return a + b"""
+
+
+def _insert_per_line(lines, inserts):
+    """Reference implementation that inserts one line at a time."""
+    lines = list(lines)
+    for lineno, doc_lines in sorted(inserts, reverse=True):
+        for line in reversed(doc_lines):
+            lines.insert(lineno, line)
+    return lines
+
+
+def test_splice_matches_insert_per_line():
+    """Test that the single pass equals repeated list.insert calls."""
+    lines = [f"line {i}" for i in range(10)]
+    inserts = [(3, ["a", "b"]), (0, ["start"]), (10, ["end"]), (3, ["A"]), (7, [])]
+
+    assert splice_lines(lines, inserts) == _insert_per_line(lines, inserts)
+
+
+def test_inject_docstrings_output():
+    """Test the exact text produced for classes, methods and functions."""
+    updated = inject_docstrings(SOURCE)
+
+    assert updated.splitlines()[1:4] == [
+        "class Shape:",
+        '    """',
+        "    Shape class.",
+    ]
+    assert updated.count('"""') == 8
+    assert updated.endswith("        Description.\n    \"\"\"\n    return a + b")
+
+
+def test_edit_plan_reproduces_injected_text():
+    """Test that applying the returned plan gives the injected source."""
+    analysis = analyze(SOURCE)
+    updated, plan = inject_docstrings(analysis, return_plan=True)
+
+    assert updated == inject_docstrings(SOURCE)
+    assert [edit.position for edit in plan] == analysis.injected_lines == [2, 3, 11]
+    assert "\n".join(splice_lines(SOURCE.splitlines(), plan)) == updated
+    assert plan[0].lines[:2] == ('    """', "    Shape class.")
@@ -0,0 +1,179 @@
+import io
+
+from docgen.lsp import Document, LanguageServer, read_message, write_message
+
+URI = "file:///tmp/example.py"
+SOURCE = (
+    "def documented():\n"
+    '    """Doc."""\n'
+    "\n"
+    "\n"
+    "def bare(a,\n"
+    "         b):\n"
+    "    return a + b\n"
+    "\n"
+    "\n"
+    "class Shape: pass\n"
+)
+
+
+def _frame(*messages):
+    """Encode messages as an LSP input stream."""
+    stream = io.BytesIO()
+    for message in messages:
+        write_message(stream, dict(message, jsonrpc="2.0"))
+    stream.seek(0)
+    return stream
+
+
+def _read_all(stream):
+    """Decode every message written to stream."""
+    stream.seek(0)
+    messages = []
+    while True:
+        message = read_message(stream)
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+def test_document_diagnostics_and_actions():
+    """Test diagnostics and edits for multi-line and one-line headers."""
+    document = Document(URI, SOURCE)
+    document.refresh("google")
+
+    diagnostics = document.diagnostics()
+    assert [d["message"] for d in diagnostics] == [
+        "Function 'bare' has no docstring",
+        "Class 'Shape' has no docstring",
+    ]
+    assert diagnostics[0]["range"]["start"] == {"line": 4, "character": 4}
+
+    actions = document.code_actions(0, 20)
+    assert [action["title"] for action in actions] == ["Insert docstring for 'bare'"]
+    edit = actions[0]["edit"]["changes"][URI][0]
+    assert edit["range"]["start"] == {"line": 6, "character": 0}
+    assert edit["newText"].startswith('    """\n    bare function.\n')
+
+
+def test_stale_analysis_only_offers_unchanged_definitions():
+    """Test that edits are withheld once the definition has moved."""
+    document = Document(URI, SOURCE)
+    document.refresh("google")
+
+    document.update(SOURCE + "x = 1\n")
+    assert len(document.code_actions(4, 4)) == 1
+
+    document.update("# moved\n" + SOURCE)
+    assert document.code_actions(0, 20) == []
+
+    document.refresh("google")
+    assert len(document.code_actions(5, 5)) == 1
+
+
+def test_server_session():
+    """Test a full initialize, open, code action and shutdown exchange."""
+    reader = _frame(
+        {"id": 1, "method": "initialize", "params": {"capabilities": {}}},
+        {"method": "initialized", "params": {}},
+        {"method": "textDocument/didOpen", "params": {"textDocument": {
+            "uri": URI, "languageId": "python", "version": 1, "text": SOURCE,
+        }}},
+        {"id": 2, "method": "textDocument/codeAction", "params": {
+            "textDocument": {"uri": URI},
+            "range": {"start": {"line": 4, "character": 0}, "end": {"line": 4, "character": 0}},
+            "context": {"diagnostics": []},
+        }},
+        {"id": 3, "method": "textDocument/hover", "params": {}},
+        {"id": 4, "method": "shutdown"},
+        {"method": "exit"},
+    )
+    writer = io.BytesIO()
+
+    assert LanguageServer(reader, writer).run() == 0
+
+    messages = _read_all(writer)
+    assert messages[0]["result"]["capabilities"]["textDocumentSync"]["change"] == 1
+    published = messages[1]
+    assert published["method"] == "textDocument/publishDiagnostics"
+    assert len(published["params"]["diagnostics"]) == 2
+    assert messages[2]["id"] == 2
+    assert messages[2]["result"][0]["kind"] == "quickfix"
+    assert messages[3]["error"]["code"] == -32601
+    assert messages[4] == {"jsonrpc": "2.0", "id": 4, "result": None}
+
+
+def test_changes_are_reanalyzed_after_debounce():
+    """Test that a change is analyzed once its debounce delay has passed."""
+    reader = _frame(
+        {"method": "textDocument/didOpen", "params": {"textDocument": {
+            "uri": URI, "version": 1, "text": SOURCE,
+        }}},
+        {"method": "textDocument/didChange", "params": {
+            "textDocument": {"uri": URI, "version": 2},
+            "contentChanges": [{"text": SOURCE + "\ndef extra():\n    pass\n"}],
+        }},
+        {"id": 1, "method": "shutdown"},
+        {"method": "exit"},
+    )
+    writer = io.BytesIO()
+
+    LanguageServer(reader, writer, debounce=0).run()
+
+    published = [m["params"] for m in _read_all(writer) if m.get("method")]
+    assert [(p["version"], len(p["diagnostics"])) for p in published] == [(1, 2), (2, 3)]
+
+
+def test_bad_style_and_failing_handlers_keep_server_running(tmp_path, capsys):
+    """Test that an unknown style falls back and handler errors are contained."""
+    (tmp_path / "pyproject.toml").write_text("[tool.docstring_analyzer\n", encoding="utf-8")
+    broken_uri = (tmp_path / "module.py").as_uri()
+    reader = _frame(
+        {"id": 1, "method": "initialize", "params": {
+            "capabilities": {}, "initializationOptions": {"style": "nope"},
+        }},
+        {"method": "textDocument/didOpen", "params": {"textDocument": {
+            "uri": URI, "version": 1, "text": SOURCE,
+        }}},
+        {"id": 2, "method": "textDocument/codeAction", "params": {
+            "textDocument": {"uri": URI},
+        }},
+        {"id": 3, "method": "shutdown"},
+        {"method": "exit"},
+    )
+    writer = io.BytesIO()
+
+    assert LanguageServer(reader, writer).run() == 0
+
+    messages = _read_all(writer)
+    assert len(messages[1]["params"]["diagnostics"]) == 2
+    assert messages[2]["error"]["code"] == -32603
+    assert messages[3] == {"jsonrpc": "2.0", "id": 3, "result": None}
+    assert "unsupported docstring style 'nope'" in capsys.readouterr().err
+
+    server = LanguageServer(io.BytesIO(), io.BytesIO())
+    assert server._style_for(broken_uri) == "google"
+
+    configured = tmp_path / "configured"
+    configured.mkdir()
+    (configured / "pyproject.toml").write_text(
+        '[tool.docstring_analyzer]\ndocstring_style = "bogus"\n', encoding="utf-8"
+    )
+    assert server._style_for((configured / "module.py").as_uri()) == "google"
+
+
+def test_malformed_messages_get_errors_and_reading_goes_on():
+    """Test that invalid JSON and non-object bodies are answered, not fatal."""
+    reader = io.BytesIO()
+    for body in (b"{not json", b"[1, 2]"):
+        reader.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    write_message(reader, {"jsonrpc": "2.0", "id": 1, "method": "shutdown"})
+    write_message(reader, {"jsonrpc": "2.0", "method": "exit"})
+    reader.seek(0)
+    writer = io.BytesIO()
+
+    assert LanguageServer(reader, writer).run() == 0
+
+    messages = _read_all(writer)
+    assert [m["id"] for m in messages] == [None, None, 1]
+    assert [m.get("error", {}).get("code") for m in messages] == [-32700, -32600, None]
@@ -0,0 +1,44 @@
+import pytest
+
+from docgen.reports.pdf import ReportBuilder, aggregate_results, results_digest
+
+ROWS = [
+    ("pkg/a.py", 100.0, "A+"),
+    ("pkg/b.py", 50.0, "C"),
+    ("pkg/sub/c.py", 80.0, "B"),
+    ("top.py", 90.0, "A"),
+]
+
+
+def test_aggregate_results_groups_by_package():
+    """Test report totals and per-package summaries."""
+    summary = aggregate_results(ROWS)
+
+    assert (summary["files"], summary["average"], summary["grade"]) == (4, 80.0, "B")
+    assert summary["grades"] == {"A+": 1, "A": 1, "B": 1, "C": 1}
+    assert [(p["name"], p["files"], p["average"], p["min"]) for p in summary["packages"]] == [
+        ("(root)", 1, 90.0, 90.0),
+        ("pkg", 2, 75.0, 50.0),
+        ("pkg/sub", 1, 80.0, 80.0),
+    ]
+
+
+def test_results_digest_ignores_order():
+    """Test that the cache key depends on the rows, not their order."""
+    assert results_digest(ROWS) == results_digest(reversed(ROWS))
+    assert results_digest(ROWS) != results_digest(ROWS[:-1])
+
+
+def test_builder_renders_in_background_and_caches():
+    """Test that equal results share one rendered report."""
+    pytest.importorskip("reportlab")
+    builder = ReportBuilder()
+    try:
+        rows = ROWS * 500
+        first = builder.submit(rows)
+        second = builder.submit(list(reversed(rows)))
+
+        assert second is first
+        assert first.result(timeout=30).startswith(b"%PDF")
+    finally:
+        builder.shutdown()
@@ -0,0 +1,47 @@
+import pytest
+from docgen.analyzer.prefilter import quick_count
+from docgen.check_docs import count_items
+
+CONCLUSIVE = [
+    "VALUE = 1\nNAMES = ['a', 'b']\n",
+    '"""Module."""\n\n\ndef add(a, b):\n    """Add."""\n    return a + b\n',
+    'class A:\n    """Doc.\n\n    def fake(): inside a docstring\n    """\n\n'
+    '    def m(self):  # comment\n        # note\n        """Doc."""\n',
+    'async def run():\n    """Run."""\n\n\ndef sync():\n    r"""Raw."""\n',
+    'def f(a="x:#", b={1: 2}) -> "T":  # note\n    """Doc."""\n',
+]
+
+FALLBACK = [
+    "def add(a, b):\n    return a + b\n",
+    'def empty():\n    """   """\n',
+    'def one(): """Doc."""\n',
+    'def data():\n    b"""Bytes are not docstrings."""\n',
+    'def concat():\n    """Doc.""" + "x"\n',
+    'TEXT = """\ndef hidden():\n"""\n\n\ndef real():\n    """Doc."""\n',
+    "# def commented_out():\nx = 1\n",
+    'def wrapped(a,\n            b):\n    """Doc."""\n',
+    'def f(): return {"key":\n    """value"""\n}\n',
+    'def noted(  # note:\n    a):\n    """Doc."""\n',
+    'def sliced(): return x[1:\n    """value"""\n]\n',
+]
+
+
+@pytest.mark.parametrize("source", CONCLUSIVE)
+def test_conclusive_scans_match_full_parse(source):
+    """Test that a conclusive scan equals the AST-based count."""
+    total, documented, missing = count_items(source)
+
+    assert quick_count(source) == (total, documented)
+    assert missing == []
+
+
+@pytest.mark.parametrize("source", FALLBACK)
+def test_unclear_files_fall_back_to_parse(source):
+    """Test that anything the scan cannot prove is parsed instead."""
+    assert quick_count(source) is None
+
+
+@pytest.mark.parametrize("source", CONCLUSIVE + FALLBACK)
+def test_count_items_prefilter_matches_full_parse(source):
+    """Test that enabling the prefilter never changes the result."""
+    assert count_items(source, "m.py", prefilter=True) == count_items(source, "m.py")
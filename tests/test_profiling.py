@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from docgen import check_docs, profiling
+from docgen.injector.docstring_injector import inject_docstrings
+
+SOURCE = "def bare(a):\n    return a\n"
+
+
+def test_stages_are_recorded_only_while_profiling():
+    """Test that instrumented calls are counted inside profile() only."""
+    inject_docstrings(SOURCE)
+    assert profiling.current() is None
+
+    with profiling.profile() as profiler:
+        check_docs.count_items(SOURCE)
+        inject_docstrings(SOURCE)
+
+    assert profiling.current() is None
+    stages = profiler.to_dict()["stages"]
+    assert stages["parse"]["calls"] == 2
+    assert stages["parse"]["bytes"] == 2 * len(SOURCE)
+    assert stages["count"]["calls"] == stages["generate"]["calls"] == stages["inject"]["calls"] == 1
+
+
+def test_merge_and_slowest_files():
+    """Test merging worker profiles and keeping only the slowest files."""
+    profiler = profiling.Profiler(slowest=2)
+    worker = profiling.Profiler()
+    worker.add("parse", 0.5, 10)
+    for index, seconds in enumerate([0.1, 0.4, 0.2]):
+        worker.add_file(f"f{index}.py", seconds)
+
+    profiler.add("parse", 0.25, 5)
+    profiler.merge(worker.to_dict())
+
+    data = profiler.to_dict()
+    assert data["stages"]["parse"] == {
+        "calls": 2, "seconds": 0.75, "bytes": 15, "max_seconds": 0.5,
+    }
+    assert [item["path"] for item in data["slowest_files"]] == ["f1.py", "f2.py"]
+
+
+def test_prometheus_text():
+    """Test the exposition format, including label escaping."""
+    profiler = profiling.Profiler()
+    profiler.add("read", 0.5, 3)
+    profiler.add_file('odd"name.py', 0.5)
+
+    text = profiler.to_prometheus()
+
+    assert "# TYPE docgen_stage_seconds_total counter" in text
+    assert 'docgen_stage_bytes_total{stage="read"} 3' in text
+    assert 'docgen_slowest_file_seconds{path="odd\\"name.py"} 0.500000' in text
+
+
+def test_main_exports_profile_from_workers(tmp_path, monkeypatch):
+    """Test that --profile-json includes stages timed in worker processes."""
+    for index in range(4):
+        (tmp_path / f"m{index}.py").write_text('"""Doc."""\n', encoding="utf-8")
+    monkeypatch.setattr(check_docs, "SRC_DIR", str(tmp_path))
+    output = tmp_path / "profile.json"
+
+    with pytest.raises(SystemExit):
+        check_docs.main(["--workers", "2", "--profile-json", str(output)])
+
+    data = json.loads(output.read_text(encoding="utf-8"))
+    assert data["stages"]["read"]["calls"] == 4
+    assert len(data["slowest_files"]) == 4
+    assert profiling.current() is None
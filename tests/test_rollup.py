@@ -0,0 +1,100 @@
+import ast
+
+import pytest
+
+from docgen.check_docs import count_items
+from docgen.reports.rollup import CoverageTree, Symbol, file_symbols, symbol_counts
+
+SOURCE = '''
+class Shape:
+    """A shape."""
+
+    def area(self):
+        return 0
+
+    def describe(self):
+        """Describe the shape."""
+
+        def helper():
+            pass
+
+
+def main():
+    pass
+'''
+
+
+def test_symbols_match_count_items():
+    """Test that symbol counts equal count_items, missing order included."""
+    symbols = file_symbols(ast.parse(SOURCE))
+
+    assert [symbol.qualname for symbol in symbols] == [
+        "Shape", "main", "Shape.area", "Shape.describe", "Shape.describe.helper",
+    ]
+    assert symbol_counts(symbols, "shapes.py") == count_items(SOURCE, "shapes.py")
+
+
+def test_counters_roll_up_through_every_level():
+    """Test that class, module and package nodes sum the symbols below them."""
+    tree = CoverageTree()
+    tree.set_file("pkg/sub/shapes.py", file_symbols(ast.parse(SOURCE)))
+    tree.set_file("pkg/util.py", [Symbol("run", "function", True)])
+
+    assert (tree.total, tree.documented) == (6, 3)
+    assert (tree.node("pkg").total, tree.node("pkg").documented) == (6, 3)
+    assert tree.node("pkg/sub").coverage == 40.0
+    assert tree.node("pkg/sub/shapes.py", "Shape").total == 4
+    assert tree.node("pkg/sub/shapes.py", "Shape.describe").missing == 1
+    assert [path for path, _ in tree.rows()] == [
+        "pkg", "pkg/sub", "pkg/sub/shapes.py", "pkg/util.py",
+    ]
+
+
+def test_replacing_a_file_updates_ancestors_only_by_its_delta():
+    """Test that set_file replaces a file's results instead of adding them."""
+    tree = CoverageTree()
+    tree.set_file("pkg/a.py", [Symbol("f", "function", False)])
+    tree.set_file("pkg/b.py", [Symbol("g", "function", True)])
+
+    tree.set_file("pkg/a.py", [Symbol("f", "function", True), Symbol("h", "function", False)])
+
+    assert (tree.node("pkg").total, tree.node("pkg").documented) == (3, 2)
+    assert list(tree.node("pkg/a.py").children) == ["f", "h"]
+
+
+def test_removing_files_prunes_empty_packages():
+    """Test that removing the last file of a package removes the package."""
+    tree = CoverageTree()
+    tree.set_file("pkg/sub/a.py", [Symbol("f", "function", False)])
+    tree.set_counts("pkg/b.py", 4, 3)
+
+    assert tree.remove_file("pkg/sub/a.py")
+    assert not tree.remove_file("pkg/sub/a.py")
+
+    assert (tree.total, tree.documented) == (4, 3)
+    with pytest.raises(KeyError):
+        tree.node("pkg/sub")
+
+
+def test_merging_partial_trees_equals_one_tree():
+    """Test that merged partial trees, also through JSON data, match a full build."""
+    files = {
+        "pkg/a.py": [Symbol("A", "class", True), Symbol("A.run", "function", False)],
+        "pkg/b.py": [Symbol("b", "function", True)],
+        "other/c.py": [],
+    }
+    full = CoverageTree()
+    first, second = CoverageTree(), CoverageTree()
+    for index, (path, symbols) in enumerate(files.items()):
+        full.set_file(path, symbols)
+        (first if index % 2 else second).set_file(path, symbols)
+    second.set_counts("pkg/d.py", 2, 1)
+    full.set_counts("pkg/d.py", 2, 1)
+
+    merged = CoverageTree().merge(CoverageTree.from_dict(first.to_dict())).merge(second)
+
+    assert merged.to_dict()["files"].keys() == full.to_dict()["files"].keys()
+    for path, node in full.rows():
+        assert (merged.node(path).total, merged.node(path).documented) == (
+            node.total, node.documented,
+        )
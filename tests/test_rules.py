@@ -0,0 +1,208 @@
+import pytest
+
+from docgen.reports import rules
+from docgen.reports.rules import (
+    ALL_RULES,
+    RELAXED_RULES,
+    STRICT_RULES,
+    check_source,
+)
+
+SAMPLES = {
+    "undocumented.py": '''"""Module docstring."""
+
+
+def add(a, b):
+    return a + b
+
+
+class Shape:
+    def area(self):
+        return 0
+
+    def _hidden(self):
+        return 1
+''',
+    "styles.py": '''"""module docstring without a period"""
+
+
+def returns(value):
+    """Returns the value"""
+    return value
+
+
+def quoted():
+    \'\'\'Uses single quotes.\'\'\'
+
+
+def spaced():
+    """ Leading space.
+
+    More text.
+    """
+
+
+def one_line():
+    """
+    Could fit on one line.
+    """
+
+
+class Base:
+
+    """Blank line before the class docstring."""
+    def method(self):
+        r"""Raw docstring."""
+''',
+    "sections.py": '''"""Module docstring."""
+
+
+def google(a, b):
+    """Do something.
+
+    Args:
+        a: The first argument.
+
+    returns:
+        Something.
+    """
+
+
+def numpy(a, b):
+    """Do something.
+
+    Parameters
+    ----------
+    a : int
+        The first argument.
+
+    Returns
+    -------
+    int
+    """
+''',
+    "noqa.py": '''"""Module docstring."""
+
+
+def skipped():  # noqa
+    pass
+
+
+def skip_one():  # noqa: D103
+    pass
+
+
+def other_code():  # noqa: E501
+    pass
+''',
+    "exports.py": '''"""Module docstring."""
+
+__all__ = ["exported"]
+
+
+def exported():
+    pass
+
+
+def not_exported():
+    pass
+''',
+}
+
+
+def codes(violations):
+    """Return the codes of a list of violations."""
+    return [violation.code for violation in violations]
+
+
+def test_missing_function_docstring_line_and_message():
+    """Test that D103 reports the def line and pydocstyle's wording."""
+    violations = check_source(SAMPLES["undocumented.py"], "undocumented.py")
+
+    assert str(violations[0]) == (
+        "undocumented.py:4 in public function `add`:\n"
+        "        D103: Missing docstring in public function"
+    )
+    assert codes(violations) == ["D103", "D101", "D102"]
+
+
+def test_relaxed_and_strict_rule_sets():
+    """Test that relaxed drops its ignored codes and strict keeps pep257's."""
+    strict = codes(check_source(SAMPLES["styles.py"], "styles.py", STRICT_RULES))
+    relaxed = codes(check_source(SAMPLES["styles.py"], "styles.py", RELAXED_RULES))
+
+    assert {"D400", "D401", "D300", "D210", "D200", "D211"} <= set(strict)
+    assert not set(relaxed) & set(rules.RELAXED_IGNORE)
+    assert "D212" not in strict and "D213" not in strict
+
+
+def test_imperative_mood_uses_inflections():
+    """Test that D401 names the imperative form of an inflected verb."""
+    violations = check_source(SAMPLES["styles.py"], "styles.py", {"D401"})
+
+    assert violations[0].message == (
+        "First line should be in imperative mood (perhaps 'Return', not 'Returns')"
+    )
+    assert rules.IMPERATIVE_FORMS["returning"] == ["return"]
+    assert rules.IMPERATIVE_FORMS["submitted"] == ["submit"]
+
+
+def test_sections_are_checked():
+    """Test that Google and numpy section rules are applied."""
+    found = codes(check_source(SAMPLES["sections.py"], "sections.py", ALL_RULES))
+
+    assert "D405" in found
+    assert "D417" in found
+
+
+def test_noqa_comments_skip_codes():
+    """Test that # noqa skips all codes and # noqa: Dxxx skips the listed ones."""
+    violations = check_source(SAMPLES["noqa.py"], "noqa.py")
+
+    assert [(v.definition, v.code) for v in violations] == [
+        ("in public function `other_code` (skipping E501)", "D103"),
+    ]
+
+
+def test_dunder_all_decides_public_names():
+    """Test that names missing from __all__ are private."""
+    violations = check_source(SAMPLES["exports.py"], "exports.py")
+
+    assert [v.definition for v in violations] == ["in public function `exported`"]
+
+
+def test_private_module_needs_no_docstring():
+    """Test that D100 applies to public modules only."""
+    source = "def add(a, b):\n    return a + b\n"
+
+    assert codes(check_source(source, "shapes.py", STRICT_RULES)) == ["D100", "D103"]
+    assert codes(check_source(source, "_shapes.py", STRICT_RULES)) == ["D103"]
+
+
+def test_syntax_error_raises():
+    """Test that a source string that does not parse raises SyntaxError."""
+    with pytest.raises(SyntaxError):
+        check_source("def broken(:\n", "broken.py")
+
+
+def test_matches_pydocstyle():
+    """Test that every sample gets exactly pydocstyle's violations."""
+    pytest.importorskip("pydocstyle")
+    from pydocstyle.violations import ErrorRegistry
+
+    assert ALL_RULES == frozenset(ErrorRegistry.get_error_codes())
+    for name, source in SAMPLES.items():
+        native = [str(violation) for violation in check_source(source, name, ALL_RULES)]
+        expected = _pydocstyle_violations(source, name)
+        assert native == expected, name
+
+
+def _pydocstyle_violations(source, name):
+    """Return pydocstyle's violations of source as strings."""
+    from pydocstyle.checker import ConventionChecker
+
+    return [
+        str(error)
+        for error in ConventionChecker().check_source(source, name)
+        if error.code in ALL_RULES
+    ]
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import os
+import signal
+
+from docgen import serve
+from docgen.serve import AnalysisServer, run_batch, run_task
+
+SOURCE = 'def documented():\n    """Doc."""\n\n\ndef bare(a):\n    return a\n'
+
+
+def test_run_task_coverage_and_inject():
+    """Test the coverage and injection answers for one source."""
+    status, coverage = run_task("/coverage", {"source": SOURCE})
+    assert status == 200
+    assert coverage == {"total": 2, "documented": 1, "coverage": 50.0, "missing": ["bare"]}
+
+    status, injected = run_task("/inject", {"source": SOURCE})
+    assert status == 200
+    assert [edit["position"] for edit in injected["edits"]] == [5]
+    assert injected["source"].count('"""') == 4
+
+
+def test_run_task_errors():
+    """Test that bad input maps to client error statuses."""
+    assert run_task("/coverage", {"source": "def broken(:\n"})[0] == 422
+    assert run_task("/inject", {})[0] == 400
+    assert run_task("/generate", {"functions": [], "style": "nope"})[0] == 400
+    assert run_task("/generate", {"functions": [], "style": None})[0] == 400
+    assert run_task("/generate", {"functions": [1]})[0] == 400
+    assert run_task("/inject", {"source": SOURCE, "style": 5})[0] == 400
+    assert run_task("/validate", {"source": SOURCE, "filename": None})[0] == 400
+
+
+def test_one_failing_task_does_not_fail_its_batch(monkeypatch):
+    """Test that an unexpected error answers 500 for its own task only."""
+    def explode(*args, **kwargs):
+        """Fail like an internal bug would."""
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(serve, "inject_docstrings", explode)
+
+    results = run_batch([
+        ("/coverage", {"source": SOURCE}),
+        ("/inject", {"source": SOURCE}),
+        ("/inject", {"source": SOURCE, "style": 5}),
+    ])
+
+    assert [status for status, _ in results] == [200, 500, 400]
+    assert results[1][1] == {"error": "boom"}
+
+
+async def _request(reader, writer, method, path, payload=None):
+    """Send one keep-alive request and return (status, body)."""
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    length = next(int(line.split(":")[1]) for line in lines if line.startswith("Content-Length"))
+    return int(lines[0].split()[1]), json.loads(await reader.readexactly(length))
+
+
+def test_server_batches_requests_and_reports_stats():
+    """Test concurrent requests over HTTP, then the /stats counters."""
+
+    async def scenario():
+        """Run requests against a one-worker server."""
+        server = AnalysisServer(port=0, workers=1, batch_window=0.01)
+        await server.start()
+        try:
+            connections = [
+                await asyncio.open_connection(server.host, server.port) for _ in range(4)
+            ]
+            answers = await asyncio.gather(*[
+                _request(reader, writer, "POST", "/coverage", {"source": SOURCE})
+                for reader, writer in connections
+            ])
+            reader, writer = connections[0]
+            missing = await _request(reader, writer, "GET", "/nowhere")
+            stats = await _request(reader, writer, "GET", "/stats")
+            for _, writer in connections:
+                writer.close()
+            return answers, missing, stats
+        finally:
+            await server.close()
+
+    answers, missing, (status, stats) = asyncio.run(scenario())
+
+    assert [answer[1]["missing"] for answer in answers] == [["bare"]] * 4
+    assert missing[0] == 404
+    assert status == 200
+    assert stats["by_endpoint"]["/coverage"] == 4
+    assert stats["batches"] < 4
+    assert set(stats["latency_ms"]) == {"p50", "p95", "p99", "max"}
+
+
+def test_inline_endpoint_failure_still_answers(monkeypatch):
+    """Test that an error escaping an inline endpoint gets a 500 response."""
+    def explode(endpoint, payload):
+        """Fail outside run_task's own error handling."""
+        raise RuntimeError("boom")
+
+    async def scenario():
+        """Send one /generate request to a one-worker server."""
+        server = AnalysisServer(port=0, workers=1)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            monkeypatch.setattr(serve, "run_task", explode)
+            answer = await _request(reader, writer, "POST", "/generate", {"functions": []})
+            writer.close()
+            return answer
+        finally:
+            await server.close()
+
+    assert asyncio.run(scenario()) == (500, {"error": "boom"})
+
+
+def test_dead_worker_fails_its_batch_and_pool_is_replaced():
+    """Test that a killed worker answers 500 once, then requests succeed."""
+
+    async def scenario():
+        """Kill the only worker, then send two more requests."""
+        server = AnalysisServer(port=0, workers=1)
+        await server.start()
+        try:
+            (worker,) = server._executor._processes.values()
+            os.kill(worker.pid, signal.SIGKILL)
+            while worker.is_alive():
+                await asyncio.sleep(0.01)
+
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            failed = await _request(reader, writer, "POST", "/coverage", {"source": SOURCE})
+            answer = await _request(reader, writer, "POST", "/coverage", {"source": SOURCE})
+            stats = await _request(reader, writer, "GET", "/stats")
+            writer.close()
+            return failed, answer, stats
+        finally:
+            await server.close()
+
+    failed, answer, (_, stats) = asyncio.run(scenario())
+
+    assert failed[0] == 500
+    assert answer == (200, run_task("/coverage", {"source": SOURCE})[1])
+    assert stats["pool_restarts"] == 1
@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+from docgen import check_docs
+from docgen.cli import main as cli_main
+from docgen.sharding import MergeError, assign_shards, merge_reports, parse_shard
+
+
+def _write_tree(root, count=9):
+    """Create a nested source tree of varied file sizes and documentation."""
+    for i in range(count):
+        package = root / f"pkg_{i % 3}"
+        package.mkdir(parents=True, exist_ok=True)
+        body = "".join(
+            f"def func_{i}_{j}():\n" + ('    """Doc."""\n' if (i + j) % 2 else "") + "    pass\n"
+            for j in range(i + 1)
+        )
+        (package / f"module_{i}.py").write_text(body, encoding="utf-8")
+
+
+def _run_shards(tmp_path, count, capsys):
+    """Run every shard of the tree and return the partial report paths."""
+    reports = []
+    for index in range(1, count + 1):
+        path = tmp_path / f"shard-{index}.json"
+        check_docs.main(["--shard", f"{index}/{count}", "--shard-report", str(path)])
+        reports.append(str(path))
+    assert capsys.readouterr().out == ""
+    return reports
+
+
+def test_parse_shard():
+    """Test that shard arguments are 1-based i/N pairs."""
+    import argparse
+
+    assert parse_shard("2/4") == (2, 4)
+    for text in ("0/4", "5/4", "1", "a/b"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(text)
+
+
+def test_shards_are_disjoint_stable_and_balanced(tmp_path):
+    """Test that every file lands in one shard and sizes are spread evenly."""
+    sizes = [900, 100, 500, 400, 300, 300, 200, 100]
+    files = []
+    for i, size in enumerate(sizes):
+        path = tmp_path / f"f{i}.py"
+        path.write_text("#" * size, encoding="utf-8")
+        files.append(path)
+
+    shards = assign_shards(files, 3)
+
+    assert sorted(i for shard in shards for i in shard) == list(range(len(files)))
+    assert assign_shards(list(reversed(files)), 3) == [
+        sorted(len(files) - 1 - i for i in shard) for shard in shards
+    ]
+    loads = [sum(sizes[i] for i in shard) for shard in shards]
+    assert max(loads) - min(loads) <= max(sizes) - min(sizes)
+    assert sorted(loads) == [900, 900, 1000]
+
+
+def test_merge_matches_whole_tree_run(tmp_path, monkeypatch, capsys):
+    """Test that merged shards print the full run's report and exit code."""
+    _write_tree(tmp_path / "src")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(check_docs, "SRC_DIR", "src")
+
+    with pytest.raises(SystemExit) as full_exit:
+        check_docs.main([])
+    full_out = capsys.readouterr().out
+
+    reports = _run_shards(tmp_path, 4, capsys)
+    with pytest.raises(SystemExit) as merged_exit:
+        cli_main(["merge", *reversed(reports)])
+
+    assert merged_exit.value.code == full_exit.value.code == 1
+    assert capsys.readouterr().out == full_out
+
+
+def test_merge_reports_first_syntax_error(tmp_path, monkeypatch, capsys):
+    """Test that the merge reports the earliest unparsable file, as a full run does."""
+    _write_tree(tmp_path / "src", count=4)
+    (tmp_path / "src" / "pkg_0" / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(check_docs, "SRC_DIR", "src")
+
+    with pytest.raises(SystemExit):
+        check_docs.main([])
+    full_out = capsys.readouterr().out
+
+    reports = _run_shards(tmp_path, 2, capsys)
+    with pytest.raises(SystemExit) as merged_exit:
+        cli_main(["merge", *reports])
+
+    assert merged_exit.value.code == 1
+    assert capsys.readouterr().out == full_out
+
+
+def test_merge_rejects_incomplete_or_mixed_reports(tmp_path, monkeypatch, capsys):
+    """Test that missing, duplicate and mismatched shards are refused."""
+    _write_tree(tmp_path / "src", count=3)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(check_docs, "SRC_DIR", "src")
+    first, second = (
+        json.loads(open(path, encoding="utf-8").read())
+        for path in _run_shards(tmp_path, 2, capsys)
+    )
+
+    with pytest.raises(MergeError, match="missing shard"):
+        merge_reports([first])
+    with pytest.raises(MergeError, match="more than once"):
+        merge_reports([first, first, second])
+    with pytest.raises(MergeError, match="different splits"):
+        merge_reports([first, dict(second, files=99)])
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli_main(["merge", str(tmp_path / "shard-1.json")])
+    assert exc_info.value.code == 2
@@ -0,0 +1,27 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "benchmarks"))
+
+from bench_startup import CORE_IMPORTS, HEAVY_MODULES, SRC
+
+
+def test_core_imports_nothing_heavy():
+    """Test that the CLI and core modules defer the benchmark's heavy modules."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    code = (
+        "import sys\n"
+        f"{CORE_IMPORTS}\n"
+        "import docgen.reports.validation\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
@@ -0,0 +1,67 @@
+import pytest
+
+from docgen.reports.validation import validate_docstrings, validate_many
+
+DOCUMENTED = '''"""Module docstring."""
+
+
+def add(a, b):
+    """Return the sum of a and b."""
+    return a + b
+'''
+
+UNDOCUMENTED = '''"""Module docstring."""
+
+
+def add(a, b):
+    return a + b
+'''
+
+
+def test_validate_docstrings_in_memory():
+    """Test that single-source validation keeps the report shape."""
+    result = validate_docstrings(UNDOCUMENTED, filename="example.py")
+
+    assert result["status"] == "Fail"
+    assert result["count"] == 1
+    assert "D103" in result["violations"][0]
+    assert result["violations"][0].startswith("example.py:4")
+
+
+def test_validate_many_sources_in_pool():
+    """Test that batch validation matches per-file validation."""
+    sources = {"good.py": DOCUMENTED, "bad.py": UNDOCUMENTED}
+
+    results = validate_many(sources, workers=2)
+
+    assert list(results) == ["good.py", "bad.py"]
+    for name, source in sources.items():
+        assert results[name] == validate_docstrings(source, filename=name)
+
+
+def test_validate_many_paths(tmp_path):
+    """Test that batch validation reads paths from disk."""
+    path = tmp_path / "bad.py"
+    path.write_text(UNDOCUMENTED, encoding="utf-8")
+
+    results = validate_many([path], mode="strict", workers=1)
+
+    assert results[str(path)]["status"] == "Fail"
+
+
+def test_native_backend_matches_pydocstyle():
+    """Test that both backends report the same violations in both modes."""
+    pytest.importorskip("pydocstyle")
+
+    for mode in ("strict", "relaxed"):
+        native = validate_docstrings(UNDOCUMENTED, mode=mode, filename="example.py")
+        reference = validate_docstrings(
+            UNDOCUMENTED, mode=mode, filename="example.py", backend="pydocstyle"
+        )
+        assert native == reference
+
+
+def test_unknown_backend_rejected():
+    """Test that an unknown backend name raises ValueError."""
+    with pytest.raises(ValueError):
+        validate_docstrings(DOCUMENTED, backend="pylint")
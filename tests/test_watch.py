@@ -0,0 +1,96 @@
+import queue
+import time
+
+import pytest
+
+from docgen.watch import (
+    CoverageIndex,
+    PollingWatcher,
+    _native_watcher,
+    analyze_symbols,
+    apply_changes,
+    build_index,
+)
+
+
+def test_index_tracks_deltas(tmp_path):
+    """Test that re-checking one file updates the running totals."""
+    module = tmp_path / "module.py"
+    module.write_text("def first():\n    pass\n\ndef second():\n    pass\n", encoding="utf-8")
+    index = build_index(tmp_path)
+
+    assert (index.total, index.documented) == (2, 0)
+
+    module.write_text('def first():\n    """Doc."""\n\ndef second():\n    pass\n', encoding="utf-8")
+    updates = list(apply_changes(index, {str(module)}))
+
+    path, previous, current, before, after = updates[0]
+    assert path == str(module)
+    assert previous[1] == 0 and current[1] == 1
+    assert (before, after) == (0.0, 50.0)
+    assert (index.total, index.documented) == (2, 1)
+
+
+def test_removed_and_broken_files_leave_totals():
+    """Test that removing a file subtracts its counts."""
+    index = CoverageIndex()
+    index.update("a.py", (3, 2, ["a.py -> x"]))
+    index.update("b.py", (1, 1, []))
+
+    index.remove("a.py")
+
+    assert (index.total, index.documented) == (1, 1)
+    assert index.coverage == 100.0
+
+
+def test_polling_watcher_reports_changed_files(tmp_path):
+    """Test that polling queues added and modified files only."""
+    stable = tmp_path / "stable.py"
+    stable.write_text("x = 1\n", encoding="utf-8")
+    changes = queue.Queue()
+    watcher = PollingWatcher(tmp_path, changes)
+
+    added = tmp_path / "added.py"
+    added.write_text("y = 2\n", encoding="utf-8")
+    watcher.poll()
+
+    assert changes.get_nowait() == str(added)
+    assert changes.empty()
+
+
+def test_index_rolls_up_by_package(tmp_path):
+    """Test that the index tree tracks per-package totals across updates."""
+    package = tmp_path / "pkg"
+    package.mkdir()
+    module = package / "module.py"
+    module.write_text("class Shape:\n    def area(self):\n        pass\n", encoding="utf-8")
+    index = build_index(tmp_path)
+
+    node = index.tree.node(str(package))
+    assert (node.total, node.documented) == (2, 0)
+
+    module.write_text('class Shape:\n    """Doc."""\n', encoding="utf-8")
+    list(apply_changes(index, {str(module)}))
+
+    assert (node.total, node.documented) == (1, 1)
+    assert index.tree.node(str(module), "Shape").coverage == 100.0
+
+
+def test_native_watcher_ignores_reads(tmp_path):
+    """Test that reading a watched file queues nothing, while writing it does."""
+    pytest.importorskip("watchdog")
+    module = tmp_path / "module.py"
+    module.write_text("def first():\n    pass\n", encoding="utf-8")
+    changes = queue.Queue()
+    observer = _native_watcher(tmp_path, changes)
+    try:
+        for _ in range(3):
+            analyze_symbols(str(module))
+        time.sleep(0.3)
+        assert changes.empty()
+
+        module.write_text("def second():\n    pass\n", encoding="utf-8")
+        assert changes.get(timeout=2) == str(module)
+    finally:
+        observer.stop()
+        observer.join()
@@ -1,19 +1,19 @@
 import sys
 import os
 import streamlit as st
-import difflib
-import time
-from io import BytesIO
+import hashlib
 import plotly.graph_objects as go
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import inch
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from analyzer.parser import parse_code
-from reports.coverage import generate_coverage_report
-from injector.docstring_injector import inject_docstrings
+from docgen.analyzer.parser import analyze, parse_code
+from docgen.reports.coverage import (
+    generate_coverage_report,
+    generate_injected_coverage_report,
+    quality_grade,
+)
+from docgen.reports.pdf import ReportBuilder
+from docgen.injector.docstring_injector import inject_docstrings
 
 
 # ---------------- PAGE CONFIG ----------------
@@ -75,47 +75,74 @@ st.markdown("</div>", unsafe_allow_html=True)
 
 
 # ---------------- PDF GENERATOR ----------------
-def generate_pdf(results):
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer)
-    elements = []
-    styles = getSampleStyleSheet()
-
-    elements.append(Paragraph("Documentation Coverage Report", styles["Title"]))
-    elements.append(Spacer(1, 0.3 * inch))
-
-    for name, coverage, grade in results:
-        line = f"File: {name} | Coverage: {coverage}% | Grade: {grade}"
-        elements.append(Paragraph(line, styles["Normal"]))
-        elements.append(Spacer(1, 0.2 * inch))
-
-    doc.build(elements)
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    return pdf_bytes
+@st.cache_resource
+def report_builder():
+    # One background builder per server; it caches reports by result hash.
+    return ReportBuilder()
+
+
+# ---------------- CACHED ANALYSIS ----------------
+@st.cache_data(show_spinner=False, max_entries=512)
+def analyze_upload(digest, _source_code):
+    # Keyed by the content digest only (the leading underscore keeps
+    # Streamlit from hashing the source again), so reruns caused by
+    # widget changes reuse the result instead of re-parsing.
+    analysis = analyze(_source_code)
+    functions, classes = parse_code(analysis)
+    report = generate_coverage_report(functions, classes)
+
+    result = {
+        "functions": [f.to_dict() for f in functions],
+        "classes": [c.to_dict() for c in classes],
+        "report": report,
+        "updated_code": _source_code,
+        "new_report": report,
+        "added_lines": [],
+    }
+
+    if report["coverage"] < 100:
+        updated_code, plan = inject_docstrings(analysis, "Google", return_plan=True)
+        result["updated_code"] = updated_code
+        result["new_report"] = generate_injected_coverage_report(
+            functions, classes, analysis.injected_lines
+        )
+        result["added_lines"] = [line for edit in plan for line in edit.lines]
+
+    return result
 
 
 # ---------------- MAIN PROCESS ----------------
 if uploaded_files:
 
     overall_results = []
+    analyses = []
+
+    progress_bar = st.progress(0.0, text="Analyzing files...")
+    for index, file in enumerate(uploaded_files, start=1):
+        data = file.getvalue()
+        source_code = data.decode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        analyses.append((file, source_code, analyze_upload(digest, source_code)))
+        progress_bar.progress(
+            index / len(uploaded_files),
+            text=f"Analyzed {index}/{len(uploaded_files)} files"
+        )
+    progress_bar.empty()
+
+    # Start the PDF while the page renders; reruns reuse the cached report.
+    pdf_report = report_builder().submit(
+        (file.name, result["report"]["coverage"], quality_grade(result["report"]["coverage"]))
+        for file, _, result in analyses
+    )
 
-    for file in uploaded_files:
+    for file, source_code, result in analyses:
 
-        source_code = file.read().decode("utf-8")
-        functions, classes = parse_code(source_code)
-        report = generate_coverage_report(functions, classes)
-        coverage = report["coverage"]
+        functions = result["functions"]
+        classes = result["classes"]
+        coverage = result["report"]["coverage"]
 
         # -------- QUALITY SCORE --------
-        if coverage >= 95:
-            grade = "A+"
-        elif coverage >= 85:
-            grade = "A"
-        elif coverage >= 70:
-            grade = "B"
-        else:
-            grade = "C"
+        grade = quality_grade(coverage)
 
         overall_results.append((file.name, coverage, grade))
 
@@ -123,10 +150,7 @@ if uploaded_files:
         st.markdown("<div class='section'>", unsafe_allow_html=True)
         st.subheader(f"📂 {file.name}")
 
-        progress_bar = st.progress(0)
-        for i in range(int(coverage)):
-            time.sleep(0.003)
-            progress_bar.progress(i + 1)
+        st.progress(int(coverage))
 
         col1, col2 = st.columns(2)
         col1.metric("Coverage", f"{coverage}%")
@@ -145,10 +169,8 @@ if uploaded_files:
         # -------- AUTO INJECTION --------
         if coverage < 100 and auto_inject:
 
-            updated_code = inject_docstrings(source_code, "Google")
-            new_functions, new_classes = parse_code(updated_code)
-            new_report = generate_coverage_report(new_functions, new_classes)
-            new_coverage = new_report["coverage"]
+            updated_code = result["updated_code"]
+            new_coverage = result["new_report"]["coverage"]
 
             st.markdown("<div class='section'>", unsafe_allow_html=True)
             st.subheader("⚡ Smart Upgrade")
@@ -160,14 +182,7 @@ if uploaded_files:
             # -------- ENHANCED DIFF --------
             with st.expander("🔍 Code Differences (Enhanced View)"):
 
-                original_lines = source_code.splitlines()
-                updated_lines = updated_code.splitlines()
-                diff = list(difflib.ndiff(original_lines, updated_lines))
-
-                added_lines = []
-                for line in diff:
-                    if line.startswith("+ "):
-                        added_lines.append(line[2:])
+                added_lines = result["added_lines"]
 
                 st.markdown("### ✨ Injected Docstrings")
 
@@ -205,14 +220,7 @@ if uploaded_files:
     total_files = len(overall_results)
     avg_coverage = sum(r[1] for r in overall_results) / total_files
 
-    if avg_coverage >= 95:
-        overall_grade = "A+"
-    elif avg_coverage >= 85:
-        overall_grade = "A"
-    elif avg_coverage >= 70:
-        overall_grade = "B"
-    else:
-        overall_grade = "C"
+    overall_grade = quality_grade(avg_coverage)
 
     col1, col2, col3 = st.columns(3)
     col1.metric("Total Files", total_files)
@@ -237,7 +245,8 @@ if uploaded_files:
     st.markdown("<div class='section'>", unsafe_allow_html=True)
     st.subheader("📄 Export Coverage Report")
 
-    pdf_bytes = generate_pdf(overall_results)
+    with st.spinner("Building PDF report..."):
+        pdf_bytes = pdf_report.result()
 
     st.download_button(
         label="⬇ Download PDF Report",
@@ -2,12 +2,13 @@ import sys
 import os
 import ast
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
 import streamlit as st
-from analyzer.parser import parse_code
-from generator.styled_generator import generate_docstring
-from config.config_loader import load_config
+from docgen.analyzer.parser import analyze
+from docgen.generator.styled_generator import generate_docstrings
+from docgen.injector.docstring_injector import plan_docstrings, splice_lines
+from docgen.config.config_loader import load_config
 
 
 config = load_config()
@@ -35,43 +36,50 @@ uploaded_file = st.file_uploader(
 
 if uploaded_file:
     source_code = uploaded_file.read().decode("utf-8")
-    tree = ast.parse(source_code)
-    lines = source_code.splitlines()
+    analysis = analyze(source_code)
+    lines = analysis.lines
 
     st.subheader("Source Code")
     st.code(source_code, language="python")
 
     st.subheader("Docstring Suggestions")
 
-    found = False
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            if ast.get_docstring(node) is None:
-                found = True
-
-                start = node.lineno - 1
-                end = node.end_lineno
-
-                original = "\n".join(lines[start:end])
-
-                if isinstance(node, ast.ClassDef):
-                    params = []
-                else:
-                    params = [arg.arg for arg in node.args.args]
-
-                doc = generate_docstring(
-                    {
-                        "name": node.name,
-                        "params": params
-                    },
-                    docstring_style
-                )
-
-                st.markdown(f"### {node.__class__.__name__}: `{node.name}`")
-                st.code(original, language="python")
-                st.markdown("Generated Docstring")
-                st.code(doc, language="python")
-
-    if not found:
-        st.success("All functions and classes already have docstrings.")
\ No newline at end of file
+    nodes = analysis.undocumented
+    plan = plan_docstrings(analysis, docstring_style)
+    inserted = {edit.position: edit.lines for edit in plan}
+    suggestions = generate_docstrings(
+        [
+            {
+                "name": node.name,
+                "params": [] if isinstance(node, ast.ClassDef)
+                else [arg.arg for arg in node.args.args]
+            }
+            for node in nodes
+        ],
+        docstring_style
+    )
+
+    for node, doc in zip(nodes, suggestions):
+        start = node.lineno - 1
+        end = node.end_lineno
+
+        original = "\n".join(lines[start:end])
+
+        st.markdown(f"### {node.__class__.__name__}: `{node.name}`")
+        st.code(original, language="python")
+        st.markdown("Generated Docstring")
+        st.code(doc, language="python")
+        st.markdown("After Injection")
+        st.code(
+            "\n".join([lines[start], *inserted[node.lineno]]),
+            language="python"
+        )
+
+    if not nodes:
+        st.success("All functions and classes already have docstrings.")
+    else:
+        st.download_button(
+            "Download File With Docstrings",
+            "\n".join(splice_lines(lines, plan)),
+            file_name=f"{uploaded_file.name}_documented.py"
+        )